@@ -0,0 +1,70 @@
+#! /usr/bin/env python3
+
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Liquid Rocket Project telemetry logging without the GUI.
+
+Runs the same TelemetryEngine as main.py, printing the sys log instead of
+showing the window, and does not need PyQt6 or pyqtgraph.
+"""
+
+import argparse
+import sys
+
+from utils import *
+
+
+# FUNCTIONS ----------------------------------------------------------------------|
+def runHeadless(opts: argparse.Namespace) -> int:
+    """Logs a serial port or replay, printing the sys log.
+
+    Runs until the port fails, the replay ends or Ctrl+C.
+
+    Args:
+        opts(argparse.Namespace): the parsed command line
+
+    Returns:
+        int: exit status
+    """
+    engine = createEngine(opts.replay, opts.speed)
+    engine.subscribe(LOG, print)
+    engine.begin()
+    if opts.profile:
+        engine.profile(PROFILE_INTERVAL_SECONDS)
+
+    status = 0
+    try:
+        if opts.replay:
+            connection = ReplayComm(opts.replay, opts.speed)
+        else:
+            connection = setupConnection(opts.port, opts.baud)
+        engine.open(connection)
+        engine.run(
+            until=lambda: not engine.connected or getattr(connection, "finished", False),
+            tick=ENGINE_TICK_SECONDS,
+        )
+    except (serial.SerialException, OSError) as error:
+        engine.log(f"Serial connection could not be established: {error}")
+        status = 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.shutdown()
+    return status
+
+
+# MAIN ---------------------------------------------------------------------------|
+if __name__ == "__main__":
+    args = argparse.ArgumentParser(description="Liquid Rocket Project telemetry logging without the GUI.")
+    source = args.add_mutually_exclusive_group(required=True)
+    source.add_argument("--port", help="serial port to log, e.g. /dev/ttyACM0 or COM3")
+    source.add_argument("--replay", metavar="FILE", help="replay a log/data file instead of serial")
+    args.add_argument("--baud", type=int, default=BAUDRATES[-1], help="serial baudrate")
+    args.add_argument(
+        "--speed", type=float, default=1.0, help="replay speed factor, 0 for as fast as possible"
+    )
+    args.add_argument(
+        "--profile", action="store_true", default=PROFILE, help="log hot path timings to log/sys"
+    )
+    sys.exit(runHeadless(args.parse_args()))
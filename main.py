@@ -6,12 +6,13 @@ Date: February 2023
 Description: Liquid Rocket Project Launch Control GUI prototype.
 """
 
+import argparse
 import re
 import sys
 
 import numpy as np
-from pyqtgraph import PlotWidget, mkPen, setConfigOption
-from PyQt6.QtCore import QDateTime, Qt, QThread, QTimer, pyqtSlot
+from pyqtgraph import setConfigOption
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon
 from PyQt6.QtSvgWidgets import QSvgWidget
 from PyQt6.QtWidgets import (
@@ -24,11 +25,16 @@ from PyQt6.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPushButton,
-    QTextEdit,
     QWidget,
 )
 
 from utils import *
+from utils.styling import *
+from utils.clock import Clock
+from utils.render import *
+from utils.labels import LabelCache
+from utils.plots import *
+from utils.monitor import SerialMonitor
 
 # CONSTANTS -----------------------------------------------------------------|
 
@@ -39,20 +45,13 @@ if LIGHT:
 else:
     WIRE_DIAGRAM = "./src/wireDiagWhite.svg"
 
-LAUNCH_STATES = ("IDLE", "SYSTEM CHECKS", "HIGH PRESSURE", "TANK HIGH PRESSURE", "FIRE")
-LEAK_ACCEPT_RATE = "1 PSI / Min"
-
 # Dynamic Labels Map
 DIAGRAM_LABEL = "D_Label"
 STATUS_LABEL = "Status"
 CURR_STATE = "StateDisplay"
 ABORT = "Abort"
-SV = "SV"
-PT = "PT"
 DT = "Decay Test"
 DT_STOP = "Stop Test"
-DT_ITERS = 5
-DT_ITER_LEN_SECONDS = 60
 
 # Button Map
 PROCEED = "\nADVANCE STAGE\n"
@@ -69,16 +68,6 @@ LOCK = "Unlock"
 IGNITE = "IGNITE"
 MAINVALVES = "MVs"
 
-# Pins
-# PIN MAP ##########################
-PIN_MAP = [1, 2, 3, 4, 5, 6, 8, 7 , 9]#range(1, 10)#[9, 5, 7, 6, 2, 1, 8, 3, 4]
-PIN_READ_MAP = {str(x): str(i + 1) for i, x in enumerate(PIN_MAP)}
-
-# ANALOG (PT) MAP ##################
-# ANALOG_MAP[1] == num of second analog reading == 3 in [1, 3, 2, 4]
-ANALOG_MAP = [1, 3, 2, 4, 5, 6, 7, 8, 9]
-ACTIVE_PTS = ["PT1", "PT2", "PT3"]
-
 # SV names
 SV_NAMES = {"SV1": "CVENT",
             "SV2": "N/A", #"CFILL",
@@ -90,68 +79,75 @@ SV_NAMES = {"SV1": "CVENT",
             "SV8": "NITRO MAIN",
             "SV9": "FUEL MAIN"}
 
-# COMMAND CHARS ####################
-ABORT_CMD = "a"
-MAINVALVE_CMD = "m"
-IGNITE_CMD = "i"
-
 ###################################
-COMMAND_LEN = 8
-MSG_PAD = lambda x: x + "0" * (8 - len(x))
 DISP_FORMAT = lambda name, val: f"{name}:{val}"
-PRESSURE_TAG = ""  # no tag rn
-PRESSURE_SEP = ", "
-VALVE_TAG = "PS"
-#VALVE_SEP = " "
+VALVE_OPEN_CSS = FONT_CSS + f"color: {VALVE_ON}; "
+VALVE_CLOSED_CSS = FONT_CSS + f"color: {TEXT}; "
 
 
-# Safety Thresholds
-# PTs
-SAFE_PRESS = range(-1000, 400)
-MID_PRESS = range(401, 501)
+# Safety Thresholds (PRESS_LIMITS in utils/config.py)
+PRESS_STYLES = (PRESS_RED, PRESS_GREEN, PRESS_YELLOW, PRESS_RED)  # by band
 # Avg PSI
 #SAFE_AVG_PRESS = range()
 #MID_AVG_PRESS = range()
 
-# Files
-DATE = QDateTime.currentDateTime().toString("MM-dd-yy")
-START_TIME = QDateTime.currentDateTime().toString("MM-dd-yy-hh-mm")
-DATA_LOG_FILE = f"./log/data/{DATE}.txt"
-SYS_LOG_FILE = f"./log/sys/{DATE}.txt"
-
 # Graphs
-WIDGET = "widget"
-GRAPH = "graph"
-TIME = "time"
-DATA = "data"
-TIMESTAMP = "tstamp"
-
 FUEL_GRAPH = "Fuel: PSI vs Seconds"
 OX_GRAPH = "Ox: PSI vs Seconds"
+SUPPLY_GRAPH = "PT1/PT4: PSI vs Seconds"
+PLOT_CONFIG = {  # plot title: PTs drawn on it (several overlay)
+    FUEL_GRAPH: [PT + "2"],
+    OX_GRAPH: [PT + "3"],
+    SUPPLY_GRAPH: [PT + "1", PT + "4"],
+}
+PLOT_PENS = (DETAILING, "#E69F00", "#CC79A7", "#F0E442")  # overlay colors in order
+PLOT_Y_RANGE = (-50, 550)
 PSI_CHANGE = "PSI/MIN"
 PSI_PER_MIN = lambda num: f"{PSI_CHANGE}: %.1f" % num
-ROLLING_AVG_SAMPLE_SIZE = 12
+PSI_OK_CSS = f"{GREEN}{BOLD}"
+PSI_LEAK_CSS = f"{RED}{BOLD}"
+
+PLOT_WINDOW_SECONDS = 60  # x range while following live data
+PLOT_MAX_POINTS = 2000  # points drawn per plot per repaint at any zoom
 
-PSI_SAMPLE_SIZE = 600
-DISPLAYED_SAMPLE_SIZE = 100
+# Serial monitor
+MONITOR_LINES = 1000  # lines shown
+MONITOR_HISTORY = 20000  # lines kept for search/resume
 
 
 # MAIN WINDOW ---------------------------------------------------------------|
 
 
+class EngineWake(QObject):
+    """Carries the engine's wake-ups from the serial thread to the GUI thread."""
+
+    ready = pyqtSignal()
+
+
 class RocketDisplayWindow(QMainWindow):
     """Main Rocket Control Window."""
 
-    graphData = pyqtSignal(str, int)
+    def __init__(
+        self, replay: str | None = None, replaySpeed: float = 1.0, profile: bool = PROFILE
+    ) -> None:
+        """Constructs new Rocket Display Window.
 
-    def __init__(self) -> None:
-        """Constructs new Rocket Display Window."""
+        Args:
+            replay(str | None): data log to replay instead of a serial port
+            replaySpeed(float): replay speed factor, 0 for as fast as possible
+            profile(bool): record hot path timings and write them to the sys log
+        """
         super().__init__()
 
-        # launch state
-        self.mode = LAUNCH_STATES
-        self.currentState = 0
-        self.aborted = False
+        # telemetry engine: serial, parsing, logs, decay test and launch state
+        self.engine = createEngine(replay, replaySpeed)
+        self.engineWake = EngineWake()
+        self.engineWake.ready.connect(self.engine.poll)
+        self.engine.wake = self.engineWake.ready.emit
+        self.engineTimer = QTimer()
+        self.engineTimer.timeout.connect(self.engine.poll)
+        self.engineTimer.start(int(ENGINE_TICK_SECONDS * 1000))
+        self.shownState = self.engine.state
 
         # window
         self.setWindowTitle("Mission Control")
@@ -162,11 +158,27 @@ class RocketDisplayWindow(QMainWindow):
 
         self.buttons = {}
         self.dynamicLabels = {}
+        self.labelCache = LabelCache(self.dynamicLabels)
+        self.pressBands = BandClassifier(
+            self.engine.parser.names[PRESSURE_FRAME],
+            PRESS_LIMITS,
+            PRESS_LIMITS_DEFAULT,
+            PRESS_STYLES,
+        )
 
         # plots
-        self.plots = {}
-        self.pen = mkPen(color=DETAILING, width=3)
-        self.graphData.connect(self.updatePlot)
+        self.plotRenderer = RenderScheduler(self.renderPlots, PLOT_RENDER_RATE)
+        self.plotManager = PlotManager(
+            PLOT_CONFIG,
+            self.engine.parser.names[PRESSURE_FRAME],
+            PLOT_PENS,
+            PRIMARY_H,
+            PLOT_Y_RANGE,
+            PLOT_WINDOW_SECONDS,
+            PLOT_MAX_POINTS,
+            self.plotRenderer.request,
+        )
+        self.psiLabels = {}
         setConfigOption("foreground", f"{DETAILING_H}")  # pyqtgraph setting
 
         # layout
@@ -175,39 +187,30 @@ class RocketDisplayWindow(QMainWindow):
         centralWidget.setLayout(self.generalLayout)
         self.setCentralWidget(centralWidget)
 
-        self.serialSet = False
-        self.serialOn = False
+        self.replay = replay
+        self.replaySpeed = replaySpeed
+        self.serialSet = bool(replay)
 
         self.linkButtons()
 
         self.locked = False
         self.toggleScreenLock()
 
-        self.decayTestActive = False
+        # the window is one subscriber of the engine
+        self.engine.subscribe(LOG, self.monitor.append)
+        self.engine.subscribe(FRAMES, self.updateDisplay)
+        self.engine.subscribe(STATE, self.showState)
+        self.engine.subscribe(DECAY, self.showDecayTest)
+        self.engine.subscribe(SERIAL, self.showSerial)
+        self.engine.subscribe(ERROR, self.serialError)
+        self.engine.begin()
 
-        # log start
-        start = "NEW SESSION: " + START_TIME
-        self.displayPrint(start, reformat=False)
-        with open(DATA_LOG_FILE, "a") as datalog:
-            datalog.write(start + "\n")
+        # diagnostics
+        if profile:
+            self.engine.profile(PROFILE_INTERVAL_SECONDS)
 
     # SERIAL FUNCTIONS ----------------------------------------------
 
-    def threadingSetup(self, serial: SerialComm) -> None:
-        """Sets up threading, serial worker and signals/slots.
-
-        *Serial Window Core
-        """
-        self.serialThread = QThread()
-        self.serialLock = QMutex()
-        self.serialWorker = SerialWorker(serial, self.serialLock, "")
-        self.serialWorker.moveToThread(self.serialThread)
-        self.serialThread.started.connect(self.serialWorker.run)
-        self.serialWorker.cleanup.connect(self.serialThread.quit)
-        self.serialWorker.error.connect(self.serialError)
-        self.serialWorker.msg.connect(self.displayControl)
-        self.serialThread.start()
-
     def selectPort(self) -> bool:
         """Checks for available ports and asks for a selection.
 
@@ -285,6 +288,9 @@ class RocketDisplayWindow(QMainWindow):
 
     def setupSerial(self) -> None:
         """Serial option selection."""
+        if self.replay:
+            self.createConfBox("Serial Settings", f"Replaying {self.replay}.")
+            return
         if not self.selectPort() or not self.selectBaud():
             self.serialSet = False
         else:
@@ -292,26 +298,21 @@ class RocketDisplayWindow(QMainWindow):
 
     def toggleSerial(self) -> None:
         """Toggles serial connection on/off."""
-        if self.serialSet and not self.serialOn:
+        if self.serialSet and not self.engine.connected:
             try:
-                self.serial = setupConnection(self.port, self.baud)
-                self.threadingSetup(self.serial)
-                self.serialOn = True
-                self.buttons[SER_TOGGLE].setText(SER_OFF)
-                self.serStartTime = time.time()
-            except serial.SerialException:
+                if self.replay:
+                    connection = ReplayComm(self.replay, self.replaySpeed)
+                else:
+                    connection = setupConnection(self.port, self.baud)
+                self.engine.open(connection)
+            except (serial.SerialException, OSError):
                 self.createConfBox(
                     "Serial Error",
                     "Serial connection could not be established.",
                     QMessageBox.Icon.Critical,
                 )
-        elif self.serialOn:
-            self.serialOn = False
-            self.serialWorker.program = False
-            time.sleep(0.1)
-            if self.serial.connection.is_open:
-                self.serial.close()
-            self.buttons[SER_TOGGLE].setText(SER_ON)
+        elif self.engine.connected:
+            self.engine.close()
         else:
             self.createConfBox(
                 "Serial Error",
@@ -319,124 +320,97 @@ class RocketDisplayWindow(QMainWindow):
                 QMessageBox.Icon.Critical,
             )
 
+    def showSerial(self, connected: bool) -> None:
+        """Updates the serial button when the engine opens or closes the connection.
+
+        Args:
+            connected(bool): True if now open
+        """
+        self.buttons[SER_TOGGLE].setText(SER_OFF if connected else SER_ON)
+        if not connected:
+            self.displayPrint(self.labelCache.report())
+
     def closeEvent(self, event) -> None:
         """Adds additional functions when closing window."""
-        if self.serialOn:
-            self.serialWorker.program = False
-            time.sleep(0.1)
-            if self.serial.connection.is_open:
-                self.serial.close()
-        with open(SYS_LOG_FILE, "a") as sysLog, open(DATA_LOG_FILE, "a") as dataLog:
-            sysLog.write(
-                "---------------------------------------------------------------------------\n"
-            )
-            dataLog.write(
-                "---------------------------------------------------------------------------\n"
-            )
+        self.engineTimer.stop()
+        self.engine.shutdown()
 
-    def displayPrint(self, string: str, reformat=True) -> None:
-        """Displays to monitor and logs data.
+    def displayPrint(self, string: str, reformat=True, durable=False) -> None:
+        """Logs to the sys log and, through the engine's LOG event, the monitor.
+        Never waits for the disk.
 
         Args:
             string(str): the string to display and log
-            reformat(bool | None): add strFormat if True, otherwise do not
+            reformat(bool | None): prefix the current time if True, otherwise do not
+            durable(bool): fsync the sys log as soon as the line is written
         """
-        if reformat:
-            string = self.strFormat(string)
-        self.monitor.append(string)
-        self.monitor.verticalScrollBar().setValue(
-            self.monitor.verticalScrollBar().maximum()
-        )
-        with open(SYS_LOG_FILE, "a") as sysLog:
-            sysLog.write(string + "\n")
-
-    def parseData(self, data: str) -> list[tuple]:
-        """Parses incoming data to destination/value pairs.
-
-        Args:
-            data(str): the incoming data
-
-        Returns:
-            list[tuple]: a list of tuples with destination/value pairs
+        self.engine.log(string, reformat, durable)
 
-        *Serial Window Core
-        """
-        if VALVE_TAG in data:
-            valve_states = data.strip(VALVE_TAG)
-            return [(SV + PIN_READ_MAP[str(i + 1)], valve_states[i]) for i in range(0, 9)]
-        if PRESSURE_SEP in data:
-            readings = []
-            for i, val in enumerate(data.split(PRESSURE_SEP)):
-                readings.append((f"{PT}{ANALOG_MAP[i]}", val))
-            return readings
-        return []
-
-    def updateDisplay(self, dataset: list) -> None:
-        """Updates display values, accepting format of parseData.
+    def updateDisplay(self, stamps: list[int], frames: list[tuple[int, np.ndarray]]) -> None:
+        """Updates display values from the engine's FRAMES event.
         Modularize this function if design becomes more complex.
 
         Args:
-            dataset(list): list of parsed data in the format destination, value
+            stamps(list[int]): monotonic ns each frame was read at
+            frames(list): list of parsed frames in the format kind, values
 
         *Serial Window Core
         """
-        for dest, value in dataset:
-            try:
-                if SV in dest:
-                    status = int(value)
+        start = time.perf_counter_ns() if PROFILER.enabled else 0
+        for kind, values in frames:
+            names = self.engine.parser.names[kind]
+            if kind == VALVE_FRAME:
+                for dest, status in zip(names, values.tolist()):
+                    if status == MISSING:
+                        continue
                     if status:
-                        self.dynamicLabels[dest].setStyleSheet(
-                            FONT_CSS + f"color: {VALVE_ON}; "
-                        )
-                        self.dynamicLabels[dest].setText(DISP_FORMAT(dest, "OPEN"))
+                        self.labelCache.update(dest, DISP_FORMAT(dest, "OPEN"), VALVE_OPEN_CSS)
                     else:
-                        self.dynamicLabels[dest].setStyleSheet(
-                            FONT_CSS + f"color: {TEXT}; "
-                        )
-                        self.dynamicLabels[dest].setText(DISP_FORMAT(dest, "CLOSE"))
-                elif PT in dest:
-                    try:
-                        reading = int(value.strip())
-                    except ValueError:
-                        return
+                        self.labelCache.update(dest, DISP_FORMAT(dest, "CLOSE"), VALVE_CLOSED_CSS)
+            else:
+                styles = self.pressBands.styles(values)
+                for dest, reading, style in zip(names, values.tolist(), styles):
+                    if reading == MISSING or dest not in self.dynamicLabels:
+                        continue
 
                     # numerical readings
-                    self.dynamicLabels[dest].setText(DISP_FORMAT(dest, reading))
-                    if reading in SAFE_PRESS:
-                        self.dynamicLabels[dest].setStyleSheet(PRESS_GREEN)
-                    elif reading in MID_PRESS:
-                        self.dynamicLabels[dest].setStyleSheet(PRESS_YELLOW)
-                    else:
-                        self.dynamicLabels[dest].setStyleSheet(PRESS_RED)
+                    self.labelCache.update(dest, DISP_FORMAT(dest, reading), style)
+        if start:
+            PROFILER.record(DISPLAY, start)
+
+        # graphs
+        start = time.perf_counter_ns() if PROFILER.enabled else 0
+        mono = self.engine.timebase.mono
+        for stamp, (kind, values) in zip(stamps, frames):
+            if kind == PRESSURE_FRAME:
+                self.plotManager.add((stamp - mono) / 1e9, values)
+        if start:
+            PROFILER.record(PLOT, start)
+
+    def pressureLoss(self, name: str) -> float | None:
+        """Returns how fast a PT is losing pressure in PSI/MIN (negative while rising).
 
-                    # graphs
-                    if dest == PT + "2":  # Ox line
-                        self.graphData.emit(FUEL_GRAPH, reading) 
-                    elif dest == PT + "3":  # Fuel line
-                        self.graphData.emit(OX_GRAPH, reading)
-            except KeyError:
-                continue
+        Args:
+            name(str): the PT name
+        """
+        rate = self.engine.rates[name].rate()
+        return None if rate is None else -rate
 
-    @pyqtSlot(str)
-    def displayControl(self, string: str) -> None:
-        """Prints to display monitor, parses data, and updates live labels.
+    def isLeaking(self, name: str) -> bool:
+        """Returns True if a PT is losing pressure faster than LEAK_ACCEPT_RATE.
 
         Args:
-            string(str): the incoming data
-
-        *Serial Window Core
+            name(str): the PT name
         """
-        with open(DATA_LOG_FILE, "a") as sysLog:
-            sysLog.write(self.strFormat(string) + "\n")
-        data = self.parseData(string.strip('\n'))
-        self.updateDisplay(data)
+        loss = self.pressureLoss(name)
+        return loss is not None and loss > LEAK_ACCEPT_RATE
 
     def sendMessage(self, command: (str | None) = None) -> None:
         """Sends a specific message to toggle.
 
         *Serial Window Core
         """
-        if self.serialSet and self.serialOn:
+        if self.serialSet and self.engine.connected:
             if not command:
                 command = self.serialEntry.text()
             if len(set(command)) < len(command):
@@ -445,34 +419,29 @@ class RocketDisplayWindow(QMainWindow):
                     "Duplicate pin detected - please try again.",
                 )
                 return
-            self.displayPrint(f"Send: {MSG_PAD(command)}")
-            self.serialWorker.sendToggle(MSG_PAD(command))
+            self.engine.send(command)
         else:
-            self.createConfBox(
-                "Serial Error",
-                "Serial must be configured and on.",
-                QMessageBox.Icon.Critical,
-            )
+            self.serialOffError()
 
-    def serialError(self) -> None:
-        """Displays error popup upon handling of a serial exception."""
+    def serialOffError(self) -> None:
+        """Displays error popup when a command is sent with serial off."""
         self.createConfBox(
             "Serial Error",
-            "Serial error detected! Please try again.",
-            QMessageBox.Icon.Warning,
+            "Serial must be configured and on.",
+            QMessageBox.Icon.Critical,
         )
-        self.toggleSerial()
 
-    def strFormat(self, string: str) -> str:
-        """Returns formatted string for monitor display.
+    def serialError(self, message: str) -> None:
+        """Displays error popup after the engine closed a failed connection.
 
         Args:
-            string(str): the string to format
-
-        Returns:
-            str: the formatted string
+            message(str): the engine's error message
         """
-        return QDateTime.currentDateTime().toString(DATE_TIME_FORMAT) + string.strip()
+        self.createConfBox(
+            "Serial Error",
+            f"{message} Please try again.",
+            QMessageBox.Icon.Warning,
+        )
 
     # WINDOW ELEMENTS -----------------------------------------------
 
@@ -613,7 +582,7 @@ class RocketDisplayWindow(QMainWindow):
 
         grid.addWidget(
             self.createLabelBox(
-                f"<h1>STAGE: {LAUNCH_STATES[self.currentState]}</h1>",
+                f"<h1>STAGE: {LAUNCH_STATES[self.engine.state]}</h1>",
                 CURR_STATE,
                 HEADER_STYLE,
             ),
@@ -683,10 +652,7 @@ class RocketDisplayWindow(QMainWindow):
     def createSerialLayout(self) -> list:
         """Creates and returns items of the serial setup for a layoutBox."""
         # Serial monitor box
-        self.monitor = QTextEdit()
-        self.monitor.setReadOnly(True)
-        self.monitor.setFrameStyle(QFrame.Shape.NoFrame)
-        self.monitor.setStyleSheet(COLOR_CSS)
+        self.monitor = SerialMonitor(COLOR_CSS, BUTTON_STYLE, MONITOR_LINES, MONITOR_HISTORY)
 
         # Message entry line
         self.serialEntry = QLineEdit()
@@ -706,16 +672,16 @@ class RocketDisplayWindow(QMainWindow):
     
     def sendIgnitionCmd(self) -> None:
         """Sends ignition command when ignite button is pressed."""
-        if self.currentState == len(LAUNCH_STATES) - 1:
-            self.displayPrint("Ignition command sent.")
-            self.sendMessage(IGNITE_CMD)
+        if self.engine.final:
+            if not self.engine.ignite():
+                self.serialOffError()
             self.dynamicLabels[IGNITE].setStyleSheet(PRESS_YELLOW) # move to updateDisplay via state updates
 
     def sendMainValvesCmd(self) -> None:
         """Sends command to open main valves for fire when MV button is pressed."""
-        if self.currentState == len(LAUNCH_STATES) - 1:
-            self.displayPrint("Main valve actuation executed.")
-            self.sendMessage(MAINVALVE_CMD)
+        if self.engine.final:
+            if not self.engine.openMainValves():
+                self.serialOffError()
             self.dynamicLabels[MAINVALVES].setStyleSheet(PRESS_YELLOW) # move to updateDisplay via state updates
 
     def createWireDiagram(self) -> QLabel:
@@ -856,85 +822,49 @@ class RocketDisplayWindow(QMainWindow):
 
         return frame
 
-    def createPlot(self) -> dict:
-        """Creates a graph.
-
-        Returns:
-            tuple: the widget, graph, time set, data set
-        """
-        widget = PlotWidget()
-
-        # sample size 600 is abt a minute before scrolling
-        time = [0] * PSI_SAMPLE_SIZE  # time points
-        data = [0] * PSI_SAMPLE_SIZE  # data points
-
-        widget.setBackground(f"{PRIMARY_H}")
-        widget.setYRange(-50, 550)
-        widget.setMouseEnabled(x=False, y=False)
-        widget.hideButtons()
-        graph = widget.plot(time, data, pen=self.pen)
-        psiChange = QLabel(f"{PSI_CHANGE}: N/A")
-        psiChange.setStyleSheet(f"{GREEN}{BOLD}")
-
-        graphItems = {
-            WIDGET: widget,
-            GRAPH: graph,
-            TIME: time,
-            DATA: data,
-            TIMESTAMP: 0,
-            PSI_CHANGE: psiChange,
-        }
-
-        return graphItems
-
     def createGraphWidgets(self) -> list[tuple]:
-        """Creates graph widgets for layoutBox.
+        """Creates graph widgets for layoutBox, one title, plot and PSI/MIN
+        label per PLOT_CONFIG entry.
 
         Returns:
             list[tuple]: list of plots in (widget, x, y, l, h)
         """
-        fuelLabel = QLabel(FUEL_GRAPH)
-        fuelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        fuelLabel.setStyleSheet(STAGE_FONT_BLUE)
-        self.plots[FUEL_GRAPH] = self.createPlot()
-
-        oxLabel = QLabel(OX_GRAPH)
-        oxLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        oxLabel.setStyleSheet(STAGE_FONT_BLUE)
-        self.plots[OX_GRAPH] = self.createPlot()
-
-        return [
-            (fuelLabel, 0, 0, 5, 5),
-            (self.plots[FUEL_GRAPH][WIDGET], 5, 0, 5, 5),
-            (self.plots[FUEL_GRAPH][PSI_CHANGE], 5, 3, 1, 2),
-            (oxLabel, 10, 0, 5, 5),
-            (self.plots[OX_GRAPH][WIDGET], 15, 0, 5, 5),
-            (self.plots[OX_GRAPH][PSI_CHANGE], 15, 3, 1, 2),
-        ]
-
-    @pyqtSlot(str, int)
-    def updatePlot(self, plotName: str, data: int) -> None:
-        """Updates a plot."""
-
-        plot = self.plots[plotName]
-
-        # time
-        plot[TIMESTAMP] = time.time() - self.serStartTime
-        plot[TIME] = plot[TIME][1:]
-        plot[TIME].append(plot[TIMESTAMP])
-
-        # data
-        try:
-            plot[DATA] = plot[DATA][1:]
-            plot[DATA].append(data)
-        except ValueError:
-            pass
-
-        # Update the data.
-        #psiChangePerMin = (plot[DATA][-1] - plot[DATA][0])
-        psiChangePerMin = (np.mean(plot[DATA][:ROLLING_AVG_SAMPLE_SIZE] - np.mean(plot[DATA][-ROLLING_AVG_SAMPLE_SIZE:])))
-        plot[GRAPH].setData(plot[TIME][-DISPLAYED_SAMPLE_SIZE:-1], plot[DATA][-DISPLAYED_SAMPLE_SIZE:-1])
-        plot[PSI_CHANGE].setText(PSI_PER_MIN(psiChangePerMin))
+        widgets = []
+        for row, (title, plot) in enumerate(self.plotManager.plots.items()):
+            titleLabel = QLabel(title)
+            titleLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            titleLabel.setStyleSheet(STAGE_FONT_BLUE)
+            psiChange = QLabel(f"{PSI_CHANGE}: N/A")
+            psiChange.setStyleSheet(PSI_OK_CSS)
+            self.psiLabels[title] = psiChange
+            widgets += [
+                (titleLabel, 10 * row, 0, 5, 5),
+                (plot.widget, 10 * row + 5, 0, 5, 5),
+                (psiChange, 10 * row + 5, 3, 1, 2),
+            ]
+        return widgets
+
+    def renderPlots(self) -> None:
+        """Redraws all plots and their PSI/MIN labels."""
+        start = time.perf_counter_ns() if PROFILER.enabled else 0
+
+        self.plotManager.render()
+        for title, channels in PLOT_CONFIG.items():
+            losses = [self.pressureLoss(name) for name in channels]
+            if len(channels) == 1:
+                text = PSI_PER_MIN(losses[0]) if losses[0] is not None else f"{PSI_CHANGE}: N/A"
+            else:
+                text = f"{PSI_CHANGE}: " + ", ".join(
+                    f"{name} " + ("N/A" if loss is None else "%.1f" % loss)
+                    for name, loss in zip(channels, losses)
+                )
+            label = self.psiLabels[title]
+            label.setText(text)
+            style = PSI_LEAK_CSS if any(map(self.isLeaking, channels)) else PSI_OK_CSS
+            if label.styleSheet() != style:
+                label.setStyleSheet(style)
+        if start:
+            PROFILER.record(RENDER, start)
 
     def createButtonSets(self, keys: list[tuple]) -> list[tuple]:
         """Generates a set of buttons compatible with layoutBox
@@ -955,69 +885,50 @@ class RocketDisplayWindow(QMainWindow):
 
     def updateStage(self) -> None:
         """Confirms to update the stage."""
-        if not self.aborted:
+        if not self.engine.aborted:
             if not self.createConfBox(
                 "Stage Advancement", "Confirm: advance to next stage?", default=False
             ):
                 return
-            if self.currentState + 1 >= len(LAUNCH_STATES):
+            if not self.engine.advance():
                 self.createConfBox("Stage Advancement", "No more stages remaining.")
-                return
-
-            # Change highlight
-            self.dynamicLabels[LAUNCH_STATES[self.currentState]].setStyleSheet(
-                STAGE_FONT_WHITE
-            )
-            self.currentState += 1
-            self.dynamicLabels[LAUNCH_STATES[self.currentState]].setStyleSheet(
-                STAGE_FONT_BLUE
-            )
-
-            # Change title
-            self.dynamicLabels[CURR_STATE].setText(
-                f"<h1>STAGE: {LAUNCH_STATES[self.currentState]}</h1>"
-            )
-
-            self.displayPrint(f"Advance to: {LAUNCH_STATES[self.currentState]}")
 
     def previousStage(self) -> None:
         """Confirms to return to last stage."""
-        if self.aborted:
+        if self.engine.aborted:
             if not self.createConfBox(
                 "Stage Regression", "Confirm: exit abort state?", default=False
             ):
                 return
-            self.aborted = False
         else:
             if not self.createConfBox(
                 "Stage Regression", "Confirm: return to last stage?", default=False
             ):
                 return
-        if self.currentState - 1 < 0:
+        if not self.engine.previous():
             self.createConfBox(
                 "Stage Regression", "Cannot return further than first stage."
             )
-            return
 
+    def showState(self, state: int, aborted: bool) -> None:
+        """Moves the stage highlight and title to the engine's launch state.
+
+        Args:
+            state(int): index into LAUNCH_STATES
+            aborted(bool): True if the mission is aborted
+        """
         # Change highlight
-        self.dynamicLabels[LAUNCH_STATES[self.currentState]].setStyleSheet(
-            STAGE_FONT_WHITE
-        )
-        self.currentState -= 1
-        self.dynamicLabels[LAUNCH_STATES[self.currentState]].setStyleSheet(
-            STAGE_FONT_BLUE
-        )
+        self.dynamicLabels[LAUNCH_STATES[self.shownState]].setStyleSheet(STAGE_FONT_WHITE)
+        self.dynamicLabels[LAUNCH_STATES[state]].setStyleSheet(STAGE_FONT_BLUE)
 
         # Change title
-        self.dynamicLabels[CURR_STATE].setText(
-            f"<h1>STAGE: {LAUNCH_STATES[self.currentState]}</h1>"
-        )
+        self.dynamicLabels[CURR_STATE].setText(f"<h1>STAGE: {LAUNCH_STATES[state]}</h1>")
 
         # Reset Ignition and MV
-        self.dynamicLabels[IGNITE].setStyleSheet(FONT_CSS + f"color: {TEXT}; ")
-        self.dynamicLabels[MAINVALVES].setStyleSheet(FONT_CSS + f"color: {TEXT}; ")
-
-        self.displayPrint(f"Return to: {LAUNCH_STATES[self.currentState]}")
+        if state < self.shownState:
+            self.dynamicLabels[IGNITE].setStyleSheet(FONT_CSS + f"color: {TEXT}; ")
+            self.dynamicLabels[MAINVALVES].setStyleSheet(FONT_CSS + f"color: {TEXT}; ")
+        self.shownState = state
 
     def abortMission(self, confirmation: str) -> bool:
         """Abort mission confirmation.
@@ -1028,11 +939,11 @@ class RocketDisplayWindow(QMainWindow):
         Returns:
             bool: abortion confirmation status
         """
-        if LAUNCH_STATES[self.currentState] != 'IDLE' and self.createConfBox(
+        if LAUNCH_STATES[self.engine.state] != 'IDLE' and self.createConfBox(
             "Mission Abort Confirmation", confirmation, default=False
         ):
             self.dynamicLabels[CURR_STATE].setText("<h1> MISSION ABORTED </h1>")
-            self.aborted = True
+            self.engine.aborted = True
             try:
                 self.countdown.stop()
             except AttributeError:
@@ -1042,9 +953,8 @@ class RocketDisplayWindow(QMainWindow):
     
     def abortGeneral(self) -> None:
         """Begins abort sequence on confirmation."""
-        if not self.aborted:
-            self.displayPrint("System abort executed.")
-            self.sendMessage(ABORT_CMD)
+        if not self.engine.aborted and not self.engine.abort():
+            self.serialOffError()
 
     # def abortOverpressure(self) -> None:
     #     """Begins overpressurization abort sequence on confirmation."""
@@ -1127,7 +1037,7 @@ class RocketDisplayWindow(QMainWindow):
 
     def countDown(self) -> None:
         """Starts countdown"""
-        if not self.aborted:
+        if not self.engine.aborted:
             self.moment = 11
 
             def countSecond():
@@ -1145,71 +1055,52 @@ class RocketDisplayWindow(QMainWindow):
             self.countdown.start(1000)
     
     def decayTest(self) -> None:
-        """Performs decay test."""
+        """Starts or stops a decay test.
+
+        Every ACTIVE_PTS reading is collected while the test runs; progress is
+        logged each DT_ITER_LEN_SECONDS and the fitted result after DT_ITERS.
+        """
 
-        if not self.serialSet or not self.serialOn:
+        if not self.serialSet or not self.engine.connected:
             self.createConfBox(
                 "Serial Error",
                 "Serial settings not configured.",
                 QMessageBox.Icon.Critical,
             )
             return
-        
-        if (self.decayTestActive):
-            if self.createConfBox(
-                "Decay Test",
-                "Stop Decay Test?", default=False
-            ):
-                self.decayTimer.stop()
-                self.displayPrint("Decay Test terminated early.")
-                self.decayTestActive = False
-                self.buttons[DT].setText(DT)
-                return
-        else:
-            self.decayTestActive = True
-            self.buttons[DT].setText(DT_STOP)
-
-        self.iterations = DT_ITERS
-        self.it_time = DT_ITER_LEN_SECONDS
-        self.dtReadings = {}
-        self.dtAvg = {}
-        for i in ACTIVE_PTS:
-            self.dtReadings[i] = []
-            self.dtAvg[i] = 0
-
-        self.displayPrint(
-            f"Decay Test: {self.iterations} interations, {self.it_time} seconds per iter."
-        )
 
-        def benchmark():
-            if self.iterations == 0:
-                self.decayTimer.stop()
-                avgStr = f"Averages (PSI): "
-                for i in ACTIVE_PTS:
-                    total = np.diff(np.array(self.dtReadings[i]))
-
-                    avgStr += f"{i}-{np.average(total)} "
-                self.displayPrint(avgStr)
-                self.displayPrint("Decay Test Complete.")
-                self.decayTestActive = False
-                self.buttons[DT].setText(DT)
-                return
-            update = f"DT{self.iterations}: "
-            for i in ACTIVE_PTS:
-                r = self.dynamicLabels[i].text().split(":")[1]
-                self.dtReadings[i].append(int(r))
-                update += f"{i}-{r} "
-            self.displayPrint(update)
-            self.iterations -= 1
+        if self.engine.decayActive:
+            if self.createConfBox("Decay Test", "Stop Decay Test?", default=False):
+                self.engine.stopDecayTest(completed=False)
+            return
+
+        self.engine.startDecayTest(DT_ITERS, DT_ITER_LEN_SECONDS)
+
+    def showDecayTest(self, active: bool, result: dict | None) -> None:
+        """Updates the decay test button when a test starts or stops.
+
+        Args:
+            active(bool): True if a test is running
+            result(dict | None): the result record once stopped
+        """
+        self.buttons[DT].setText(DT_STOP if active else DT)
+
 
-        benchmark()
-        self.decayTimer = QTimer()
-        self.decayTimer.timeout.connect(benchmark)
-        self.decayTimer.start(self.it_time * 1000)
+# MAIN ----------------------------------------------------------------------|
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    rocketDisplay = RocketDisplayWindow()
+    args = argparse.ArgumentParser(description="Liquid Rocket Project launch control GUI.")
+    args.add_argument("--replay", metavar="FILE", help="replay a log/data file instead of serial")
+    args.add_argument(
+        "--speed", type=float, default=1.0, help="replay speed factor, 0 for as fast as possible"
+    )
+    args.add_argument(
+        "--profile", action="store_true", default=PROFILE, help="log hot path timings to log/sys"
+    )
+    opts, qtArgs = args.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qtArgs)
+    rocketDisplay = RocketDisplayWindow(opts.replay, opts.speed, opts.profile)
     rocketDisplay.showMaximized()
     sys.exit(app.exec())
@@ -0,0 +1,56 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Checks BinaryRecorder records, value clipping and dated files.
+"""
+
+import numpy as np
+
+from utils.binlog import VALUE_MAX, VALUE_MIN, BinaryRecorder, readChannels, readRecords
+from utils.logger import localDay, wallMs
+from utils.parser import MISSING, PRESSURE_FRAME, VALVE_FRAME
+
+CHANNELS = np.arange(4)
+
+
+def test_records_round_trip(tmp_path):
+    recorder = BinaryRecorder(str(tmp_path / "{DATE}.bin"), channels=4)
+    now = wallMs() * 1_000_000
+    recorder.recordFrame(PRESSURE_FRAME, np.array([1, 2, MISSING]), CHANNELS, now)
+    recorder.recordFrame(VALVE_FRAME, np.array([1, 0, 1, 1]), CHANNELS, now + 1)
+    recorder.close()
+    assert recorder.path == str(tmp_path / f"{localDay(now // 1_000_000)[0]}.bin")
+    times, values = readChannels(recorder.path)
+    assert times.tolist() == [now]
+    assert values.tolist() == [[1, 2, MISSING, MISSING]]
+    assert readRecords(recorder.path)["kind"].tolist() == [PRESSURE_FRAME, VALVE_FRAME]
+
+
+def test_reopened_file_keeps_one_header(tmp_path):
+    path = str(tmp_path / "data.bin")
+    for stamp in (1, 2):
+        recorder = BinaryRecorder(path, channels=4)
+        recorder.recordFrame(PRESSURE_FRAME, np.array([stamp]), CHANNELS, stamp)
+        recorder.close()
+    assert readChannels(path)[0].tolist() == [1, 2]
+
+
+def test_out_of_range_values_saturate(tmp_path):
+    recorder = BinaryRecorder(str(tmp_path / "data.bin"), channels=4)
+    recorder.recordFrame(PRESSURE_FRAME, np.array([2**40, -(2**40), MISSING, 7]), CHANNELS, 0)
+    recorder.close()
+    _, values = readChannels(recorder.path)
+    assert values.tolist() == [[VALUE_MAX, VALUE_MIN, MISSING, 7]]
+    assert recorder.clipped == 2
+
+
+def test_new_day_starts_new_file(tmp_path):
+    recorder = BinaryRecorder(str(tmp_path / "{DATE}.bin"), channels=4)
+    _, midnight = localDay(wallMs())
+    recorder.recordFrame(PRESSURE_FRAME, np.array([1]), CHANNELS, (midnight - 1) * 1_000_000)
+    first = recorder.path
+    recorder.recordFrame(PRESSURE_FRAME, np.array([2]), CHANNELS, midnight * 1_000_000)
+    recorder.close()
+    assert recorder.path != first
+    assert readChannels(first)[1][:, 0].tolist() == [1]
+    assert readChannels(recorder.path)[1][:, 0].tolist() == [2]  # with its own header
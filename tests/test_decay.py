@@ -0,0 +1,71 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Fits DecayTest to synthetic pressure decays with known slopes.
+"""
+
+import numpy as np
+
+from utils.decay import FAIL, INCONCLUSIVE, PASS, DecayTest
+from utils.parser import MISSING, PRESSURE_FRAME, VALVE_FRAME
+
+NAMES = ["PT1", "PT2", "PT3"]
+RATE = 50  # samples per second
+
+
+def decay(test: DecayTest, minutes: float, slopes: list[float], noise: float, seed: int = 0):
+    """Feeds a linear decay of each PT (PSI/MIN) plus gaussian noise."""
+    rng = np.random.default_rng(seed)
+    count = int(minutes * 60 * RATE)
+    stamps = (np.arange(count) * (1e9 / RATE)).astype(np.int64) + 7_000_000_000
+    readings = 500 + np.outer(stamps - stamps[0], slopes) / 60e9
+    readings = np.rint(readings + rng.normal(0, noise, readings.shape)).astype(np.int64)
+    frames = [(PRESSURE_FRAME, row) for row in readings]
+    test.add(stamps.tolist(), frames)
+
+
+def test_fitted_slope_and_interval():
+    test = DecayTest(NAMES, NAMES, 1.0)
+    test.start(0)
+    decay(test, 5, [-0.2, -3.0, 0.0], noise=0.5)
+    fits = test.fit()
+    for name, slope in zip(NAMES, [-0.2, -3.0, 0.0]):
+        low, high = fits[name]["ci95"]
+        assert low <= slope <= high
+        assert abs(fits[name]["slope"] - slope) < 0.05
+        assert fits[name]["samples"] == 5 * 60 * RATE
+    assert fits["PT1"]["verdict"] == PASS
+    assert fits["PT2"]["verdict"] == FAIL
+    result = test.result()
+    assert result["verdict"] == FAIL and not result["pass"]
+
+
+def test_noisy_short_run_is_inconclusive():
+    """A slope within the accept rate whose interval is not does not pass."""
+    test = DecayTest(["PT1"], NAMES, 1.0)
+    test.start(0)
+    decay(test, 0.05, [-0.8, 0, 0], noise=20)
+    fit = test.fit()["PT1"]
+    low, high = fit["ci95"]
+    assert -low > 1.0 > -high
+    assert fit["verdict"] == INCONCLUSIVE and not fit["pass"]
+    assert test.result()["verdict"] == INCONCLUSIVE
+
+
+def test_pass_and_skipped_frames():
+    test = DecayTest(["PT1", "PT3"], NAMES, 1.0)
+    test.start(0)
+    test.add([1, 2], [(VALVE_FRAME, np.array([1, 0])), (PRESSURE_FRAME, np.array([500, MISSING]))])
+    decay(test, 2, [0.1, 0, -0.5], noise=0.3)
+    result = test.result()
+    assert result["verdict"] == PASS and result["pass"]
+    assert result["channels"]["PT1"]["samples"] == 2 * 60 * RATE + 1
+    assert result["channels"]["PT3"]["samples"] == 2 * 60 * RATE
+    assert not test.result(completed=False)["pass"]
+
+
+def test_without_samples():
+    test = DecayTest(NAMES, NAMES, 1.0)
+    test.start(0)
+    assert test.result()["verdict"] == INCONCLUSIVE
+    assert test.fit()["PT1"]["slope"] is None
@@ -0,0 +1,89 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Round-trips logs through LineCompactor and expandLines.
+"""
+
+import random
+
+import pytest
+
+from utils.dedup import MAX_RUN_SECONDS, RUN_TAG, LineCompactor, expandLines
+from utils.logfiles import SESSION_TAG, formatStamp
+
+VALVE_TAG = "PS"
+START = 1_700_000_000_000  # ms
+
+
+def session(seed: int, seconds: float) -> list[tuple[int, str]]:
+    """Returns a session's (ms, line) received: pressure frames, blank lines and
+    valve frames that mostly repeat, several lines per ms at times, and a few
+    pauses longer than any run."""
+    rng = random.Random(seed)
+    ms = START + seed * 3_600_000
+    valves = "PS000000000"
+    lines = []
+    while ms < START + seed * 3_600_000 + seconds * 1000:
+        ms += rng.choice([0, 0, 1, 2, 5, 40]) if rng.random() > 0.002 else 12_000  # quiet port
+        roll = rng.random()
+        if roll < 0.3:
+            lines.append((ms, f"{rng.randint(0, 500)}, {rng.randint(0, 500)}, 12\r"))
+        elif roll < 0.45:
+            lines.append((ms, "\r"))
+        else:
+            if rng.random() < 0.02:
+                valves = "PS" + "".join(rng.choice("01") for _ in range(9))
+            lines.append((ms, valves + "\r"))
+    return lines
+
+
+def compactLog(sessions: list[list[tuple[int, str]]], flushSeconds: float) -> list[bytes]:
+    """Logs sessions the way the engine does, in random batches, closing the
+    port (flush) between sessions."""
+    rng = random.Random(0)
+    compactor = LineCompactor(VALVE_TAG, flushSeconds)
+    log = []
+    for received in sessions:
+        log.append(SESSION_TAG + b"test\n")
+        index = 0
+        while index < len(received):
+            batch = received[index:index + rng.randint(1, 60)]
+            index += len(batch)
+            stamps = [ms for ms, _ in batch]
+            _, logged = compactor.compact(stamps, [line for _, line in batch])
+            log += [formatStamp(stamps[at]) + text.encode() + b"\n" for at, text in logged]
+        end = received[-1][0] + 500
+        log += [formatStamp(end) + marker.encode() + b"\n" for marker in compactor.flush(end)]
+    return log
+
+
+def rawLog(sessions: list[list[tuple[int, str]]]) -> list[bytes]:
+    """Returns the log the sessions make without compaction."""
+    log = []
+    for received in sessions:
+        log.append(SESSION_TAG + b"test\n")
+        log += [formatStamp(ms) + line.strip().encode() + b"\n" for ms, line in received]
+    return log
+
+
+@pytest.mark.parametrize("flushSeconds", [0.05, 1, 5, MAX_RUN_SECONDS])
+def test_round_trip_is_lossless(flushSeconds):
+    sessions = [session(1, 120), session(2, 60)]  # port stopped and restarted between them
+    compacted = compactLog(sessions, flushSeconds)
+    markers = [line for line in compacted if RUN_TAG.encode() in line]
+    assert markers and len(compacted) < len(rawLog(sessions))
+    assert list(expandLines(compacted)) == rawLog(sessions)
+
+
+def test_long_run_is_split():
+    """A run longer than flushSeconds is logged as several markers."""
+    received = [(START + ms, "PS000000000\r") for ms in range(0, 30_000, 10)]
+    compacted = compactLog([received], 5)
+    markers = [line for line in compacted if RUN_TAG.encode() in line]
+    assert len(markers) >= 30 // 5
+    assert list(expandLines(compacted)) == rawLog([received])
+
+
+def test_run_over_limit_rejected():
+    with pytest.raises(ValueError):
+        LineCompactor(VALVE_TAG, MAX_RUN_SECONDS + 1)
@@ -0,0 +1,68 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Checks that every frame keeps its line's read stamp through the engine.
+"""
+
+from utils.config import ANALOG_MAP, PIN_READ_MAP, PRESSURE_SEP, PT, SV, VALVE_TAG
+from utils.decay import DecayTest
+from utils.dedup import LineCompactor
+from utils.engine import FRAMES, LaunchCommands, TelemetryEngine
+from utils.logfiles import STAMP_LEN
+from utils.logger import LogWriter
+from utils.parser import PRESSURE_FRAME, FrameParser
+from utils.rates import RateEstimator
+
+MS = 1_000_000  # ns
+
+
+def engine(tmp_path) -> TelemetryEngine:
+    parser = FrameParser(ANALOG_MAP, PIN_READ_MAP, PT, SV, PRESSURE_SEP, VALVE_TAG)
+    names = parser.names[PRESSURE_FRAME]
+    return TelemetryEngine(
+        parser,
+        LogWriter(str(tmp_path / "sys.txt")),
+        LogWriter(str(tmp_path / "data.txt")),
+        "NEW SESSION: test",
+        LaunchCommands("a", "i", "m", ("a", "m"), ("a", "m", "i"), 8),
+        ("IDLE", "FIRE"),
+        {name: RateEstimator(60) for name in names},
+        DecayTest(["PT1"], names, 1.0),
+        LineCompactor(VALVE_TAG),
+    )
+
+
+def test_each_frame_keeps_its_line_stamp(tmp_path):
+    telemetry = engine(tmp_path)
+    received = []
+    telemetry.subscribe(FRAMES, lambda stamps, frames: received.append((stamps, frames)))
+    telemetry.startDecayTest(5, 60)
+    base = telemetry.timebase.mono
+    batch = [(base + i * 100 * MS, f"{1000 - i}, 5, 5, 5\r") for i in range(10)]
+    batch.insert(3, (base + 250 * MS, "PS000000000\r"))
+    batch.insert(4, (base + 260 * MS, "PS000000000\r"))  # repeat, logged as a marker
+    telemetry.handleBatch(batch)
+    telemetry.shutdown()
+
+    (stamps, frames), = received
+    assert len(frames) == 11
+    assert stamps == [stamp for stamp, line in batch if line != "PS000000000\r" or stamp == base + 250 * MS]
+    # 1 PSI lost every 100 ms, whatever the batch was read as
+    assert telemetry.rates["PT1"].rate() == -600.0
+    assert telemetry.decay.fit()["PT1"]["slope"] == -600.0
+
+    logged = (tmp_path / "data.txt").read_text().splitlines()
+    frames = [line for line in logged if line.endswith("5, 5, 5")]
+    expected = [telemetry.timebase.logStamp(stamp) for stamp, line in batch if "5, 5" in line]
+    assert [line[:STAMP_LEN] for line in frames] == expected
+    assert len(set(expected)) == 10
+
+
+def test_frames_event_has_a_stamp_per_frame(tmp_path):
+    telemetry = engine(tmp_path)
+    received = []
+    telemetry.subscribe(FRAMES, lambda stamps, frames: received.append(len(stamps) == len(frames)))
+    base = telemetry.timebase.mono
+    telemetry.handleBatch([(base + i, line) for i, line in enumerate(["\r", "1, 2\r", "junk", "PS1\r"])])
+    telemetry.shutdown()
+    assert received == [True]
@@ -0,0 +1,105 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Checks LogWriter ordering, flushing, fsync and daily rotation.
+"""
+
+import gzip
+import os
+import time
+
+import pytest
+
+from utils import logger
+from utils.logfiles import INDEX_SUFFIX, compressLog
+from utils.logger import LogWriter, localDay, wallMs
+
+
+def waitFor(condition, seconds: float = 5.0) -> bool:
+    deadline = time.monotonic() + seconds
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_lines_written_in_order(tmp_path):
+    path = tmp_path / "log.txt"
+    writer = LogWriter(str(path), flushLines=7)
+    for i in range(1000):
+        writer.write(f"line {i}", durable=i % 97 == 0)
+    writer.writeLines([f"batch {i}" for i in range(100)])
+    writer.close()
+    expected = [f"line {i}" for i in range(1000)] + [f"batch {i}" for i in range(100)]
+    assert path.read_text().splitlines() == expected
+
+
+def test_close_flushes_buffer(tmp_path):
+    path = tmp_path / "log.txt"
+    writer = LogWriter(str(path), flushLines=10_000, flushInterval=60)
+    writer.writeLines(["a", "b"])
+    time.sleep(0.05)
+    assert path.read_text() == ""  # still buffered
+    writer.close()
+    assert path.read_text() == "a\nb\n"
+    assert not writer.thread.is_alive()
+
+
+def test_durable_line_is_synced(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr(logger.os, "fsync", lambda fd: synced.append(path.read_text()))
+    path = tmp_path / "log.txt"
+    writer = LogWriter(str(path), flushLines=10_000, flushInterval=60)
+    writer.write("batched")
+    writer.write("ABORT", durable=True)
+    assert waitFor(lambda: synced)
+    assert synced == ["batched\nABORT\n"]  # written out before the fsync, without waiting to flush
+    writer.close()
+
+
+def test_open_error_raises(tmp_path):
+    with pytest.raises(OSError):
+        LogWriter(str(tmp_path / "missing" / "log.txt"))
+
+
+def test_rotates_by_line_stamp(tmp_path):
+    """Lines are dated by their stamps, even if written after midnight together."""
+    date, midnight = localDay(wallMs())
+    nextDate, _ = localDay(midnight)
+    writer = LogWriter(
+        str(tmp_path / "{DATE}.txt"), flushLines=10_000, flushInterval=60, compress=True, header="HEADER"
+    )
+    today = tmp_path / f"{date}.txt"
+    tomorrow = tmp_path / f"{nextDate}.txt"
+    (tmp_path / f"{date}.txt{INDEX_SUFFIX}").write_text("{}")
+
+    writer.writeLines(["before", "just before", "after"], [midnight - 2000, midnight - 1, midnight])
+    writer.write("later", stamp=midnight + 5000)
+    writer.close()
+
+    assert tomorrow.read_text() == "HEADER\nafter\nlater\n"
+    assert waitFor(lambda: not today.exists())
+    with gzip.open(f"{today}.gz", "rt") as compressed:
+        assert compressed.read() == "before\njust before\n"
+    assert os.path.exists(f"{today}.gz{INDEX_SUFFIX}")
+    assert not os.path.exists(f"{today}{INDEX_SUFFIX}")
+
+
+def test_rotates_by_size(tmp_path):
+    writer = LogWriter(str(tmp_path / "{DATE}.txt"), flushLines=1, maxBytes=10, header="H")
+    writer.writeLines(["0123456789", "abc"])
+    writer.close()
+    date, _ = localDay(wallMs())
+    assert (tmp_path / f"{date}.txt").read_text() == "0123456789\n"
+    assert (tmp_path / f"{date}.1.txt").read_text() == "H\nabc\n"
+
+
+def test_compressed_log_reads_back(tmp_path):
+    path = tmp_path / "old.txt"
+    text = "".join(f"line {i}\n" for i in range(5000))
+    path.write_text(text)
+    target = compressLog(str(path), frameBytes=4096)
+    assert not path.exists()
+    with gzip.open(target, "rt") as compressed:
+        assert compressed.read() == text
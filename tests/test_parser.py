@@ -0,0 +1,27 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Regression checks for FrameParser's bulk pressure conversion.
+"""
+
+from utils.parser import MISSING, PRESSURE_FRAME, FrameParser
+
+PARSER = FrameParser([1, 3, 2, 4], {"1": "1", "2": "2"}, pressureSep=", ")
+
+
+def values(lines: list[str]) -> list[list[int]]:
+    return [frame.tolist() for kind, frame in PARSER.parseBatch(lines) if kind == PRESSURE_FRAME]
+
+
+def test_trailing_separator_is_missing():
+    """A trailing "," before CRLF is a missing reading, not 0 PSI."""
+    assert values(["99,  203,\r\n"]) == [[99, 203, MISSING]]
+    assert values(["99,  133,  160,  150,  -75,\r"]) == [[99, 133, 160, 150]]
+
+
+def test_empty_field_in_batch():
+    assert values(["1, 2, 3\r", "4,, 6\r"]) == [[1, 2, 3], [4, MISSING, 6]]
+
+
+def test_well_formed_batch():
+    assert values(["1, 2, 3, 4\r\n", "5, 6, 7, 8\r\n"]) == [[1, 2, 3, 4], [5, 6, 7, 8]]
@@ -0,0 +1,81 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Checks MinMaxPyramid queries against the raw samples they decimate.
+"""
+
+import numpy as np
+import pytest
+
+from utils.pyramid import MinMaxPyramid
+
+
+def filled(samples: int, channels: int = 2, maxBuckets: int = 1 << 20):
+    """Returns a pyramid of random samples with gaps, and its raw times and values."""
+    rng = np.random.default_rng(samples)
+    times = np.cumsum(rng.uniform(0.5, 1.5, samples))
+    values = rng.normal(0, 100, (samples, channels)).astype(np.float32)
+    values[rng.random((samples, channels)) < 0.01] = np.nan
+    pyramid = MinMaxPyramid(channels, maxBuckets=maxBuckets)
+    for time, row in zip(times, values):
+        pyramid.append(time, row)
+    return pyramid, times, values
+
+
+def inside(pyramid, start, end, maxPoints):
+    """Returns the query points with start <= time <= end."""
+    times, values = pyramid.query(start, end, maxPoints, None)
+    keep = (times >= start) & (times <= end)
+    return times[keep], values[keep]
+
+
+def test_range_min_max_matches_raw():
+    """Any range, at any level, draws exactly the min and max of its samples."""
+    pyramid, times, values = filled(10_000)
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        start, end = np.sort(rng.uniform(times[0] - 10, times[-1] + 10, 2))
+        maxPoints = int(rng.integers(8, 4000))
+        _, drawn = inside(pyramid, start, end, maxPoints)
+        raw = values[(times >= start) & (times <= end)]
+        if not len(raw):
+            continue
+        np.testing.assert_array_equal(np.nanmin(drawn, axis=0), np.nanmin(raw, axis=0))
+        np.testing.assert_array_equal(np.nanmax(drawn, axis=0), np.nanmax(raw, axis=0))
+
+
+def test_level_fits_budget():
+    pyramid, times, _ = filled(10_000)
+    assert pyramid.pickLevel(times[0], times[-1], 20_000) == 0
+    assert pyramid.pickLevel(times[100], times[200], 101) == 0
+    level = pyramid.pickLevel(times[0], times[-1], 1000)
+    assert level == 3  # 10000 / 4 ** 3 = 156 buckets, 312 points
+    points, _ = inside(pyramid, times[0], times[-1], 1000)
+    assert len(points) <= 1000 + 2 * 2 * 3 * (pyramid.factor - 1)
+
+
+def test_query_includes_neighbours():
+    pyramid, times, values = filled(100)
+    drawn, points = pyramid.query(times[10], times[20], 1000, 0)
+    np.testing.assert_array_equal(drawn, times[9:22])
+    np.testing.assert_array_equal(points, values[9:22, 0])
+
+
+def test_history_is_bounded():
+    pyramid, times, values = filled(20_000, maxBuckets=512)
+    assert all(level.count <= 512 for level in pyramid.levels)
+    assert len(pyramid) == 20_000
+    assert pyramid.extent() == (times[0], times[-1])
+
+    recent = times[-300]
+    _, drawn = inside(pyramid, recent, times[-1], 10_000)
+    np.testing.assert_array_equal(np.nanmax(drawn, axis=0), np.nanmax(values[-300:], axis=0))
+
+    # the whole history is still drawn, from the levels that kept it
+    _, drawn = inside(pyramid, times[0], times[-1], 1000)
+    np.testing.assert_array_equal(np.nanmin(drawn, axis=0), np.nanmin(values, axis=0))
+
+
+def test_bucket_cap_alignment():
+    with pytest.raises(ValueError):
+        MinMaxPyramid(maxBuckets=100)
@@ -0,0 +1,59 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Checks RateEstimator slopes, window expiry and sign.
+"""
+
+from utils.rates import RateEstimator
+
+NS = 1_000_000_000
+
+
+def test_linear_ramp_slope():
+    """One PSI every 20 ms is 3000 PSI/MIN, whatever the stamp origin."""
+    estimator = RateEstimator(10)
+    for i in range(500):
+        estimator.add(123_456_789_000 + i * 20_000_000, 1000 + i)
+    assert estimator.rate() == 3000.0
+
+
+def test_falling_ramp_slope():
+    estimator = RateEstimator(60)
+    for second in range(30):
+        estimator.add(5 * NS + second * NS, 700 - 2 * second)
+    assert estimator.rate() == -120.0
+
+
+def test_sign_follows_pressure():
+    """Positive while pressure rises, negative while it falls."""
+    rising, falling = RateEstimator(60), RateEstimator(60)
+    for second in range(10):
+        rising.add(second * NS, 100 + second)
+        falling.add(second * NS, 100 - second)
+    assert rising.rate() > 0
+    assert falling.rate() < 0
+    assert rising.rate() == -falling.rate() == 60.0
+
+
+def test_window_expiry():
+    """Samples older than the window stop counting."""
+    estimator = RateEstimator(5)
+    for second in range(10):
+        estimator.add(second * NS, 0 if second < 6 else 1000 * second)
+    assert len(estimator) == 6  # seconds 4 to 9
+    for second in range(10, 20):
+        estimator.add(second * NS, 500 + second)
+    assert len(estimator) == 6
+    assert estimator.rate() == 60.0
+
+
+def test_equal_stamps_have_no_rate():
+    estimator = RateEstimator(60)
+    assert estimator.rate() is None
+    estimator.add(NS, 100)
+    assert estimator.rate() is None
+    estimator.add(NS, 200)
+    estimator.add(NS, 50)
+    assert estimator.rate() is None
+    estimator.clear()
+    assert estimator.rate() is None and len(estimator) == 0
@@ -0,0 +1,68 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Checks that serial and replay sources stamp every line they return.
+"""
+
+from utils.gui_serial import SerialComm
+from utils.replay import ReplayComm
+
+
+class FakePort:
+    """pyserial stand-in returning prepared chunks."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.buffer = b""
+
+    def read(self, size: int) -> bytes:
+        if not self.buffer and self.chunks:
+            self.buffer = self.chunks.pop(0)
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.buffer)
+
+
+def serialComm(chunks: list[bytes], baudrate: int = 115200) -> SerialComm:
+    comm = SerialComm.__new__(SerialComm)
+    comm.connection = FakePort(chunks)
+    comm.pending = bytearray()
+    comm.byteNs = 10 * 1_000_000_000 // baudrate
+    comm.lastRead = 0
+    return comm
+
+
+def test_lines_in_one_read_are_stamped_apart():
+    comm = serialComm([b"1, 2\n3, 4\nPS1", b"01\n"], baudrate=9600)  # ~1 ms per byte
+    first = comm.readLines()
+    assert [line for _, line in first] == ["1, 2", "3, 4"]
+    (a, _), (b, _) = first
+    assert b - a == 5 * comm.byteNs  # "3, 4\n" took 5 bytes on the wire
+    assert comm.lastRead - b == 3 * comm.byteNs  # "PS1" arrived after it
+    (c, line), = comm.readLines()
+    assert line == "PS101" and b < c <= comm.lastRead
+
+
+def test_stamps_never_precede_previous_read():
+    comm = serialComm([b"1\n", b"2\n" * 1000])
+    (first, _), = comm.readLines()
+    second = comm.readLines()
+    stamps = [stamp for stamp, _ in second]
+    assert stamps == sorted(stamps) and stamps[0] >= first
+
+
+def test_replay_lines_are_stamped_in_order(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_text(
+        "NEW SESSION: 02-29-24-12-14\n"
+        + "".join(f"02/29/2024 | 12:54:34:{i:03d} -> {i}, 5\n" for i in range(100))
+    )
+    replay = ReplayComm(str(path), speed=0)
+    batch = replay.readLines()
+    replay.close()
+    assert [line for _, line in batch] == [f"{i}, 5" for i in range(100)]
+    stamps = [stamp for stamp, _ in batch]
+    assert stamps == sorted(stamps)
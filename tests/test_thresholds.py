@@ -0,0 +1,29 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Checks BandClassifier band edges against the configured PT limits.
+"""
+
+import numpy as np
+
+from utils.config import PRESS_LIMITS, PRESS_LIMITS_DEFAULT
+from utils.thresholds import HIGH_BAND, LOW_BAND, MID_BAND, SAFE_BAND, BandClassifier
+
+STYLES = ("low", "safe", "mid", "high")
+
+
+def test_edges_per_channel():
+    bands = BandClassifier(["PT1", "PT2"], {"PT1": (0, 10, 20)}, (-5, 5, 15), STYLES)
+    assert bands.classify(np.array([-1, -1])).tolist() == [LOW_BAND, SAFE_BAND]
+    assert bands.classify(np.array([9, 5])).tolist() == [SAFE_BAND, MID_BAND]
+    assert bands.classify(np.array([10, 15])).tolist() == [MID_BAND, HIGH_BAND]
+    assert bands.styles(np.array([20, -6])) == ["high", "low"]
+
+
+def test_configured_limits():
+    """Green below 400 PSI, yellow from 400 through 500, red from 501."""
+    names = list(PRESS_LIMITS) + ["PT9"]
+    bands = BandClassifier(names, PRESS_LIMITS, PRESS_LIMITS_DEFAULT, STYLES)
+    for psi, band in [(-1001, LOW_BAND), (0, SAFE_BAND), (399, SAFE_BAND), (400, MID_BAND),
+                      (500, MID_BAND), (501, HIGH_BAND)]:
+        assert set(bands.classify(np.full(len(names), psi)).tolist()) == {band}
@@ -0,0 +1 @@
+# offline tools for rocket gui logs
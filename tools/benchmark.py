@@ -0,0 +1,159 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Headless end-to-end throughput benchmark against a simulated board.
+
+Starts a SimBoard on a pty, opens it through the window's normal
+toggleSerial path (SerialComm, SerialReader thread, engine poll,
+handleBatch, updateDisplay, plots), and reports sustained lines/s,
+dropped lines (pressure sequence gaps), backlog (frames written but not
+yet displayed when the run ends) and p50/p99 latency from the board
+writing a frame to the engine's FRAMES subscribers finishing with it.
+--headless measures the TelemetryEngine alone, without a window. Logs go
+to a temporary directory. POSIX only.
+
+Usage:
+    python -m tools.benchmark --rate 100 500 1000 5000 --seconds 10
+    python -m tools.benchmark --headless --rate 1000 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+import main as gui
+from tools.simboard import SimBoard
+from utils import FRAMES, PRESSURE_FRAME, SerialComm, TelemetryEngine, config
+
+
+# CLASSES ------------------------------------------------------------------------|
+class DisplayProbe:
+    """Counts an engine's lines and times each pressure frame end to end."""
+
+    def __init__(self, engine: TelemetryEngine, board: SimBoard) -> None:
+        """Creates new probe and hooks it into the engine.
+
+        Subscribe the probe last so it times the other FRAMES subscribers.
+
+        Args:
+            engine(TelemetryEngine): the engine under test
+            board(SimBoard): the board that stamped the frames
+        """
+        self.board = board
+        self.latencies = []  # ns
+        self.seqs = []
+        self.lines = 0
+        self.handleBatch = engine.handleBatch
+        engine.handleBatch = self.countLines
+        engine.subscribe(FRAMES, self.frames)
+
+    def countLines(self, batch: list[tuple[int, str]]) -> None:
+        self.lines += len(batch)
+        self.handleBatch(batch)
+
+    def frames(self, stamps: list[int], frames: list) -> None:
+        now = time.perf_counter_ns()
+        sentAt = self.board.sentAt
+        for kind, values in frames:
+            if kind == PRESSURE_FRAME and len(values):
+                seq = int(values[0])
+                if seq in sentAt:
+                    self.seqs.append(seq)
+                    self.latencies.append(now - sentAt[seq])
+
+
+# FUNCTIONS ----------------------------------------------------------------------|
+def runOnce(app: QApplication | None, rate: float, channels: int, seconds: float) -> dict:
+    """Runs the window, or the engine alone, against a board at one rate.
+
+    Args:
+        app(QApplication | None): the running application, None for the engine alone
+        rate(float): pressure frames per second
+        channels(int): values per pressure frame
+        seconds(float): measurement length
+
+    Returns:
+        dict: measured results
+    """
+    board = SimBoard(rate, channels)
+    if app is None:
+        engine = config.createEngine()
+        probe = DisplayProbe(engine, board)
+        engine.begin()
+        board.start()
+        engine.open(SerialComm(board.port, gui.BAUDRATES[-1]))
+        start = time.perf_counter()
+        engine.run(until=lambda: time.perf_counter() - start >= seconds)
+        elapsed = time.perf_counter() - start
+        engine.shutdown()
+    else:
+        window = gui.RocketDisplayWindow()
+        probe = DisplayProbe(window.engine, board)
+        window.port, window.baud, window.serialSet = board.port, gui.BAUDRATES[-1], True
+
+        board.start()
+        window.toggleSerial()
+        start = time.perf_counter()
+        QTimer.singleShot(int(seconds * 1000), app.quit)
+        app.exec()
+        elapsed = time.perf_counter() - start
+        window.toggleSerial()
+        window.close()
+    board.stop()
+
+    seqs = np.array(probe.seqs)
+    latencies = np.array(probe.latencies) / 1e6
+    generated = board.seq
+    return {
+        "rate": rate,
+        "generated": generated,
+        "received": probe.lines,
+        "linesPerSec": probe.lines / elapsed,
+        # frames written before the port opened are not counted as dropped
+        "dropped": int(seqs.max() - seqs.min() + 1 - len(np.unique(seqs))) if len(seqs) else generated,
+        "backlog": generated - (int(seqs.max()) if len(seqs) else 0),
+        "p50": float(np.percentile(latencies, 50)) if len(latencies) else float("nan"),
+        "p99": float(np.percentile(latencies, 99)) if len(latencies) else float("nan"),
+    }
+
+
+def isolateLogs(directory: str) -> None:
+    """Points the engine's log files (still rotating daily) into a scratch directory."""
+    config.DATA_LOG_FILE = os.path.join(directory, "data-{DATE}.txt")
+    config.SYS_LOG_FILE = os.path.join(directory, "sys-{DATE}.txt")
+    config.BIN_LOG_FILE = os.path.join(directory, "data.bin")
+
+
+# MAIN ---------------------------------------------------------------------------|
+def main(argv: list[str] | None = None) -> int:
+    """Runs the benchmark for each requested rate."""
+    args = argparse.ArgumentParser(description="End-to-end GUI throughput benchmark.")
+    args.add_argument("--rate", type=float, nargs="+", default=[100, 500, 1000, 5000])
+    args.add_argument("--channels", type=int, default=8)
+    args.add_argument("--seconds", type=float, default=10)
+    args.add_argument("--headless", action="store_true", help="engine only, no window")
+    opts = args.parse_args(argv)
+
+    app = None if opts.headless else QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as scratch:
+        isolateLogs(scratch)
+        print(f"{'rate':>7} {'lines/s':>9} {'dropped':>8} {'backlog':>8} {'p50 ms':>8} {'p99 ms':>8}")
+        for rate in opts.rate:
+            result = runOnce(app, rate, opts.channels, opts.seconds)
+            print(
+                f"{result['rate']:>7g} {result['linesPerSec']:>9.0f} {result['dropped']:>8} "
+                f"{result['backlog']:>8} {result['p50']:>8.2f} {result['p99']:>8.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Parallel converter from daily text data logs to compressed NumPy datasets.
+
+Each log/data/<DATE>.txt (or compressed .txt.gz) becomes <out>/<DATE>.npz holding, per session n:
+    s<n>_pressure_time  int64 ms (DATE_TIME_FORMAT stamp, see utils.parseStamp)
+    s<n>_pressure       int32 (frames, channels) by channel number, MISSING if absent
+    s<n>_valve_time     int64 ms
+    s<n>_valve          int32 (frames, channels)
+plus "sessions", the session names. Files are converted one per worker
+process, reading each file as a stream in chunks of lines.
+
+loadDay is the reader for this layout, for analysis scripts:
+    from tools.convert import loadDay
+    for name, session in loadDay("log/npz/03-28-24.npz").items():
+        print(name, session["pressure_time"].shape, session["pressure"].max(axis=0))
+
+Usage:
+    python -m tools.convert [FILE | DIR ...] [--out DIR] [--workers N] [--bench]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from utils.config import ANALOG_MAP, PIN_READ_MAP, PRESSURE_SEP, PT, SV, VALVE_TAG
+from tools.logindex import logFiles
+from utils import (
+    CHANNELS,
+    GZ_SUFFIX,
+    MISSING,
+    PRESSURE_FRAME,
+    SESSION_TAG,
+    STAMP_LEN,
+    VALVE_FRAME,
+    FrameParser,
+    expandLines,
+    logName,
+    openLog,
+    parseStamp,
+)
+
+OUT_DIR = "./log/npz"
+CHUNK_LINES = 4096  # lines parsed per FrameParser batch
+KINDS = {PRESSURE_FRAME: "pressure", VALVE_FRAME: "valve"}
+
+
+# CLASSES ------------------------------------------------------------------------|
+class SessionColumns:
+    """Growing per-kind columns for one session."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.times = {kind: [] for kind in KINDS}
+        self.values = {kind: [] for kind in KINDS}
+
+    def add(self, parser: FrameParser, stamps: list[int], lines: list[str]) -> None:
+        """Parses a chunk of lines and appends their frames as channel rows.
+
+        Args:
+            parser(FrameParser): the frame parser
+            stamps(list[int]): stamp of each line
+            lines(list[str]): line payloads without stamps
+        """
+        frames = parser.parseIndexed(lines)
+        for kind in KINDS:
+            rows = [(stamps[p], values) for p, (k, values) in frames if k == kind]
+            if not rows:
+                continue
+            channels = parser.channels[kind]
+            block = np.full((len(rows), CHANNELS), MISSING, dtype=np.int32)
+            widths = {len(values) for _, values in rows}
+            if len(widths) == 1:
+                count = min(widths.pop(), len(channels))
+                block[:, channels[:count]] = np.stack([values[:count] for _, values in rows])
+            else:
+                for row, (_, values) in zip(block, rows):
+                    count = min(len(values), len(channels))
+                    row[channels[:count]] = values[:count]
+            self.times[kind].append(np.array([stamp for stamp, _ in rows], dtype=np.int64))
+            self.values[kind].append(block)
+
+    def arrays(self, prefix: str) -> dict[str, np.ndarray]:
+        """Returns the session's columns as named arrays."""
+        arrays = {}
+        for kind, name in KINDS.items():
+            times, values = self.times[kind], self.values[kind]
+            arrays[f"{prefix}_{name}_time"] = (
+                np.concatenate(times) if times else np.zeros(0, dtype=np.int64)
+            )
+            arrays[f"{prefix}_{name}"] = (
+                np.concatenate(values) if values else np.zeros((0, CHANNELS), dtype=np.int32)
+            )
+        return arrays
+
+
+# FUNCTIONS ----------------------------------------------------------------------|
+def convertFile(path: str, outDir: str) -> tuple[str, int, int]:
+    """Converts one text data log to a compressed .npz file.
+
+    Args:
+        path(str): the text log
+        outDir(str): directory for the .npz file
+
+    Returns:
+        tuple[str, int, int]: output path, bytes read, frames written
+    """
+    parser = FrameParser(ANALOG_MAP, PIN_READ_MAP, PT, SV, PRESSURE_SEP, VALVE_TAG)
+    sessions = [SessionColumns("")]
+    stamps, lines = [], []
+
+    def flush() -> None:
+        if lines:
+            sessions[-1].add(parser, stamps, lines)
+            stamps.clear()
+            lines.clear()
+
+    with openLog(path) as logFile:
+        for raw in expandLines(logFile):
+            if raw.startswith(SESSION_TAG):
+                flush()
+                sessions.append(SessionColumns(raw[len(SESSION_TAG):].decode(errors="replace").strip()))
+                continue
+            stamp = parseStamp(raw)
+            if stamp is None:
+                continue
+            payload = raw[STAMP_LEN:].decode(errors="replace").strip()
+            if not payload:
+                continue
+            stamps.append(stamp)
+            lines.append(payload)
+            if len(lines) >= CHUNK_LINES:
+                flush()
+    flush()
+
+    if not sessions[0].times[PRESSURE_FRAME] and not sessions[0].times[VALVE_FRAME]:
+        sessions = sessions[1:]  # nothing before the first session marker
+    arrays = {"sessions": np.array([session.name for session in sessions])}
+    frames = 0
+    for number, session in enumerate(sessions):
+        sessionArrays = session.arrays(f"s{number}")
+        frames += sum(len(a) for key, a in sessionArrays.items() if key.endswith("_time"))
+        arrays.update(sessionArrays)
+
+    outPath = os.path.join(outDir, logName(path) + ".npz")
+    np.savez_compressed(outPath, **arrays)
+    return outPath, os.path.getsize(path), frames
+
+
+def uniqueLogs(paths: list[str]) -> list[str]:
+    """Drops .txt logs whose .gz exists and checks every .npz name is used once.
+
+    A .txt next to its .gz is one compressLog has finished but not yet
+    removed, so both hold the same lines.
+
+    Args:
+        paths(list[str]): the text logs
+
+    Raises:
+        ValueError: if two logs would be written to the same .npz
+    """
+    paths = [path for path in paths if not os.path.exists(path + GZ_SUFFIX)]
+    names = Counter(logName(path) for path in paths)
+    duplicates = sorted(name + ".npz" for name, count in names.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"several logs would be written to {', '.join(duplicates)}")
+    return paths
+
+
+def convertAll(paths: list[str], outDir: str, workers: int) -> tuple[float, int, int]:
+    """Converts files in a process pool, one file per task.
+
+    Args:
+        paths(list[str]): the text logs
+        outDir(str): directory for the .npz files
+        workers(int): number of worker processes
+
+    Returns:
+        tuple[float, int, int]: seconds taken, bytes read, frames written
+
+    Raises:
+        ValueError: if two logs would be written to the same .npz
+    """
+    paths = uniqueLogs(paths)
+    os.makedirs(outDir, exist_ok=True)
+    # largest first so one big day does not finish last on its own
+    paths = sorted(paths, key=os.path.getsize, reverse=True)
+    start = time.perf_counter()
+    totalBytes = totalFrames = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for outPath, size, frames in pool.map(convertFile, paths, [outDir] * len(paths)):
+            totalBytes += size
+            totalFrames += frames
+    return time.perf_counter() - start, totalBytes, totalFrames
+
+
+def loadDay(path: str) -> dict[str, dict[str, np.ndarray]]:
+    """Loads a converted day as {session name: {column: array}}.
+
+    Columns are the s<n>_ arrays without their prefix: "pressure_time",
+    "pressure", "valve_time" and "valve".
+
+    Args:
+        path(str): the .npz file
+
+    Returns:
+        dict: session name to its columns, in session order
+    """
+    with np.load(path) as data:
+        return {
+            str(name): {
+                key.split("_", 1)[1]: data[key] for key in data.files if key.startswith(f"s{i}_")
+            }
+            for i, name in enumerate(data["sessions"])
+        }
+
+
+# MAIN ---------------------------------------------------------------------------|
+def main(argv: list[str] | None = None) -> int:
+    """Runs the command line tool."""
+    args = argparse.ArgumentParser(description="Convert text data logs to .npz datasets.")
+    args.add_argument("paths", nargs="*", default=["./log/data"])
+    args.add_argument("--out", default=OUT_DIR)
+    args.add_argument("--workers", type=int, default=os.cpu_count())
+    args.add_argument("--bench", action="store_true", help="time 1..--workers processes")
+    opts = args.parse_args(argv)
+
+    try:
+        paths = uniqueLogs(logFiles(opts.paths))
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+    if not paths:
+        print("no log files found", file=sys.stderr)
+        return 1
+
+    counts = [opts.workers]
+    if opts.bench:
+        counts = sorted({1, *(n for n in (2, 4, 8, 16) if n < opts.workers), opts.workers})
+    for workers in counts:
+        seconds, size, frames = convertAll(paths, opts.out, workers)
+        print(
+            f"{workers:>3} workers: {len(paths)} files, {size / 1e6:.1f} MB, "
+            f"{frames} frames in {seconds:.2f} s ({size / 1e6 / seconds:.1f} MB/s)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,346 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Sidecar indexer and time-range query tool for log/data and log/sys files.
+
+Every line written by the GUI starts with a DATE_TIME_FORMAT stamp
+("MM/dd/yyyy | hh:mm:ss:zzz -> "), and each run starts with "NEW SESSION:".
+The index (<file>.idx, JSON) keeps the session offsets and one
+(timestamp, byte offset, frame kinds) sample every STRIDE lines, so a query
+seeks close to its start time instead of scanning the whole file. Indexing
+is incremental: only bytes appended since the last run are read. Offsets
+are text offsets, so compressed .txt.gz logs are indexed and queried the
+same way, starting at the gzip frame nearest each offset. Query output
+has dedup run markers expanded back into the lines they stand for.
+
+Usage:
+    python -m tools.logindex index [FILE | DIR ...]
+    python -m tools.logindex sessions FILE
+    python -m tools.logindex query FILE --start 14:02 --end 14:05 [--channel PT2]
+    python -m tools.logindex compress FILE | DIR ...   (logs of past days)
+"""
+
+import argparse
+import bisect
+import calendar
+import json
+import os
+import sys
+import time
+
+from utils.config import ANALOG_MAP, PIN_READ_MAP, PRESSURE_SEP, PT, SV, VALVE_TAG
+from utils import (
+    DATE_FORMAT,
+    GZ_SUFFIX,
+    INDEX_SUFFIX,
+    LOG_SUFFIXES,
+    MAX_RUN_MS,
+    PRESSURE_FRAME,
+    SESSION_TAG,
+    STAMP_LEN,
+    VALVE_FRAME,
+    FrameParser,
+    compressLog,
+    expandLines,
+    logName,
+    openLog,
+    parseStamp,
+    runPayload,
+)
+
+INDEX_VERSION = 1
+STRIDE = 256  # lines between index samples
+LOG_DIRS = ("./log/data", "./log/sys", "./log/replay")
+
+# frame kinds seen in an index block (bit mask)
+KIND_PRESSURE = 1
+KIND_VALVE = 2
+KIND_EMPTY = 4
+KIND_OTHER = 8
+KIND_NAMES = {KIND_PRESSURE: "pressure", KIND_VALVE: "valve", KIND_EMPTY: "empty", KIND_OTHER: "other"}
+
+
+# FUNCTIONS ----------------------------------------------------------------------|
+def frameKind(payload: bytes) -> int:
+    """Returns the KIND_ bit for a line's payload (text after the stamp).
+
+    A dedup run marker counts as the kind of the line it repeats.
+
+    Args:
+        payload(bytes): the line without its stamp
+    """
+    repeated = runPayload(payload)
+    payload = (payload if repeated is None else repeated).strip()
+    if not payload:
+        return KIND_EMPTY
+    if VALVE_TAG.encode() in payload:
+        return KIND_VALVE
+    if PRESSURE_SEP.encode() in payload:
+        return KIND_PRESSURE
+    return KIND_OTHER
+
+
+def clockToMs(day: int, clock: str) -> int:
+    """Converts "hh:mm[:ss[.zzz]]" on a day (ms at midnight) to ms.
+
+    Args:
+        day(int): ms at midnight of the day
+        clock(str): the time of day
+    """
+    seconds, _, millis = clock.partition(".")
+    parts = [int(part) for part in seconds.split(":")] + [0, 0]
+    hours, minutes, secs = parts[:3]
+    return day + ((hours * 60 + minutes) * 60 + secs) * 1000 + int(millis.ljust(3, "0")[:3] or 0)
+
+
+def indexPath(path: str) -> str:
+    """Returns the sidecar index path for a log file."""
+    return path + INDEX_SUFFIX
+
+
+def emptyIndex() -> dict:
+    """Returns a new index with nothing indexed."""
+    return {
+        "version": INDEX_VERSION,
+        "size": 0,  # bytes indexed (always ends on a complete line)
+        "lines": 0,
+        "head": "",  # first line of the file, to detect replaced files
+        "sessions": [],  # [offset, session name]
+        "samples": [],  # [stamp ms, offset, kinds in block]
+    }
+
+
+def loadIndex(path: str) -> dict:
+    """Loads a file's index, or returns an empty one if missing or stale.
+
+    Args:
+        path(str): the log file
+    """
+    try:
+        with open(indexPath(path)) as indexFile:
+            index = json.load(indexFile)
+    except (OSError, ValueError):
+        return emptyIndex()
+    if index.get("version") != INDEX_VERSION:
+        return emptyIndex()
+    if not path.endswith(GZ_SUFFIX) and index["size"] > os.path.getsize(path):
+        return emptyIndex()
+    with openLog(path) as logFile:
+        if logFile.readline().decode(errors="replace") != index["head"]:
+            return emptyIndex()
+    return index
+
+
+def updateIndex(path: str) -> dict:
+    """Indexes bytes appended since the last update and saves the index.
+
+    Args:
+        path(str): the log file
+
+    Returns:
+        dict: the up to date index
+    """
+    index = loadIndex(path)
+    samples = index["samples"]
+    sessions = index["sessions"]
+    offset = index["size"]
+    lines = index["lines"]
+
+    if offset == 0:
+        with openLog(path) as logFile:
+            index["head"] = logFile.readline().decode(errors="replace")
+    with openLog(path, offset) as logFile:
+        for line in logFile:
+            if not line.endswith(b"\n"):
+                break  # partial line still being written
+            stamp = parseStamp(line)
+            if line.startswith(SESSION_TAG):
+                sessions.append([offset, line[len(SESSION_TAG):].decode(errors="replace").strip()])
+            elif stamp is not None:
+                kind = frameKind(line[STAMP_LEN:])
+                if lines % STRIDE == 0 or not samples:
+                    samples.append([stamp, offset, kind])
+                else:
+                    samples[-1][2] |= kind
+            offset += len(line)
+            lines += 1
+
+    index["size"] = offset
+    index["lines"] = lines
+    with open(indexPath(path), "w") as indexFile:
+        json.dump(index, indexFile)
+    return index
+
+
+def logFiles(paths: list[str]) -> list[str]:
+    """Expands directories into the .txt and .txt.gz log files they contain."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(
+                os.path.join(path, name) for name in os.listdir(path) if name.endswith(LOG_SUFFIXES)
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def query(path: str, start: int, end: int, kinds: int = 0):
+    """Yields (stamp ms, line) for stamped lines with start <= stamp <= end.
+
+    Dedup run markers are logged after the lines they stand for, at the
+    latest with the first batch logged MAX_RUN_MS after the run started,
+    so reading continues until that batch.
+
+    Args:
+        path(str): the log file
+        start(int): first stamp in ms
+        end(int): last stamp in ms
+        kinds(int): KIND_ mask of frame kinds to include, 0 for all
+
+    Assumes stamps only move forward within a file.
+    """
+    for line in expandLines(readBlocks(path, start, end + MAX_RUN_MS, kinds)):
+        stamp = parseStamp(line)
+        if stamp is None or stamp < start:
+            continue
+        if stamp > end:
+            return
+        if kinds and not frameKind(line[STAMP_LEN:]) & kinds:
+            continue
+        yield stamp, line.decode(errors="replace").rstrip("\r\n")
+
+
+def readBlocks(path: str, start: int, end: int, kinds: int = 0):
+    """Yields the raw lines of the index blocks covering start to end, and
+    the lines of the first ms stamped after end.
+
+    Args:
+        path(str): the log file
+        start(int): first stamp in ms
+        end(int): last stamp in ms
+        kinds(int): KIND_ mask, blocks without any of these kinds are skipped
+    """
+    index = updateIndex(path)
+    samples = index["samples"]
+    if not samples:
+        return
+    stamps = [sample[0] for sample in samples]
+    first = max(0, bisect.bisect_left(stamps, start) - 1)
+
+    logFile = None
+    position = -1  # text offset logFile is at
+    after = None  # first stamp past end
+    try:
+        for block in range(first, len(samples)):
+            if kinds and not samples[block][2] & kinds:
+                continue
+            if samples[block][1] != position:
+                if logFile:
+                    logFile.close()
+                position = samples[block][1]
+                logFile = openLog(path, position)
+            stop = samples[block + 1][1] if block + 1 < len(samples) else index["size"]
+            while position < stop:
+                line = logFile.readline()
+                if not line:
+                    break
+                position += len(line)
+                stamp = parseStamp(line)
+                if stamp is not None and stamp > end:
+                    if after is None:
+                        after = stamp
+                    elif stamp > after:
+                        return
+                yield line
+    finally:
+        if logFile:
+            logFile.close()
+
+
+def dayOf(path: str, index: dict) -> int:
+    """Returns ms at midnight of the day a log file covers.
+
+    Uses the MM-dd-yy file name, falling back to the first indexed stamp.
+    """
+    name = logName(path)[:8]
+    try:
+        month, day, year = (int(part) for part in name.split("-"))
+        return calendar.timegm((2000 + year, month, day, 0, 0, 0)) * 1000
+    except ValueError:
+        if not index["samples"]:
+            return 0
+        first = index["samples"][0][0]
+        return first - first % 86_400_000
+
+
+# MAIN ---------------------------------------------------------------------------|
+def main(argv: list[str] | None = None) -> int:
+    """Runs the command line tool."""
+    args = argparse.ArgumentParser(description="Index and query GUI log files.")
+    commands = args.add_subparsers(dest="command", required=True)
+
+    indexCmd = commands.add_parser("index", help="build or update sidecar indexes")
+    indexCmd.add_argument("paths", nargs="*", default=list(LOG_DIRS))
+
+    sessionsCmd = commands.add_parser("sessions", help="list sessions in a log file")
+    sessionsCmd.add_argument("path")
+
+    queryCmd = commands.add_parser("query", help="print lines in a time range")
+    queryCmd.add_argument("path")
+    queryCmd.add_argument("--start", required=True, help="hh:mm[:ss[.zzz]]")
+    queryCmd.add_argument("--end", required=True, help="hh:mm[:ss[.zzz]]")
+    queryCmd.add_argument("--channel", help="only print this channel, e.g. PT2 or SV3")
+    queryCmd.add_argument("--kind", choices=["pressure", "valve"], help="only this frame kind")
+
+    compressCmd = commands.add_parser("compress", help="compress .txt logs of past days")
+    compressCmd.add_argument("paths", nargs="+", help="files or directories, e.g. log/data")
+    opts = args.parse_args(argv)
+
+    if opts.command == "compress":
+        today = time.strftime(DATE_FORMAT)
+        for path in logFiles(opts.paths):
+            if path.endswith(GZ_SUFFIX) or logName(path).startswith(today):
+                continue
+            size = os.path.getsize(path)
+            target = compressLog(path)
+            print(f"{path}: {size} -> {os.path.getsize(target)} bytes")
+        return 0
+
+    if opts.command == "index":
+        for path in logFiles(opts.paths):
+            index = updateIndex(path)
+            print(f"{path}: {index['lines']} lines, {len(index['sessions'])} sessions")
+        return 0
+
+    if opts.command == "sessions":
+        for offset, name in updateIndex(opts.path)["sessions"]:
+            print(f"{offset:>12}  {name}")
+        return 0
+
+    index = updateIndex(opts.path)
+    day = dayOf(opts.path, index)
+    start, end = clockToMs(day, opts.start), clockToMs(day, opts.end)
+    kinds = {"pressure": KIND_PRESSURE, "valve": KIND_VALVE}.get(opts.kind, 0)
+
+    if not opts.channel:
+        for _, line in query(opts.path, start, end, kinds):
+            print(line)
+        return 0
+
+    parser = FrameParser(ANALOG_MAP, PIN_READ_MAP, PT, SV, PRESSURE_SEP, VALVE_TAG)
+    kind = VALVE_FRAME if opts.channel.startswith(SV) else PRESSURE_FRAME
+    if opts.channel not in parser.names[kind]:
+        print(f"unknown channel {opts.channel}", file=sys.stderr)
+        return 1
+    position = parser.names[kind].index(opts.channel)
+    mask = KIND_VALVE if kind == VALVE_FRAME else KIND_PRESSURE
+    for _, line in query(opts.path, start, end, mask):
+        frame = parser.parse(line[STAMP_LEN:])
+        if frame and frame[0] == kind and position < len(frame[1]):
+            print(f"{line[:STAMP_LEN]}{opts.channel} {frame[1][position]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
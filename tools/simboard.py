@@ -0,0 +1,167 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Simulated avionics board on a pseudo-terminal (POSIX only).
+
+Emits pressure frames ("n,    n, ...", PRESSURE_SEP) and valve-state frames
+(VALVE_TAG + one digit per pin) at configurable rates, and answers toggle,
+abort and main-valve commands with an immediate valve-state frame, like
+the real board. The first pressure value of every frame is a sequence
+number so a reader can detect dropped lines; the board remembers when each
+sequence number was written.
+
+Usage:
+    python -m tools.simboard --rate 1000 --channels 8
+    (prints the pty path; open it with SerialComm or a terminal)
+"""
+
+import argparse
+import os
+import random
+import select
+import sys
+import threading
+import time
+import tty
+
+from utils.config import ABORT_CMD, MAINVALVE_CMD, PIN_MAP, PRESSURE_SEP, VALVE_TAG
+
+TICK = 0.001  # scheduler resolution (s)
+VALVES = len(PIN_MAP)
+MAIN_PINS = (PIN_MAP[7], PIN_MAP[8])  # SV8/SV9 (nitro and fuel main)
+
+
+# CLASSES ------------------------------------------------------------------------|
+class SimBoard:
+    """Fake board that writes telemetry into a pty and reads commands from it."""
+
+    def __init__(self, rate: float = 100, channels: int = 8, valveRate: float = 10) -> None:
+        """Creates new simulated board on a fresh pty.
+
+        Args:
+            rate(float): pressure frames per second
+            channels(int): values per pressure frame
+            valveRate(float): valve-state frames per second
+        """
+        self.rate = rate
+        self.channels = channels
+        self.valveRate = valveRate
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.slave)
+        self.port = os.ttyname(self.slave)
+
+        self.valves = [0] * VALVES
+        self.pressure = [random.randint(0, 500) for _ in range(channels - 1)]
+        self.seq = 0
+        self.sentAt = {}  # seq -> perf_counter_ns when written
+        self.commands = []  # (perf_counter_ns, command) received
+        self.program = True
+        self.thread = threading.Thread(target=self.run, name="SimBoard", daemon=True)
+
+    def start(self) -> None:
+        """Starts emitting in a background thread."""
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stops emitting and closes the pty."""
+        self.program = False
+        self.thread.join(1)
+        os.close(self.master)
+        os.close(self.slave)
+
+    def pressureFrame(self) -> bytes:
+        """Returns the next pressure frame, recording when it was made."""
+        self.seq += 1
+        for i in range(len(self.pressure)):
+            self.pressure[i] = max(0, self.pressure[i] + random.randint(-2, 2))
+        values = [self.seq] + self.pressure
+        self.sentAt[self.seq] = time.perf_counter_ns()
+        return (PRESSURE_SEP.join(f"{value:>4}" for value in values) + "\n").encode()
+
+    def valveFrame(self) -> bytes:
+        """Returns the current valve-state frame."""
+        return (VALVE_TAG + "".join(str(state) for state in self.valves) + "\n").encode()
+
+    def handleCommand(self, command: str) -> None:
+        """Applies a toggle, abort or main-valve command.
+
+        Args:
+            command(str): the command line without its LF
+        """
+        self.commands.append((time.perf_counter_ns(), command))
+        if command.startswith(ABORT_CMD):
+            self.valves = [0] * VALVES
+            return
+        if command.startswith(MAINVALVE_CMD):
+            for pin in MAIN_PINS:
+                self.valves[pin - 1] = 1
+            return
+        for char in command:
+            if char.isdigit() and char != "0" and int(char) <= VALVES:
+                self.valves[int(char) - 1] ^= 1
+
+    def readCommands(self, pending: bytearray) -> bool:
+        """Reads any incoming commands without blocking.
+
+        Args:
+            pending(bytearray): partial command carried between calls
+
+        Returns:
+            bool: True if a command changed the valve state
+        """
+        handled = False
+        while select.select([self.master], [], [], 0)[0]:
+            pending += os.read(self.master, 1024)
+            while b"\n" in pending:
+                line, _, rest = bytes(pending).partition(b"\n")
+                pending[:] = rest
+                self.handleCommand(line.decode(errors="replace").strip())
+                handled = True
+        return handled
+
+    def run(self) -> None:
+        """Emits frames on schedule until stopped."""
+        start = time.perf_counter()
+        pressureSent = valveSent = 0
+        pending = bytearray()
+        while self.program:
+            elapsed = time.perf_counter() - start
+            out = bytearray()
+            if self.readCommands(pending):
+                out += self.valveFrame()
+            while pressureSent < elapsed * self.rate:
+                out += self.pressureFrame()
+                pressureSent += 1
+            while valveSent < elapsed * self.valveRate:
+                out += self.valveFrame()
+                valveSent += 1
+            if out:
+                try:
+                    os.write(self.master, out)
+                except OSError:
+                    return
+            time.sleep(TICK)
+
+
+# MAIN ---------------------------------------------------------------------------|
+def main(argv: list[str] | None = None) -> int:
+    """Runs a simulated board until interrupted."""
+    args = argparse.ArgumentParser(description="Simulated avionics board on a pty.")
+    args.add_argument("--rate", type=float, default=100, help="pressure frames per second")
+    args.add_argument("--channels", type=int, default=8, help="values per pressure frame")
+    args.add_argument("--valve-rate", type=float, default=10, help="valve frames per second")
+    opts = args.parse_args(argv)
+
+    board = SimBoard(opts.rate, opts.channels, opts.valve_rate)
+    board.start()
+    print(f"simulated board on {board.port} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        board.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
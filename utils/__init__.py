@@ -1,5 +1,22 @@
 # utils for rocket gui
+# Qt widget modules (styling, clock, render, labels, plots, monitor) are not
+# imported here, so the engine, headless.py and the log tools run without
+# PyQt6; main.py imports them itself.
 
 from .gui_serial import *  # serial
-from .styling import *  # styling/colors
-from .clock import Clock # clock
+from .logger import DATE_FORMAT, LogWriter  # buffered log files
+from .parser import *  # telemetry frames
+from .binlog import *  # binary telemetry log
+from .ringbuffer import RingBuffer  # plot buffers
+from .commands import *  # outgoing command queue
+from .thresholds import *  # pressure bands
+from .logfiles import *  # text log helpers
+from .replay import ReplayComm  # log replay source
+from .instrument import *  # hot path timings
+from .timebase import Timebase  # sample stamps
+from .rates import RateEstimator  # PSI/MIN slopes
+from .decay import DecayTest  # leak test
+from .pyramid import MinMaxPyramid  # plot history
+from .dedup import *  # log line compaction
+from .engine import *  # headless telemetry core
+from .config import *  # channel maps, log paths, createEngine
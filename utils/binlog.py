@@ -0,0 +1,145 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Compact binary telemetry recorder and memory-mapped reader.
+
+File layout: a 16 byte header (magic, channel count) followed by fixed-width
+records of (time int64 ns since epoch, kind uint8, values int32[channels]).
+Records are only ever appended, so a file can be memory-mapped while it is
+still being written; a partially written tail record is ignored.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from .logger import LogWriter
+from .parser import MISSING, PRESSURE_FRAME, VALVE_FRAME
+
+MAGIC = b"LRPTLM01"
+HEADER = struct.Struct("<8sII")  # magic, channels, reserved
+CHANNELS = 9
+VALUE_MIN = MISSING + 1  # MISSING is int32 min
+VALUE_MAX = np.iinfo(np.int32).max
+
+
+def recordDtype(channels: int = CHANNELS) -> np.dtype:
+    """Returns the packed record layout for a channel count.
+
+    Args:
+        channels(int): number of value columns per record
+
+    Returns:
+        np.dtype: the structured record dtype
+    """
+    return np.dtype([("time", "<i8"), ("kind", "u1"), ("values", "<i4", (channels,))])
+
+
+# CLASSES ------------------------------------------------------------------------|
+class BinaryRecorder:
+    """Appends parsed telemetry frames to a binary log from a background thread.
+
+    A path with "{DATE}" starts a new file (with its own header) on the
+    first record of each day.
+    """
+
+    def __init__(self, path: str, channels: int = CHANNELS) -> None:
+        """Creates new binary recorder, writing the header to new files.
+
+        Args:
+            path(str): the file to append to, "{DATE}" is replaced by the date
+            channels(int): number of value columns per record
+
+        Raises:
+            OSError: if the file cannot be opened
+        """
+        self.channels = channels
+        self.dtype = recordDtype(channels)
+        self.record = np.zeros(1, dtype=self.dtype)
+        self.writer = LogWriter(path, binary=True, header=HEADER.pack(MAGIC, channels, 0))
+        self.clipped = 0  # values outside the int32 range, saturated
+
+    def recordFrame(
+        self,
+        kind: int,
+        values: np.ndarray,
+        channels: np.ndarray,
+        timestamp: int,
+    ) -> None:
+        """Queues a frame as one fixed-width record.
+
+        Values outside the int32 range are saturated to its limits (and
+        counted in self.clipped) rather than wrapped.
+
+        Args:
+            kind(int): PRESSURE_FRAME or VALVE_FRAME
+            values(np.ndarray): the frame's values
+            channels(np.ndarray): channel index (0 based) of each value
+            timestamp(int): ns since epoch the frame was read at
+        """
+        record = self.record
+        record["time"] = timestamp
+        record["kind"] = kind
+        row = record["values"][0]
+        row.fill(MISSING)
+        count = min(len(values), len(channels))
+        values = values[:count]
+        if count and (values.min() < VALUE_MIN or values.max() > VALUE_MAX):
+            present = values != MISSING
+            self.clipped += int(np.count_nonzero(present & ((values < VALUE_MIN) | (values > VALUE_MAX))))
+            values = np.where(present, np.clip(values, VALUE_MIN, VALUE_MAX), MISSING)
+        row[channels[:count]] = values
+        self.writer.write(record.tobytes(), stamp=timestamp // 1_000_000)
+
+    @property
+    def path(self) -> str:
+        """The file being written."""
+        return self.writer.path
+
+    def close(self) -> None:
+        """Writes out queued records and closes the file."""
+        self.writer.close()
+
+
+# FUNCTIONS ----------------------------------------------------------------------|
+def readRecords(path: str) -> np.memmap:
+    """Memory-maps a binary log as a structured record array.
+
+    Args:
+        path(str): the binary log file
+
+    Returns:
+        np.memmap: records with "time", "kind" and "values" fields
+
+    Raises:
+        ValueError: if the file is not a binary telemetry log
+    """
+    with open(path, "rb") as logFile:
+        header = logFile.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path}: missing binary log header")
+    magic, channels, _ = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a binary telemetry log")
+
+    dtype = recordDtype(channels)
+    count = (os.path.getsize(path) - HEADER.size) // dtype.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=HEADER.size, shape=(count,))
+
+
+def readChannels(path: str, kind: int = PRESSURE_FRAME) -> tuple[np.ndarray, np.ndarray]:
+    """Returns timestamps and values of one frame kind from a binary log.
+
+    Args:
+        path(str): the binary log file
+        kind(int): PRESSURE_FRAME or VALVE_FRAME
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: int64 ns timestamps, (n, channels) int32 values
+    """
+    records = readRecords(path)
+    selected = records[records["kind"] == kind]
+    return selected["time"], selected["values"]
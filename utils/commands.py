@@ -0,0 +1,70 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Non-blocking priority queue for outgoing serial commands.
+"""
+
+import itertools
+import time
+from collections import deque
+from typing import NamedTuple
+
+
+class Command(NamedTuple):
+    """A queued outgoing command."""
+
+    seq: int  # order of submission, starting at 1
+    message: str
+    urgent: bool
+    enqueued: int  # perf_counter_ns at submission
+
+
+# CLASSES ------------------------------------------------------------------------|
+class CommandQueue:
+    """Two-level FIFO command queue shared by the GUI and the serial thread.
+
+    deque.append/popleft and itertools.count are atomic in CPython, so
+    neither side ever takes a lock or waits on the other. Urgent commands
+    (abort, main valves) are always taken before normal ones.
+    """
+
+    def __init__(self) -> None:
+        """Creates new empty command queue."""
+        self.urgent = deque()
+        self.normal = deque()
+        self.counter = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self.urgent) + len(self.normal)
+
+    def put(self, message: str, urgent: bool = False) -> int:
+        """Queues a command without blocking.
+
+        Args:
+            message(str): the command to write
+            urgent(bool): jump ahead of all normal commands
+
+        Returns:
+            int: the command's sequence number
+        """
+        command = Command(next(self.counter), message, urgent, time.perf_counter_ns())
+        if urgent:
+            self.urgent.append(command)
+        else:
+            self.normal.append(command)
+        return command.seq
+
+    def get(self) -> Command | None:
+        """Takes the next command, urgent ones first.
+
+        Returns:
+            Command | None: the next command, or None if the queue is empty
+        """
+        try:
+            return self.urgent.popleft()
+        except IndexError:
+            pass
+        try:
+            return self.normal.popleft()
+        except IndexError:
+            return None
@@ -0,0 +1,131 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Launch control configuration shared by the GUI, headless mode and log tools.
+
+Channel maps, command characters, log paths and the telemetry engine
+they configure. Nothing here imports Qt.
+"""
+
+import time
+
+from .binlog import BinaryRecorder
+from .decay import DecayTest
+from .dedup import LineCompactor
+from .engine import LaunchCommands, TelemetryEngine
+from .logger import LogWriter
+from .parser import PRESSURE_FRAME, FrameParser
+from .rates import RateEstimator
+
+# CONSTANTS ----------------------------------------------------------------------|
+
+LAUNCH_STATES = ("IDLE", "SYSTEM CHECKS", "HIGH PRESSURE", "TANK HIGH PRESSURE", "FIRE")
+LEAK_ACCEPT_RATE = 1.0  # PSI/MIN, faster pressure decay fails the leak check
+LEAK_RATE_WINDOW_SECONDS = 60  # samples the PSI/MIN slope is fitted over
+
+# Safety Thresholds
+# PTs: (low, mid, high) PSI - green from low, yellow from mid, red from high or
+# below low. Each PT is listed so its limits can be tuned on its own.
+PRESS_LIMITS = {
+    "PT1": (-1000, 400, 501),
+    "PT2": (-1000, 400, 501),  # fuel
+    "PT3": (-1000, 400, 501),  # ox
+    "PT4": (-1000, 400, 501),
+}
+PRESS_LIMITS_DEFAULT = (-1000, 400, 501)  # PTs not listed above
+
+# Channel names
+SV = "SV"
+PT = "PT"
+
+# Decay test
+DT_ITERS = 5
+DT_ITER_LEN_SECONDS = 60
+
+# Pins
+# PIN MAP ##########################
+PIN_MAP = [1, 2, 3, 4, 5, 6, 8, 7 , 9]#range(1, 10)#[9, 5, 7, 6, 2, 1, 8, 3, 4]
+PIN_READ_MAP = {str(x): str(i + 1) for i, x in enumerate(PIN_MAP)}
+
+# ANALOG (PT) MAP ##################
+# ANALOG_MAP[1] == num of second analog reading == 3 in [1, 3, 2, 4]
+ANALOG_MAP = [1, 3, 2, 4, 5, 6, 7, 8, 9]
+ACTIVE_PTS = ["PT1", "PT2", "PT3"]
+
+# COMMAND CHARS ####################
+ABORT_CMD = "a"
+MAINVALVE_CMD = "m"
+IGNITE_CMD = "i"
+URGENT_CMDS = (ABORT_CMD, MAINVALVE_CMD)  # sent ahead of queued commands
+DURABLE_CMDS = (ABORT_CMD, MAINVALVE_CMD, IGNITE_CMD)  # sys log lines fsynced at once
+COMMAND_LEN = 8
+
+# Frames
+PRESSURE_TAG = ""  # no tag rn
+PRESSURE_SEP = ", "
+VALVE_TAG = "PS"
+#VALVE_SEP = " "
+
+# Files
+DATE = time.strftime("%m-%d-%y")
+START_TIME = time.strftime("%m-%d-%y-%H-%M")
+# logs rotate to a new {DATE} file at midnight, text logs also at LOG_MAX_BYTES
+DATA_LOG_FILE = "./log/data/{DATE}.txt"
+SYS_LOG_FILE = "./log/sys/{DATE}.txt"
+BIN_LOG_FILE = "./log/bin/{DATE}.bin"
+REPLAY_LOG_FILE = "./log/replay/{DATE}.txt"  # data log while replaying a recording
+LOG_MAX_BYTES = 256 * 1024 * 1024
+COMPRESS_LOGS = True  # gzip files closed by rotation (tools read .txt.gz directly)
+BINARY_LOG = False  # also record parsed frames to BIN_LOG_FILE
+DEDUP = True  # log blank lines and unchanged valve frames as run markers
+DEDUP_FLUSH_SECONDS = 5  # longest run before its marker is logged
+
+# Diagnostics
+PROFILE = False  # per-stage timing histograms, also enabled by --profile
+PROFILE_INTERVAL_SECONDS = 10  # how often timings are written to the sys log
+ENGINE_TICK_SECONDS = 0.1  # longest wait between engine polls (timers)
+
+# Display
+PLOT_RENDER_RATE = 30  # plot/PSI label repaints per second
+
+
+# FUNCTIONS ----------------------------------------------------------------------|
+def createLog(path: str, session: str) -> LogWriter:
+    """Creates a rotating text log whose continuation files restate the session.
+
+    Args:
+        path(str): the log path, with {DATE} for daily files
+        session(str): this session's NEW SESSION line
+    """
+    return LogWriter(
+        path,
+        maxBytes=LOG_MAX_BYTES,
+        compress=COMPRESS_LOGS,
+        header=session + " (continued)",
+    )
+
+
+def createEngine(replay: str | None = None, replaySpeed: float = 1.0) -> TelemetryEngine:
+    """Creates the telemetry engine with the configuration above.
+
+    Args:
+        replay(str | None): data log being replayed, which logs to REPLAY_LOG_FILE
+        replaySpeed(float): replay speed factor
+    """
+    session = "NEW SESSION: " + START_TIME
+    if replay:
+        session += f" (REPLAY {replay} x{replaySpeed:g})"
+    parser = FrameParser(ANALOG_MAP, PIN_READ_MAP, PT, SV, PRESSURE_SEP, VALVE_TAG)
+    names = parser.names[PRESSURE_FRAME]
+    return TelemetryEngine(
+        parser,
+        createLog(SYS_LOG_FILE, session),
+        createLog(REPLAY_LOG_FILE if replay else DATA_LOG_FILE, session),
+        session,
+        LaunchCommands(ABORT_CMD, IGNITE_CMD, MAINVALVE_CMD, URGENT_CMDS, DURABLE_CMDS, COMMAND_LEN),
+        LAUNCH_STATES,
+        {name: RateEstimator(LEAK_RATE_WINDOW_SECONDS) for name in names},
+        DecayTest(ACTIVE_PTS, names, LEAK_ACCEPT_RATE),
+        LineCompactor(VALVE_TAG, DEDUP_FLUSH_SECONDS) if DEDUP else None,
+        BinaryRecorder(BIN_LOG_FILE) if BINARY_LOG and not replay else None,
+    )
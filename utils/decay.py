@@ -0,0 +1,154 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Pressure decay (leak) test over every parsed PT sample.
+"""
+
+import json
+
+import numpy as np
+
+from .parser import MISSING, PRESSURE_FRAME
+
+CI_Z = 1.96  # 95% confidence interval, normal approximation
+MIN_SAMPLES = 4  # fewer samples than this give no fit
+
+# verdicts
+PASS = "pass"
+FAIL = "fail"
+INCONCLUSIVE = "inconclusive"  # the confidence interval straddles the accept rate
+
+
+# CLASSES ------------------------------------------------------------------------|
+class DecayTest:
+    """Accumulates stamped PT readings and fits a decay slope per channel.
+
+    The fit is an ordinary least-squares line in PSI vs minutes, with the
+    slope's standard error taken from np.polyfit's covariance. A channel
+    passes when even the fastest loss in the slope's 95% confidence interval
+    is within the accept rate, fails when even the slowest is not, and is
+    inconclusive otherwise (too few or too noisy samples to tell).
+    """
+
+    def __init__(self, channels: list[str], names: list[str], acceptRate: float) -> None:
+        """Creates new decay test.
+
+        Args:
+            channels(list[str]): the PTs under test
+            names(list[str]): channel name of each pressure frame position
+            acceptRate(float): allowed pressure loss in PSI/MIN
+        """
+        self.channels = channels
+        self.positions = np.array([names.index(name) for name in channels])
+        self.width = self.positions.max() + 1
+        self.acceptRate = acceptRate
+        self.stamps = []  # monotonic ns per frame
+        self.rows = []  # readings of self.channels per frame
+        self.startWall = None
+
+    def __len__(self) -> int:
+        return len(self.stamps)
+
+    def start(self, wallMs: int) -> None:
+        """Clears samples and starts a new run.
+
+        Args:
+            wallMs(int): wall time of the start, for the result record
+        """
+        self.stamps.clear()
+        self.rows.clear()
+        self.startWall = wallMs
+
+    def add(self, stamps: list[int], frames: list[tuple[int, np.ndarray]]) -> None:
+        """Adds the pressure frames of a parsed batch.
+
+        Args:
+            stamps(list[int]): monotonic ns each frame's line was read at
+            frames(list): parsed (kind, values) frames
+        """
+        for stamp, (kind, values) in zip(stamps, frames):
+            if kind != PRESSURE_FRAME:
+                continue
+            if len(values) < self.width:
+                values = np.pad(values, (0, self.width - len(values)), constant_values=MISSING)
+            self.stamps.append(stamp)
+            self.rows.append(values[self.positions])
+
+    def fit(self) -> dict:
+        """Fits every channel's samples so far.
+
+        Returns:
+            dict: channel name to its fit record
+        """
+        fits = {}
+        if not self.stamps:
+            return {name: self.fitChannel(np.empty(0), np.empty(0)) for name in self.channels}
+        stamps = np.array(self.stamps, dtype=np.int64)
+        minutes = (stamps - stamps[0]) / 60e9
+        rows = np.array(self.rows, dtype=np.int64)
+        for column, name in enumerate(self.channels):
+            readings = rows[:, column]
+            valid = readings != MISSING
+            fits[name] = self.fitChannel(minutes[valid], readings[valid])
+        return fits
+
+    def fitChannel(self, minutes: np.ndarray, readings: np.ndarray) -> dict:
+        """Returns the fit record of one channel.
+
+        Args:
+            minutes(np.ndarray): sample times in minutes
+            readings(np.ndarray): readings in PSI
+        """
+        record = {
+            "samples": int(len(readings)),
+            "slope": None,
+            "ci95": None,
+            "verdict": INCONCLUSIVE,
+            "pass": False,
+        }
+        if len(readings) < MIN_SAMPLES or np.ptp(minutes) <= 0:
+            return record
+        (slope, _), cov = np.polyfit(minutes, readings.astype(np.float64), 1, cov=True)
+        margin = CI_Z * float(np.sqrt(max(cov[0, 0], 0.0)))
+        record.update(
+            slope=round(float(slope), 3),
+            ci95=[round(float(slope) - margin, 3), round(float(slope) + margin, 3)],
+            startPsi=int(readings[0]),
+            endPsi=int(readings[-1]),
+            minutes=round(float(minutes[-1] - minutes[0]), 3),
+        )
+        low, high = record["ci95"]
+        if -low <= self.acceptRate:
+            record["verdict"] = PASS
+        elif -high > self.acceptRate:
+            record["verdict"] = FAIL
+        record["pass"] = record["verdict"] == PASS
+        return record
+
+    def result(self, completed: bool = True) -> dict:
+        """Returns the structured result of the run.
+
+        Args:
+            completed(bool): False if the test was stopped early
+        """
+        fits = self.fit()
+        verdicts = {fit["verdict"] for fit in fits.values()}
+        verdict = FAIL if FAIL in verdicts else INCONCLUSIVE if INCONCLUSIVE in verdicts else PASS
+        return {
+            "test": "decay",
+            "start": self.startWall,
+            "completed": completed,
+            "acceptRate": self.acceptRate,
+            "channels": fits,
+            "verdict": verdict,
+            "pass": completed and verdict == PASS,
+        }
+
+    @staticmethod
+    def report(result: dict) -> str:
+        """Returns a result as one JSON log line.
+
+        Args:
+            result(dict): a record from result()
+        """
+        return "Decay Test result: " + json.dumps(result, separators=(",", ":"))
@@ -0,0 +1,254 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Blank line and repeated valve frame compaction for the data log.
+
+Blank lines, and valve-state frames equal to the last one forwarded, are
+not forwarded (logged, parsed or displayed). Each run of them is logged
+as one marker line when it ends, e.g.
+
+    02/29/2024 | 12:54:36:005 -> ~ unchanged x3 since -180 ms: 0,60,60:1 | PS000000000
+
+which stands for the payload after " | " received 3 times: 180 ms before
+the marker's stamp, then each item's ms after the previous one. ":k" is
+the line's position among all lines received in that ms, when not 0.
+expandLines restores the exact original lines from a log.
+"""
+
+import bisect
+import re
+from typing import Iterable, Iterator
+
+from .logfiles import STAMP_LEN, formatStamp, parseStamp
+
+RUN_TAG = "~ unchanged x"
+RUN_SECONDS = 5  # default longest run before its marker is written
+MAX_RUN_SECONDS = 10  # limit expandLines relies on, do not raise
+MAX_RUN_MS = MAX_RUN_SECONDS * 1000
+
+_MARKER = re.compile(rb"~ unchanged x(\d+) since -(\d+) ms: ([\d,:]+) \| ?(.*)")
+
+
+# CLASSES ------------------------------------------------------------------------|
+class LineCompactor:
+    """Suppresses blank lines and unchanged valve frames, logging runs of them.
+
+    A valve frame that differs from the last one is forwarded at once and
+    ends the previous frame's run. Runs are also ended once they are
+    flushSeconds old (checked as each line arrives) and by flush(). A
+    marker is logged with the stamp of the line that ended its run, before
+    that line, so every run starts at most flushSeconds before the line
+    logged ahead of its marker, which is what expandLines relies on.
+    """
+
+    def __init__(
+        self,
+        valveTag: str,
+        flushSeconds: float = RUN_SECONDS,
+        blank: bool = True,
+        valves: bool = True,
+    ) -> None:
+        """Creates new compactor.
+
+        Args:
+            valveTag(str): tag marking a valve-state frame
+            flushSeconds(float): longest run before its marker is written
+            blank(bool): suppress blank lines
+            valves(bool): suppress unchanged valve frames
+        """
+        if not 0 < flushSeconds <= MAX_RUN_SECONDS:
+            raise ValueError(f"flushSeconds must be in (0, {MAX_RUN_SECONDS}]")
+        self.valveTag = valveTag
+        self.flushMs = int(flushSeconds * 1000)
+        self.blank = blank
+        self.valves = valves
+        self.runs = {}  # payload -> [(ms, position in its ms)]
+        self.lastValve = None
+        self.groupMs = None  # ms of the latest line and lines counted in it
+        self.groupCount = 0
+
+        # stats
+        self.received = 0
+        self.blankLines = 0
+        self.repeats = 0
+        self.markers = 0
+        self.rawBytes = 0  # log bytes without compaction
+        self.savedBytes = 0
+
+    def compact(self, stamps: list[int], lines: list[str]) -> tuple[list[int], list[tuple[int, str]]]:
+        """Filters a batch of lines.
+
+        Args:
+            stamps(list[int]): wall ms each line was received at, as logged
+            lines(list[str]): the incoming lines
+
+        Returns:
+            tuple[list[int], list[tuple[int, str]]]: positions of the lines
+            to forward, and what to log in order as (position of the line
+            whose stamp it is logged with, stripped line or run marker)
+        """
+        forwarded, logged = [], []
+        flushMs = self.flushMs
+        for index, (stampMs, line) in enumerate(zip(stamps, lines)):
+            if self.runs:
+                logged += [
+                    (index, self.close(payload, stampMs))
+                    for payload, run in list(self.runs.items())
+                    if stampMs - run[0][0] > flushMs
+                ]
+            if stampMs != self.groupMs:
+                self.groupMs, self.groupCount = stampMs, 0
+            payload = line.strip()
+            position = self.groupCount
+            self.groupCount += 1
+            self.rawBytes += STAMP_LEN + len(payload) + 1
+            if not payload:
+                if self.blank:
+                    self.blankLines += 1
+                    self.runs.setdefault(payload, []).append((stampMs, position))
+                    continue
+            elif self.valves and self.valveTag in payload:
+                if payload == self.lastValve:
+                    self.repeats += 1
+                    self.runs.setdefault(payload, []).append((stampMs, position))
+                    continue
+                if self.lastValve in self.runs:
+                    logged.append((index, self.close(self.lastValve, stampMs)))
+                self.lastValve = payload
+            forwarded.append(index)
+            logged.append((index, payload))
+
+        self.received += len(lines)
+        return forwarded, logged
+
+    def close(self, payload: str, stampMs: int) -> str:
+        """Ends a run and returns its marker.
+
+        Args:
+            payload(str): the run's line
+            stampMs(int): ms the marker will be logged at
+        """
+        run = self.runs.pop(payload)
+        items = []
+        previous = run[0][0]
+        for ms, position in run:
+            items.append(f"{ms - previous}:{position}" if position else str(ms - previous))
+            previous = ms
+        marker = f"{RUN_TAG}{len(run)} since -{stampMs - run[0][0]} ms: {','.join(items)} | {payload}"
+        self.markers += 1
+        self.savedBytes += len(run) * (STAMP_LEN + len(payload) + 1) - (STAMP_LEN + len(marker) + 1)
+        return marker
+
+    def flush(self, stampMs: int) -> list[str]:
+        """Ends every run, e.g. when the port is closed.
+
+        Args:
+            stampMs(int): ms the markers will be logged at
+
+        Returns:
+            list[str]: the markers to log
+        """
+        markers = [self.close(payload, stampMs) for payload in list(self.runs)]
+        self.lastValve = None
+        return markers
+
+    def report(self) -> str:
+        """Returns a summary of suppressed lines and log bytes saved."""
+        percent = 100 * self.savedBytes / self.rawBytes if self.rawBytes else 0
+        return (
+            f"Dedup: {self.received} lines, {self.blankLines} blank and {self.repeats} "
+            f"repeated valve frames logged as {self.markers} markers, "
+            f"{self.savedBytes} log bytes saved ({percent:.1f}%)"
+        )
+
+
+# FUNCTIONS ----------------------------------------------------------------------|
+def runPayload(payload: bytes) -> bytes | None:
+    """Returns the repeated line of a marker payload, or None if not a marker.
+
+    Args:
+        payload(bytes): a log line without its stamp
+    """
+    match = _MARKER.match(payload.rstrip(b"\r\n"))
+    return match.group(4) if match else None
+
+
+def expandMarker(stamp: int, payload: bytes) -> list[tuple[int, int, bytes]] | None:
+    """Returns the lines a marker stands for, or None if payload is not one.
+
+    Args:
+        stamp(int): the marker's stamp in ms
+        payload(bytes): the marker line without its stamp
+
+    Returns:
+        list[tuple[int, int, bytes]] | None: stamp, position in its ms and
+        the full line, per repeat
+    """
+    match = _MARKER.match(payload.rstrip(b"\r\n"))
+    if not match:
+        return None
+    count, back, items, text = match.groups()
+    items = items.split(b",")
+    if len(items) != int(count):
+        return None
+    lines = []
+    ms = stamp - int(back)
+    for item in items:
+        delta, _, position = item.partition(b":")
+        ms += int(delta)
+        lines.append((ms, int(position or 0), formatStamp(ms) + text + b"\n"))
+    return lines
+
+
+def expandLines(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """Yields raw log lines with run markers replaced by the lines they stand for.
+
+    Lines are held back per ms until no later marker can still add to that
+    ms (MAX_RUN_SECONDS after it), then released with the repeats put back
+    at their original positions. Lines without a stamp release everything
+    held. Plain logs pass through unchanged.
+
+    Args:
+        lines(Iterable[bytes]): raw lines of a log, in file order
+    """
+    keys = []  # held stamps, ascending
+    groups = {}  # stamp -> ([logged lines], [(position, repeated line)])
+    current = None  # newest stamp read
+
+    def group(stamp: int) -> tuple[list, list]:
+        if stamp not in groups:
+            groups[stamp] = ([], [])
+            if not keys or stamp > keys[-1]:
+                keys.append(stamp)
+            else:
+                bisect.insort(keys, stamp)
+        return groups[stamp]
+
+    def release(limit: int | None) -> Iterator[bytes]:
+        count = len(keys) if limit is None else bisect.bisect_left(keys, limit)
+        for key in keys[:count]:
+            logged, repeats = groups.pop(key)
+            repeats.sort(key=lambda repeat: repeat[0])
+            for position, line in repeats:
+                logged.insert(position, line)
+            yield from logged
+        del keys[:count]
+
+    for line in lines:
+        stamp = parseStamp(line)
+        if stamp is None:
+            yield from release(None)
+            yield line
+            continue
+        if current is None or stamp > current:
+            if current is not None:
+                # every ms before current is complete; markers end runs within MAX_RUN_MS
+                yield from release(current - MAX_RUN_MS)
+            current = stamp
+        repeats = expandMarker(stamp, line[STAMP_LEN:])
+        if repeats is None:
+            group(stamp)[0].append(line)
+            continue
+        for ms, position, repeat in repeats:
+            group(ms)[1].append((position, repeat))
+    yield from release(None)
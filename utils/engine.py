@@ -0,0 +1,592 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: GUI-free telemetry engine: serial, parsing, logging, decay test and launch state.
+
+The engine does not use Qt. A SerialReader thread writes queued commands
+and reads lines. Everything else happens in poll(), on the thread that
+calls it, which hands the results to subscribers:
+
+    engine.subscribe(FRAMES, lambda stamps, frames: ...)
+
+poll() can be driven by run() (a plain blocking loop), by runAsync()
+(asyncio), or by a GUI event loop through the engine's wake callback.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from typing import Callable, NamedTuple
+
+import serial
+
+from .binlog import BinaryRecorder
+from .commands import CommandQueue
+from .decay import DecayTest
+from .dedup import LineCompactor
+from .instrument import HOP, PARSE, PROFILER
+from .logger import LogWriter
+from .parser import MISSING, PRESSURE_FRAME, FrameParser
+from .rates import RateEstimator
+from .timebase import Timebase
+
+# events, with the arguments passed to subscribers
+FRAMES = "frames"  # (stamps, frames) per parsed batch, one monotonic ns stamp per frame
+LOG = "log"  # (line,) per sys log line
+STATE = "state"  # (state, aborted) when the launch state changes
+DECAY = "decay"  # (active, result) when a decay test starts (result None) or ends
+SERIAL = "serial"  # (open,) when the connection is opened or closed
+ERROR = "error"  # (message,) after a serial error has closed the connection
+
+# SerialReader -> engine queue items
+_BATCH = 0  # (_BATCH, [(stamp, line)], perf_counter_ns when queued or 0)
+_SENT = 1  # (_SENT, seq, message, latency ms)
+_FAILED = 2  # (_FAILED,)
+
+STOP_TIMEOUT = 1.0  # s to wait for the serial thread to finish
+SEPARATOR = "---------------------------------------------------------------------------"
+
+
+# CLASSES ------------------------------------------------------------------------|
+class LaunchCommands(NamedTuple):
+    """Commands the engine sends on its own, and how commands are sent."""
+
+    abort: str
+    ignite: str
+    mainValves: str
+    urgent: tuple[str, ...]  # sent ahead of queued commands
+    durable: tuple[str, ...]  # sys log lines fsynced at once
+    length: int  # messages are padded with "0" to this length
+
+
+class SerialReader(threading.Thread):
+    """Serial thread: writes queued commands and reads lines until stopped.
+
+    Each read cycle's lines are queued as one batch, every line with the
+    time.monotonic_ns() stamp the connection gave it when it was read.
+    """
+
+    def __init__(self, connection, events: queue.SimpleQueue, notify: Callable[[], None]) -> None:
+        """Creates new serial thread.
+
+        Args:
+            connection(SerialComm | ReplayComm): the connection to use
+            events(queue.SimpleQueue): where batches and reports are queued
+            notify(Callable): called after queueing
+        """
+        super().__init__(name="SerialReader", daemon=True)
+        self.connection = connection
+        self.events = events
+        self.notify = notify
+        self.commands = CommandQueue()
+        self.program = True
+
+    def run(self) -> None:
+        """Writes queued commands and reads until stopped or the port fails."""
+        while self.program:
+            self.writeCommands()
+            try:
+                received = self.connection.readLines()
+            except (serial.SerialException, UnicodeDecodeError, OSError):
+                self.put((_FAILED,))
+                break
+            if received:
+                queued = time.perf_counter_ns() if PROFILER.enabled else 0
+                self.put((_BATCH, received, queued))
+
+    def put(self, item: tuple) -> None:
+        self.events.put(item)
+        self.notify()
+
+    def writeCommands(self) -> None:
+        """Writes every queued command, reporting its sequence number,
+        message and enqueue-to-write latency in ms."""
+        command = self.commands.get()
+        while command:
+            if self.connection.sendMessage(command.message + "\n"):
+                latency = (time.perf_counter_ns() - command.enqueued) / 1e6
+                self.put((_SENT, command.seq, command.message, latency))
+            command = self.commands.get()
+
+    def send(self, message: str, urgent: bool = False) -> int:
+        """Queues a message without blocking and wakes the thread to write it.
+
+        Args:
+            message(str): the message to write
+            urgent(bool): send ahead of any other queued commands
+
+        Returns:
+            int: the command's sequence number
+        """
+        seq = self.commands.put(message, urgent)
+        self.connection.cancelRead()
+        return seq
+
+    def stop(self) -> None:
+        """Stops the thread and waits for it to finish its read."""
+        self.program = False
+        self.connection.cancelRead()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(STOP_TIMEOUT)
+
+
+class TelemetryEngine:
+    """Telemetry pipeline and launch state, independent of any GUI.
+
+    Owns the connection and its SerialReader, the sys and data logs,
+    line compaction, parsing, PSI/MIN rates, the decay test and the launch
+    state machine. Subscribers are called from poll() in the order they
+    subscribed.
+    """
+
+    def __init__(
+        self,
+        parser: FrameParser,
+        sysLog: LogWriter,
+        dataLog: LogWriter,
+        session: str,
+        commands: LaunchCommands,
+        states: tuple[str, ...],
+        rates: dict[str, RateEstimator],
+        decay: DecayTest,
+        compactor: LineCompactor | None = None,
+        binLog: BinaryRecorder | None = None,
+        timebase: Timebase | None = None,
+    ) -> None:
+        """Creates new engine; begin() starts its logs.
+
+        Args:
+            parser(FrameParser): the frame parser
+            sysLog(LogWriter): log of events and commands
+            dataLog(LogWriter): log of received lines
+            session(str): this session's NEW SESSION line
+            commands(LaunchCommands): abort/ignite/main valve commands
+            states(tuple[str]): launch states, in order
+            rates(dict): PSI/MIN estimator per PT name
+            decay(DecayTest): the decay test
+            compactor(LineCompactor | None): drops blank and repeated lines
+            binLog(BinaryRecorder | None): optional binary frame log
+            timebase(Timebase | None): sample clock, a new one by default
+        """
+        self.parser = parser
+        self.sysLog = sysLog
+        self.dataLog = dataLog
+        self.session = session
+        self.commands = commands
+        self.states = states
+        self.rates = rates
+        self.decay = decay
+        self.compactor = compactor
+        self.binLog = binLog
+        self.timebase = timebase or Timebase()
+
+        # launch state
+        self.state = 0
+        self.aborted = False
+
+        # serial
+        self.connection = None
+        self.reader = None
+        self.events = queue.SimpleQueue()
+        self.ready = threading.Event()  # set when events are queued
+        self.wake = None  # optional callable, called from the serial thread when ready is set
+
+        self.subscribers = {}
+        self.timers = []  # [due monotonic s, interval s, callback]
+        self.running = False
+
+        self.decayActive = False
+        self.decayTimer = None
+        self.iterations = 0
+
+    # EVENTS --------------------------------------------------------
+
+    def subscribe(self, event: str, callback: Callable) -> Callable:
+        """Calls callback with the event's arguments whenever it happens.
+
+        Args:
+            event(str): FRAMES, LOG, STATE, DECAY, SERIAL or ERROR
+            callback(Callable): the subscriber
+
+        Returns:
+            Callable: the callback, for unsubscribe
+        """
+        self.subscribers.setdefault(event, []).append(callback)
+        return callback
+
+    def unsubscribe(self, event: str, callback: Callable) -> None:
+        """Removes a subscriber."""
+        self.subscribers.get(event, []).remove(callback)
+
+    def emit(self, event: str, *args) -> None:
+        """Calls every subscriber of an event."""
+        for callback in self.subscribers.get(event, ()):
+            callback(*args)
+
+    def notify(self) -> None:
+        """Marks events as ready (serial thread), waking the consumer once."""
+        if not self.ready.is_set():
+            self.ready.set()
+            if self.wake:
+                self.wake()
+
+    # LOOP ----------------------------------------------------------
+
+    def poll(self) -> int:
+        """Handles every queued batch and report, then any due timers.
+
+        Returns:
+            int: the number of queue items handled
+        """
+        self.ready.clear()
+        handled = 0
+        while True:
+            try:
+                item = self.events.get_nowait()
+            except queue.Empty:
+                break
+            handled += 1
+            if item[0] == _BATCH:
+                if item[2]:
+                    PROFILER.record(HOP, item[2])
+                self.handleBatch(item[1])
+            elif item[0] == _SENT:
+                _, seq, message, latency = item
+                self.log(
+                    f"Sent #{seq}: {message} ({latency:.2f} ms)",
+                    durable=message.rstrip("0") in self.commands.durable,
+                )
+            else:
+                self.close()
+                self.emit(ERROR, "Serial error detected!")
+        self.runTimers()
+        return handled
+
+    def nextTimeout(self, limit: float) -> float:
+        """Returns how long a loop may wait before a timer is due, at most limit."""
+        if not self.timers:
+            return limit
+        return max(0.0, min(limit, min(timer[0] for timer in self.timers) - time.monotonic()))
+
+    def run(self, until: Callable[[], bool] | None = None, tick: float = 0.1) -> None:
+        """Polls until stop() is called or until() returns True.
+
+        Args:
+            until(Callable | None): checked after every poll
+            tick(float): longest wait between polls in seconds
+        """
+        self.running = True
+        while self.running and not (until and until()):
+            self.ready.wait(self.nextTimeout(tick))
+            self.poll()
+
+    async def runAsync(self, until: Callable[[], bool] | None = None, tick: float = 0.1) -> None:
+        """Like run, but waits in a worker thread so the asyncio loop stays free.
+
+        Subscribers are called on the event loop's thread.
+        """
+        self.running = True
+        while self.running and not (until and until()):
+            await asyncio.to_thread(self.ready.wait, self.nextTimeout(tick))
+            self.poll()
+
+    def stop(self) -> None:
+        """Makes run/runAsync return after the current poll."""
+        self.running = False
+        self.ready.set()
+
+    def every(self, seconds: float, callback: Callable[[], None]) -> list:
+        """Calls callback from poll() every `seconds` seconds.
+
+        Returns:
+            list: the timer, for cancel
+        """
+        timer = [time.monotonic() + seconds, seconds, callback]
+        self.timers.append(timer)
+        return timer
+
+    def cancel(self, timer: list) -> None:
+        """Stops a timer from every()."""
+        if timer in self.timers:
+            self.timers.remove(timer)
+
+    def runTimers(self) -> None:
+        """Calls every timer that is due."""
+        now = time.monotonic()
+        for timer in list(self.timers):
+            if timer[0] <= now and timer in self.timers:
+                timer[0] = now + timer[1]
+                timer[2]()
+
+    # LOGS ----------------------------------------------------------
+
+    def begin(self) -> None:
+        """Writes the session line to both logs and the clock anchor to the sys log."""
+        self.log(self.session, reformat=False)
+        self.log(self.timebase.anchor())
+        self.dataLog.write(self.session)
+
+    def log(self, string: str, reformat: bool = True, durable: bool = False) -> None:
+        """Writes a line to the sys log and passes it to LOG subscribers.
+
+        Args:
+            string(str): the line
+            reformat(bool): prefix the current time
+            durable(bool): fsync the sys log as soon as the line is written
+        """
+        stamp = self.timebase.now()
+        if reformat:
+            string = self.timebase.logStamp(stamp) + string.strip()
+        self.sysLog.write(string, durable, self.timebase.wallMs(stamp))
+        self.emit(LOG, string)
+
+    def shutdown(self) -> None:
+        """Closes the connection and the logs."""
+        if self.connected:
+            self.close()
+        self.sysLog.write(SEPARATOR)
+        self.dataLog.write(SEPARATOR)
+        self.sysLog.close()
+        self.dataLog.close()
+        if self.binLog:
+            self.binLog.close()
+
+    # SERIAL --------------------------------------------------------
+
+    @property
+    def connected(self) -> bool:
+        """True while a connection is being read."""
+        return self.reader is not None
+
+    def open(self, connection) -> None:
+        """Starts reading from a connection.
+
+        Args:
+            connection(SerialComm | ReplayComm): an open connection
+        """
+        if self.connected:
+            self.close()
+        self.connection = connection
+        self.reader = SerialReader(connection, self.events, self.notify)
+        self.reader.start()
+        self.emit(SERIAL, True)
+
+    def close(self) -> None:
+        """Stops reading, handles what was already read and closes the connection."""
+        if not self.connected:
+            return
+        reader, self.reader = self.reader, None
+        reader.stop()
+        self.connection.close()
+        self.poll()
+        self.endRuns()
+        self.emit(SERIAL, False)
+
+    def send(self, command: str) -> int | None:
+        """Logs and queues a command, padded to the command length.
+
+        Args:
+            command(str): pins to toggle, or a LaunchCommands command
+
+        Returns:
+            int | None: the command's sequence number, None if not connected
+        """
+        if not self.connected:
+            return None
+        message = command.ljust(self.commands.length, "0")
+        self.log(f"Send: {message}", durable=command in self.commands.durable)
+        return self.reader.send(message, command in self.commands.urgent)
+
+    def handleBatch(self, batch: list[tuple[int, str]]) -> None:
+        """Logs and parses a batch of incoming lines, then passes the frames to
+        FRAMES subscribers once.
+
+        Every line is logged, and its frame handled, with its own read stamp.
+        Blank lines and unchanged valve frames are dropped first and only
+        logged, as run markers (see LineCompactor).
+
+        Args:
+            batch(list[tuple[int, str]]): (monotonic ns read at, line) per incoming line
+        """
+        timebase = self.timebase
+        stamps = [stamp for stamp, _ in batch]
+        lines = [line for _, line in batch]
+        wallMs = [timebase.wallMs(stamp) for stamp in stamps]
+        if self.compactor:
+            kept, logged = self.compactor.compact(wallMs, lines)
+            lines = [lines[index] for index in kept]
+        else:
+            kept = range(len(lines))
+            logged = [(index, line.strip()) for index, line in enumerate(lines)]
+        self.dataLog.writeLines(
+            [timebase.logStamp(stamps[index]) + text for index, text in logged],
+            [wallMs[index] for index, _ in logged],
+        )
+        if not lines:
+            return
+
+        start = time.perf_counter_ns() if PROFILER.enabled else 0
+        indexed = self.parser.parseIndexed(lines)
+        if start:
+            PROFILER.record(PARSE, start)
+        stamps = [stamps[kept[position]] for position, _ in indexed]
+        frames = [frame for _, frame in indexed]
+
+        names = self.parser.names[PRESSURE_FRAME]
+        channels = self.parser.channels
+        for stamp, (kind, values) in zip(stamps, frames):
+            if self.binLog:
+                self.binLog.recordFrame(kind, values, channels[kind], timebase.wallNs(stamp))
+            if kind == PRESSURE_FRAME:
+                for name, reading in zip(names, values.tolist()):
+                    if name in self.rates and reading != MISSING:
+                        self.rates[name].add(stamp, reading)
+        if self.decayActive:
+            self.decay.add(stamps, frames)
+        self.emit(FRAMES, stamps, frames)
+
+    def endRuns(self) -> None:
+        """Logs the markers of unfinished dedup runs and the dedup stats."""
+        if not self.compactor:
+            return
+        stamp = self.timebase.now()
+        prefix = self.timebase.logStamp(stamp)
+        wallMs = self.timebase.wallMs(stamp)
+        markers = self.compactor.flush(wallMs)
+        self.dataLog.writeLines([prefix + marker for marker in markers], [wallMs] * len(markers))
+        self.log(self.compactor.report())
+
+    # LAUNCH STATE --------------------------------------------------
+
+    @property
+    def final(self) -> bool:
+        """True in the last launch state."""
+        return self.state == len(self.states) - 1
+
+    def advance(self) -> bool:
+        """Moves to the next launch state.
+
+        Returns:
+            bool: False if aborted or already in the last state
+        """
+        if self.aborted or self.final:
+            return False
+        self.state += 1
+        self.log(f"Advance to: {self.states[self.state]}")
+        self.emit(STATE, self.state, self.aborted)
+        return True
+
+    def previous(self) -> bool:
+        """Clears an abort and moves to the previous launch state.
+
+        Returns:
+            bool: False if already in the first state
+        """
+        self.aborted = False
+        if self.state == 0:
+            return False
+        self.state -= 1
+        self.log(f"Return to: {self.states[self.state]}")
+        self.emit(STATE, self.state, self.aborted)
+        return True
+
+    def abort(self) -> bool:
+        """Sends the abort command (logged durably) unless already aborted.
+
+        Returns:
+            bool: True if sent
+        """
+        if self.aborted:
+            return False
+        self.log("System abort executed.", durable=True)
+        return self.send(self.commands.abort) is not None
+
+    def ignite(self) -> bool:
+        """Sends the ignition command, only in the last launch state.
+
+        Returns:
+            bool: True if sent
+        """
+        if not self.final:
+            return False
+        self.log("Ignition command sent.", durable=True)
+        return self.send(self.commands.ignite) is not None
+
+    def openMainValves(self) -> bool:
+        """Sends the main valve command, only in the last launch state.
+
+        Returns:
+            bool: True if sent
+        """
+        if not self.final:
+            return False
+        self.log("Main valve actuation executed.", durable=True)
+        return self.send(self.commands.mainValves) is not None
+
+    # DECAY TEST ----------------------------------------------------
+
+    def startDecayTest(self, iterations: int, seconds: float) -> None:
+        """Starts collecting the decay test's PT readings.
+
+        Progress is logged every `seconds` and the fitted result after
+        `iterations` of them.
+
+        Args:
+            iterations(int): progress reports before the result
+            seconds(float): seconds per report
+        """
+        self.decayActive = True
+        self.iterations = iterations
+        self.decay.start(self.timebase.wallMs(self.timebase.now()))
+        self.log(f"Decay Test: {iterations} interations, {seconds} seconds per iter.")
+        self.decayTimer = self.every(seconds, self.decayProgress)
+        self.emit(DECAY, True, None)
+
+    def decayProgress(self) -> None:
+        """Logs the running fit, finishing the test after the last iteration."""
+        self.iterations -= 1
+        if self.iterations == 0:
+            self.stopDecayTest()
+            return
+        update = f"DT{self.iterations}: "
+        for name, fit in self.decay.fit().items():
+            slope = "N/A" if fit["slope"] is None else f"{fit['slope']:.2f}"
+            update += f"{name} {slope} PSI/MIN ({fit['samples']}) "
+        self.log(update)
+
+    def stopDecayTest(self, completed: bool = True) -> dict:
+        """Stops the decay test and logs its result record.
+
+        Args:
+            completed(bool): False if the test was stopped early
+
+        Returns:
+            dict: the result record
+        """
+        if not completed:
+            self.log("Decay Test terminated early.")
+        self.cancel(self.decayTimer)
+        self.decayActive = False
+        result = self.decay.result(completed)
+        self.log(self.decay.report(result))
+        if completed:
+            self.log(f"Decay Test Complete: {result['verdict'].upper()}.")
+        self.emit(DECAY, False, result)
+        return result
+
+    # DIAGNOSTICS ---------------------------------------------------
+
+    def profile(self, seconds: float) -> None:
+        """Enables hot path timings, logging them every `seconds`."""
+        PROFILER.enabled = True
+        self.every(seconds, self.profileReport)
+
+    def profileReport(self) -> None:
+        """Writes stage timings and queue depths to the sys log."""
+        PROFILER.gauge("data log queue", self.dataLog.queue.qsize())
+        PROFILER.gauge("batches in flight", self.events.qsize())
+        if self.connected:
+            PROFILER.gauge("command queue", len(self.reader.commands))
+        for line in PROFILER.report():
+            self.log(line)
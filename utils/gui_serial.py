@@ -1,15 +1,18 @@
 """
 Author: Nick Fan
 Date: 3/2023
-Description: Serial module for use with PyQt6 applications.
+Description: Serial connection to the launch control board.
 """
 
 import time
+
 import serial
 import serial.tools.list_ports
-from PyQt6.QtCore import QMutex, QObject, pyqtSignal
+
+from .instrument import PROFILER, READ
 
 BAUDRATES = [9600, 115200]
+BITS_PER_BYTE = 10  # 8N1: start bit, 8 data bits, stop bit
 
 # CLASSES ------------------------------------------------------------------------|
 class SerialComm:
@@ -27,128 +30,72 @@ class SerialComm:
         self.connection = serial.Serial(
             self.port, self.baudrate, timeout=0.05, write_timeout=0.1, xonxoff=True
         )
+        self.pending = bytearray()  # partial line carried between reads
+        self.byteNs = BITS_PER_BYTE * 1_000_000_000 // baudrate  # time to receive one byte
+        self.lastRead = 0  # monotonic ns of the previous read with data
 
-    def receiveMessage(self) -> str:
-        """Read from serial com if there is data in."""
-        if not self.connection.is_open:
-            self.connection.open()
-        try:
-            data = str(self.connection.readall().decode("ascii"))
-            if data:
-                return data
-        except serial.SerialException:
-            pass
-        return ""
+    def readLines(self) -> list[tuple[int, str]]:
+        """Waits for incoming data and returns all complete lines, each stamped.
+
+        Blocks only until the first byte arrives (or the read timeout passes),
+        then takes whatever else is already buffered, so lines are returned as
+        soon as they are received.
 
-    def readEolLine(self) -> bytearray:
-        """Reads line specifically using LF for eol.
+        Several lines often arrive in one read. Each is stamped with when its
+        LF arrived, estimated from the read time less the time the bytes
+        after it took on the wire at the baudrate. The estimate assumes the
+        bytes arrived back to back, so stamps are clamped to never precede
+        the previous read; they never decrease.
 
-        EoL readline by: lou under CC BY-SA 3.0
-        src: https://stackoverflow.com/questions/16470903/pyserial-2-6-specify-end-of-line-in-readline
-        Changes have been made to adjust for integration in this program.
+        Returns:
+            list[tuple[int, str]]: (monotonic ns, line without the trailing LF)
+            per complete line, possibly empty
         """
-        eol = b"\n"
-        eolLen = len(eol)
-        line = bytearray()
-        while True:
-            c = self.connection.read(1)
-            if c:
-                line += c
-                if line[-eolLen:] == eol:
-                    break
-            else:
-                break
-        return line
+        chunk = self.connection.read(1)
+        if not chunk:
+            return []
+        start = time.perf_counter_ns() if PROFILER.enabled else 0
+        waiting = self.connection.in_waiting
+        if waiting:
+            chunk += self.connection.read(waiting)
+        now = time.monotonic_ns()
+        earliest, self.lastRead = self.lastRead, now
+        self.pending += chunk
+        if b"\n" not in chunk:
+            return []
+        *lines, self.pending = self.pending.split(b"\n")
+        stamped = []
+        after = len(self.pending)  # bytes received after the line's LF
+        for line in reversed(lines):
+            stamped.append((max(earliest, now - after * self.byteNs), line.decode()))
+            after += len(line) + 1
+        stamped.reverse()
+        if start:
+            PROFILER.record(READ, start)
+        return stamped
 
     def sendMessage(self, message: str) -> bool:
-        """Writes to serial com."""
+        """Writes to serial com and waits until the message is on the wire."""
         if not self.connection.is_open:
             self.connection.open()
         try:
             self.connection.write(message.encode("utf-8"))
+            self.connection.flush()
             return True
         except (serial.SerialException, serial.SerialTimeoutException):
             return False
 
+    def cancelRead(self) -> None:
+        """Wakes a read that is currently waiting for data."""
+        try:
+            self.connection.cancel_read()
+        except (AttributeError, NotImplementedError, serial.SerialException):
+            pass
+
     def close(self):
         """Closes the com connection."""
         self.connection.close()
 
-
-class SerialWorker(QObject):
-    """GUI Serial Manager Thread."""
-
-    msg = pyqtSignal(str)
-    cleanup = pyqtSignal()
-    error = pyqtSignal()
-
-    def __init__(self, connection: SerialComm, lock: QMutex, pins: str, parent=None) -> None:
-        """Constructs new Serial Worker.
-
-        Args:
-            connection(SerialComm): the serial connection to use
-            pins(str): pins to toggle
-            parent(QObject): optional parent
-        """
-        super().__init__(parent)
-        self.serialConnection = connection
-        self.pins = pins
-        self.mutex = lock
-        self.program = True
-
-    def setPins(self, newPins: str) -> None:
-        """Sets new pins.
-
-        Args:
-            newPins(str): a new set of pins to toggle.
-        """
-        self.pins = newPins
-
-    def run(self) -> None:
-        """Sends initial toggle and continuously reads
-        until indicated to stop, then toggles again."""
-        # read serial
-        error = False
-        while self.program:
-            if not error:
-                if self.mutex.tryLock():
-
-                    try:
-                        received = []
-                        received.append(self.serialConnection.connection.readline().decode())
-                        while self.serialConnection.connection.in_waiting > 8:
-                            received.append(self.serialConnection.connection.readline().decode())
-                    except (serial.SerialException, UnicodeDecodeError):
-                        self.error.emit()
-                        error = True
-                        received = None
-
-                    time.sleep(0.05)
-                    self.mutex.unlock()
-                    if received:
-                        if len(received) == 0:
-                            continue
-                        for x in received:
-                            self.msg.emit(x)
-    
-        self.cleanup.emit()
-
-    def sendToggle(self, pins: str | None = None) -> None:
-        """Sends message, which by default is the pins instance variable.
-        
-        Args:
-            pins(str): optional argument to indicate pins to toggle.
-        """
-        if pins:
-            message = pins + "\n"
-        else:
-            message = self.pins + "\n"
-        while True:
-            if self.mutex.tryLock():
-                self.serialConnection.sendMessage(message)
-                self.mutex.unlock()
-                break
-
 # FUNCTIONS ----------------------------------------------------------------------|
 def setupConnection(selectedPort: str, baud: int) -> SerialComm:
         """Sets up and returns a serial comm.
@@ -0,0 +1,128 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Low-overhead per-stage timing histograms for the telemetry hot path.
+
+Instrumented code checks PROFILER.enabled before reading the clock, so the
+cost when profiling is off is one attribute lookup per stage:
+
+    start = time.perf_counter_ns() if PROFILER.enabled else 0
+    ...
+    if start:
+        PROFILER.record(PARSE, start)
+"""
+
+import time
+
+# stage names, none of them contains another
+READ = "read"  # serial bytes to stamped lines, after data arrived
+HOP = "queue hop"  # serial thread queueing a batch to the engine's poll() taking it
+PARSE = "parse"  # lines to frames
+DISPLAY = "display"  # SV/PT label updates for a batch
+PLOT = "plot"  # adding a batch's pressure frames to the plot history
+RENDER = "render"  # plot and PSI/MIN label redraws
+WRITE = "write"  # log file writes
+
+BUCKETS = 40  # power of two ns buckets, up to ~18 minutes
+
+
+# CLASSES ------------------------------------------------------------------------|
+class Histogram:
+    """Fixed power-of-two bucket histogram of durations in ns."""
+
+    def __init__(self) -> None:
+        """Creates new empty histogram."""
+        self.buckets = [0] * BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, duration: int) -> None:
+        """Adds a duration.
+
+        Args:
+            duration(int): duration in ns
+        """
+        self.buckets[min(duration.bit_length(), BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def percentile(self, percent: float) -> int:
+        """Returns an upper bound (bucket edge) of a percentile in ns.
+
+        Args:
+            percent(float): the percentile, 0 to 100
+        """
+        if not self.count:
+            return 0
+        target = self.count * percent / 100
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return min(1 << bucket, self.max)
+        return self.max
+
+
+class Profiler:
+    """Collects stage histograms and gauges while enabled."""
+
+    def __init__(self) -> None:
+        """Creates new disabled profiler."""
+        self.enabled = False
+        self.stages = {}
+        self.gauges = {}
+        self.since = time.monotonic()
+
+    def record(self, stage: str, start: int) -> None:
+        """Records the time since start for a stage.
+
+        Args:
+            stage(str): the stage name
+            start(int): perf_counter_ns at the start of the stage
+        """
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = Histogram()
+        histogram.add(time.perf_counter_ns() - start)
+
+    def gauge(self, name: str, value: int) -> None:
+        """Records the latest value and peak of a gauge such as a queue depth.
+
+        Args:
+            name(str): the gauge name
+            value(int): the current value
+        """
+        _, peak = self.gauges.get(name, (0, 0))
+        self.gauges[name] = (value, max(peak, value))
+
+    def report(self, reset: bool = True) -> list[str]:
+        """Returns one summary line per stage and gauge.
+
+        Args:
+            reset(bool): start a new measurement interval afterwards
+
+        Returns:
+            list[str]: rate and latency summaries
+        """
+        elapsed = max(time.monotonic() - self.since, 1e-9)
+        lines = []
+        for stage, hist in self.stages.items():
+            mean = hist.total / hist.count if hist.count else 0
+            lines.append(
+                f"PROFILE {stage}: {hist.count / elapsed:.1f}/s, "
+                f"mean {mean / 1e3:.1f} us, p50 <{hist.percentile(50) / 1e3:.1f} us, "
+                f"p99 <{hist.percentile(99) / 1e3:.1f} us, max {hist.max / 1e3:.1f} us"
+            )
+        for name, (value, peak) in self.gauges.items():
+            lines.append(f"PROFILE {name}: {value} (peak {peak})")
+        if reset:
+            self.stages = {}
+            self.gauges = {}
+            self.since = time.monotonic()
+        return lines
+
+
+PROFILER = Profiler()
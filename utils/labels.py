@@ -0,0 +1,53 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Change-detecting cache for frequently updated PyQt6 labels.
+"""
+
+from PyQt6.QtWidgets import QLabel
+
+
+# CLASSES ------------------------------------------------------------------------|
+class LabelCache:
+    """Remembers what each label shows and only touches a widget on change.
+
+    setStyleSheet forces a full style re-polish, so it is only called when
+    the style actually differs; setText likewise only on a new value.
+    """
+
+    def __init__(self, labels: dict[str, QLabel]) -> None:
+        """Creates new label cache.
+
+        Args:
+            labels(dict[str, QLabel]): the labels to update, by name
+        """
+        self.labels = labels
+        self.state = {}  # name -> (text, style)
+        self.updated = 0
+        self.skipped = 0
+
+    def update(self, name: str, text: str, style: str) -> None:
+        """Shows text with style on a label, skipping the widget if nothing changed.
+
+        Args:
+            name(str): the label name
+            text(str): the text to display
+            style(str): the style sheet to apply
+        """
+        old = self.state.get(name)
+        if old == (text, style):
+            self.skipped += 1
+            return
+        label = self.labels[name]
+        if old is None or old[1] != style:
+            label.setStyleSheet(style)
+        if old is None or old[0] != text:
+            label.setText(text)
+        self.state[name] = (text, style)
+        self.updated += 1
+
+    def report(self) -> str:
+        """Returns a summary of applied and skipped updates."""
+        total = self.updated + self.skipped
+        percent = 100 * self.skipped / total if total else 0
+        return f"Label updates: {self.updated} applied, {self.skipped} skipped ({percent:.1f}%)"
@@ -0,0 +1,156 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Helpers for reading the GUI's text log files.
+
+Every logged line starts with a DATE_TIME_FORMAT stamp
+("MM/dd/yyyy | hh:mm:ss:zzz -> ") and each run starts with "NEW SESSION:".
+
+Closed logs may be compressed to <file>.gz: a gzip stream made of one
+member per FRAME_BYTES of text, with a <file>.gz.frames JSON table of
+[text offset, compressed offset] per member. Any gzip reader streams the
+whole file; openLog uses the table to start reading near an offset.
+A log's sidecar index (<file>.idx, see tools/logindex.py) holds text
+offsets, so compressing moves it to <file>.gz.idx unchanged.
+"""
+
+import calendar
+import gzip
+import json
+import os
+import time
+
+SESSION_TAG = b"NEW SESSION: "
+STAMP_LEN = len("MM/dd/yyyy | hh:mm:ss:zzz -> ")
+
+GZ_SUFFIX = ".gz"
+FRAMES_SUFFIX = ".frames"
+INDEX_SUFFIX = ".idx"
+FRAME_BYTES = 1 << 20  # text bytes per gzip member
+LOG_SUFFIXES = (".txt", ".txt" + GZ_SUFFIX)
+
+
+# CLASSES ------------------------------------------------------------------------|
+class _FrameReader(gzip.GzipFile):
+    """GzipFile reading from an already positioned file, which it closes."""
+
+    def __init__(self, source) -> None:
+        super().__init__(fileobj=source, mode="rb")
+        self.source = source
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self.source.close()
+
+
+# FUNCTIONS ----------------------------------------------------------------------|
+def parseStamp(line: bytes) -> int | None:
+    """Returns a line's DATE_TIME_FORMAT stamp as ms, or None if it has none.
+
+    The stamp is local time; it is converted as if it were UTC, which keeps
+    ordering and differences correct without time zone lookups.
+
+    Args:
+        line(bytes): a raw log line
+    """
+    if len(line) < STAMP_LEN or line[2:3] != b"/" or line[11:12] != b"|":
+        return None
+    try:
+        seconds = calendar.timegm(
+            (int(line[6:10]), int(line[0:2]), int(line[3:5]),
+             int(line[13:15]), int(line[16:18]), int(line[19:21]))
+        )
+        return seconds * 1000 + int(line[22:25])
+    except ValueError:
+        return None
+
+
+def formatStamp(stamp: int) -> bytes:
+    """Returns the DATE_TIME_FORMAT stamp of a parseStamp value.
+
+    Args:
+        stamp(int): ms, as returned by parseStamp
+    """
+    clock = time.gmtime(stamp // 1000)
+    return b"%02d/%02d/%04d | %02d:%02d:%02d:%03d -> " % (
+        clock.tm_mon, clock.tm_mday, clock.tm_year,
+        clock.tm_hour, clock.tm_min, clock.tm_sec, stamp % 1000,
+    )
+
+
+def compressLog(path: str, frameBytes: int = FRAME_BYTES) -> str:
+    """Compresses a closed log to seekable gzip frames and removes the original.
+
+    The original is only removed once the .gz and its frame table are
+    complete, so an interrupted run leaves the log untouched. Its index,
+    if any, moves to the .gz.
+
+    Args:
+        path(str): the text log
+        frameBytes(int): text bytes per gzip member
+
+    Returns:
+        str: the compressed file's path
+    """
+    target = path + GZ_SUFFIX
+    frames = []
+    with open(path, "rb") as source, open(target + ".tmp", "wb") as out:
+        offset = 0
+        while True:
+            chunk = source.read(frameBytes)
+            if not chunk:
+                break
+            # end members on a line so a reader started at one sees whole lines
+            chunk += source.readline()
+            frames.append([offset, out.tell()])
+            out.write(gzip.compress(chunk, mtime=0))
+            offset += len(chunk)
+        out.flush()
+        os.fsync(out.fileno())
+    with open(target + FRAMES_SUFFIX, "w") as table:
+        json.dump(frames, table)
+    os.replace(target + ".tmp", target)
+    if os.path.exists(path + INDEX_SUFFIX):
+        os.replace(path + INDEX_SUFFIX, target + INDEX_SUFFIX)
+    os.remove(path)
+    return target
+
+
+def openLog(path: str, offset: int = 0):
+    """Opens a text log or its .gz for binary line reading at a text offset.
+
+    Args:
+        path(str): the log, plain or compressed
+        offset(int): text byte offset to start at
+
+    Returns:
+        IO[bytes]: a stream positioned at offset
+    """
+    if not path.endswith(GZ_SUFFIX):
+        stream = open(path, "rb")
+        stream.seek(offset)
+        return stream
+    frames = [[0, 0]]
+    try:
+        with open(path + FRAMES_SUFFIX) as table:
+            frames = json.load(table) or frames
+    except (OSError, ValueError):
+        pass  # no table: read from the start
+    start, position = max((frame for frame in frames if frame[0] <= offset), default=[0, 0])
+    source = open(path, "rb")
+    source.seek(position)
+    stream = _FrameReader(source)
+    if offset > start:
+        stream.read(offset - start)
+    return stream
+
+
+def logName(path: str) -> str:
+    """Returns a log's file name without .txt / .txt.gz (e.g. its MM-dd-yy date)."""
+    name = os.path.basename(path)
+    for suffix in LOG_SUFFIXES[::-1]:
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return os.path.splitext(name)[0]
@@ -0,0 +1,280 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Buffered log writer that writes files from a background thread.
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+
+from .instrument import PROFILER, WRITE
+from .logfiles import GZ_SUFFIX, compressLog
+
+FLUSH_LINES = 256  # lines buffered before a forced flush
+FLUSH_INTERVAL = 0.5  # seconds between time-based flushes
+DATE_FORMAT = "%m-%d-%y"  # {DATE} in rotating paths, same as the GUI's MM-dd-yy
+
+_STOP = object()
+_FLUSH = object()
+_SYNC = object()  # write out and fsync everything queued before it
+
+
+# FUNCTIONS ----------------------------------------------------------------------|
+def wallMs() -> int:
+    """Returns the wall time now in ms since the epoch."""
+    return time.time_ns() // 1_000_000
+
+
+def localDay(stamp: int) -> tuple[str, int]:
+    """Returns the local date of a wall time and the ms its day ends at.
+
+    Args:
+        stamp(int): ms since the epoch
+
+    Returns:
+        tuple[str, int]: the date in DATE_FORMAT, ms since the epoch at the next midnight
+    """
+    clock = time.localtime(stamp // 1000)
+    midnight = time.mktime((clock.tm_year, clock.tm_mon, clock.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+    return time.strftime(DATE_FORMAT, clock), int(midnight) * 1000
+
+
+# CLASSES ------------------------------------------------------------------------|
+class LogWriter:
+    """Keeps a log file open and writes batches of lines from a background thread.
+
+    Callers only enqueue, so a slow disk never stalls the caller's thread.
+    Lines are written in the order they were queued. Lines queued as durable
+    are written out and fsynced as soon as the thread reaches them; the rest
+    are batched.
+
+    A path containing "{DATE}" rotates: when a line is stamped on a later
+    day than the file's, or the file passes maxBytes (continuing in
+    <name>.1.txt, <name>.2.txt, ...), the file is closed, optionally
+    compressed in the background, and writing continues in the new file
+    after `header`. Lines are stamped when queued (or by the caller), so a
+    line buffered before midnight still goes to that day's file.
+    The first file is opened by the constructor, which raises OSError if it
+    cannot be; errors in the thread are reported on stderr.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flushLines: int = FLUSH_LINES,
+        flushInterval: float = FLUSH_INTERVAL,
+        binary: bool = False,
+        maxBytes: int = 0,
+        compress: bool = False,
+        header: str | bytes | None = None,
+    ) -> None:
+        """Creates new log writer and starts its thread.
+
+        Args:
+            path(str): the file to append to, "{DATE}" is replaced by the date
+            flushLines(int): number of buffered lines that triggers a write
+            flushInterval(float): max seconds a line may wait in the buffer
+            binary(bool): write raw bytes records instead of text lines
+            maxBytes(int): size that starts a new file, 0 for no limit
+            compress(bool): compress files closed by rotation (see compressLog)
+            header(str | bytes | None): line written at the top of each rotated
+                file; in binary mode, record written at the top of each new file
+
+        Raises:
+            OSError: if the file cannot be opened
+        """
+        self.template = path
+        self.rotating = "{DATE}" in path
+        self.binary = binary
+        self.flushLines = flushLines
+        self.flushInterval = flushInterval
+        self.maxBytes = maxBytes if self.rotating else 0
+        self.compress = compress
+        self.header = header
+        self.date, self.dayEnd = localDay(wallMs())
+        self.path = self.pathFor(self.date)
+        self.logFile = None
+        self.openFile(rotated=False)
+        self.queue = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self.run, name=f"LogWriter({path})", daemon=True)
+        self.thread.start()
+
+    def write(self, line: str | bytes, durable: bool = False, stamp: int | None = None) -> None:
+        """Queues a single line (newline is added in text mode).
+
+        Args:
+            line(str | bytes): the line to log, or a record in binary mode
+            durable(bool): fsync the file as soon as the line is written
+            stamp(int | None): wall ms the line is dated by, now if None
+        """
+        self.queue.put((wallMs() if stamp is None else stamp, line))
+        if durable:
+            self.queue.put(_SYNC)
+
+    def writeLines(self, lines: list[str], stamps: list[int] | None = None) -> None:
+        """Queues several lines at once.
+
+        Args:
+            lines(list[str]): the lines to log
+            stamps(list[int] | None): wall ms of each line, now for all if None
+        """
+        if stamps is None:
+            stamps = [wallMs()] * len(lines)
+        for item in zip(stamps, lines):
+            self.queue.put(item)
+
+    def flush(self) -> None:
+        """Requests that buffered lines be written out now."""
+        self.queue.put(_FLUSH)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Writes out remaining lines, closes the file and stops the thread.
+
+        Args:
+            timeout(float): max seconds to wait for the thread to finish
+        """
+        if self.thread.is_alive():
+            self.queue.put(_STOP)
+            self.thread.join(timeout)
+
+    def pathFor(self, date: str) -> str:
+        """Returns the first file for a date that is not compressed or full.
+
+        Args:
+            date(str): the date in DATE_FORMAT
+        """
+        path = self.template.format(DATE=date) if self.rotating else self.template
+        stem, ext = os.path.splitext(path)
+        part = 0
+        candidate = path
+        while os.path.exists(candidate + GZ_SUFFIX) or (
+            self.maxBytes and os.path.exists(candidate) and os.path.getsize(candidate) >= self.maxBytes
+        ):
+            part += 1
+            candidate = f"{stem}.{part}{ext}"
+        return candidate
+
+    def run(self) -> None:
+        """Writer thread loop: collects lines and writes them in batches."""
+        buffer = []
+        lastFlush = time.monotonic()
+        try:
+            while True:
+                timeout = max(0.0, self.flushInterval - (time.monotonic() - lastFlush))
+                try:
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = _FLUSH
+
+                if item is _STOP:
+                    self.writeBuffer(buffer)
+                    return
+                if item is _SYNC:
+                    self.writeBuffer(buffer)
+                    self.sync()
+                    buffer = []
+                    lastFlush = time.monotonic()
+                    continue
+                if item is not _FLUSH:
+                    stamp, line = item
+                    if self.rotating and stamp >= self.dayEnd:
+                        # the line is the first of a new day: finish the old day's file
+                        self.writeBuffer(buffer)
+                        buffer = []
+                        self.rotate(*localDay(stamp))
+                    buffer.append(line)
+                    if (
+                        len(buffer) < self.flushLines
+                        and time.monotonic() - lastFlush < self.flushInterval
+                    ):
+                        continue
+                elif not buffer:
+                    lastFlush = time.monotonic()
+                    continue
+
+                self.writeBuffer(buffer)
+                buffer = []
+                lastFlush = time.monotonic()
+        finally:
+            self.logFile.close()
+
+    def report(self, error: OSError) -> None:
+        """Reports an error in the writer thread on stderr.
+
+        Args:
+            error(OSError): the error
+        """
+        print(f"LogWriter({self.path}): {error}", file=sys.stderr)
+
+    def openFile(self, rotated: bool) -> None:
+        """Opens self.path for appending, writing the header where due.
+
+        Args:
+            rotated(bool): True if the file continues a rotated one
+        """
+        self.logFile = open(self.path, "ab" if self.binary else "a")
+        if self.header is None:
+            return
+        if self.binary:
+            if self.logFile.tell() == 0:
+                self.logFile.write(self.header)
+        elif rotated:
+            self.logFile.write(self.header + "\n")
+
+    def writeBuffer(self, buffer: list[str | bytes]) -> None:
+        """Writes buffered lines to the open file, rotating after if full.
+
+        Args:
+            buffer(list[str | bytes]): lines or records to write
+        """
+        if not buffer:
+            return
+        start = time.perf_counter_ns() if PROFILER.enabled else 0
+        try:
+            if self.binary:
+                self.logFile.write(b"".join(buffer))
+            else:
+                self.logFile.write("\n".join(buffer) + "\n")
+            self.logFile.flush()
+        except OSError as error:
+            self.report(error)
+            return
+        if start:
+            PROFILER.record(WRITE, start)
+        if self.maxBytes and self.logFile.tell() >= self.maxBytes:
+            self.rotate(self.date, self.dayEnd)
+
+    def sync(self) -> None:
+        """Forces written lines to disk."""
+        try:
+            os.fsync(self.logFile.fileno())
+        except OSError as error:
+            self.report(error)
+
+    def rotate(self, date: str, dayEnd: int) -> None:
+        """Continues in the next file for a date, closing (and compressing) the current one.
+
+        If the next file cannot be opened, writing continues in the current one.
+
+        Args:
+            date(str): the date in DATE_FORMAT
+            dayEnd(int): wall ms the date ends at
+        """
+        self.dayEnd = dayEnd
+        old, oldPath = self.logFile, self.path
+        try:
+            self.path = self.pathFor(date)
+            self.openFile(rotated=True)
+        except OSError as error:
+            self.logFile, self.path = old, oldPath
+            self.report(error)
+            return
+        self.date = date
+        old.close()
+        if self.compress:
+            threading.Thread(
+                target=compressLog, args=(oldPath,), name=f"compress({oldPath})", daemon=True
+            ).start()
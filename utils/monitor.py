@@ -0,0 +1,129 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Bounded serial monitor widget with batched appends, pause and search.
+"""
+
+from collections import deque
+
+import numpy as np
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QFrame, QGridLayout, QLineEdit, QPlainTextEdit, QPushButton, QWidget
+
+from .render import RenderScheduler
+from .ringbuffer import RingBuffer
+
+MONITOR_RATE = 10  # view updates per second
+PAUSE = "Pause"
+RESUME = "Resume"
+
+
+# CLASSES ------------------------------------------------------------------------|
+class SerialMonitor(QWidget):
+    """Read-only monitor that costs constant memory however long it runs.
+
+    Lines are kept in a fixed-capacity ring buffer (the searchable history)
+    and shown in a QPlainTextEdit limited to `lines` blocks, which lays out
+    only what is visible. Appends are collected and written to the view
+    once per MONITOR_RATE tick. Pausing, or typing in the search field,
+    freezes the view while the history keeps recording.
+    """
+
+    def __init__(
+        self, style: str, buttonStyle: str, lines: int, history: int, parent=None
+    ) -> None:
+        """Creates new serial monitor.
+
+        Args:
+            style(str): style sheet for the view and search field
+            buttonStyle(str): style sheet for the pause button
+            lines(int): max lines shown in the view
+            history(int): max lines kept for search and resume
+            parent(QWidget): optional parent
+        """
+        super().__init__(parent)
+        self.lines = lines
+        self.history = RingBuffer(history, dtype=object)
+        self.pending = deque(maxlen=lines)  # appended since the last view update
+        self.paused = False
+        self.renderer = RenderScheduler(self.flush, MONITOR_RATE)
+
+        self.view = QPlainTextEdit()
+        self.view.setReadOnly(True)
+        self.view.setMaximumBlockCount(lines)
+        self.view.setFrameStyle(QFrame.Shape.NoFrame)
+        self.view.setStyleSheet(style)
+
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Search")
+        self.search.setStyleSheet(style)
+        self.search.textChanged.connect(self.filter)
+
+        self.pauseButton = QPushButton(PAUSE)
+        self.pauseButton.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.pauseButton.setStyleSheet(buttonStyle)
+        self.pauseButton.clicked.connect(self.togglePause)
+
+        layout = QGridLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.search, 0, 0)
+        layout.addWidget(self.pauseButton, 0, 1)
+        layout.addWidget(self.view, 1, 0, 1, 2)
+
+    def append(self, line: str) -> None:
+        """Adds a line, shown on the next tick unless paused.
+
+        Args:
+            line(str): the line to add
+        """
+        self.history.append(line)
+        self.pending.append(line)
+        if not self.paused:
+            self.renderer.request()
+
+    def flush(self) -> None:
+        """Writes pending lines to the view in one append and scrolls to the end."""
+        if self.paused or not self.pending:
+            return
+        self.view.appendPlainText("\n".join(self.pending))
+        self.pending.clear()
+        scrollBar = self.view.verticalScrollBar()
+        scrollBar.setValue(scrollBar.maximum())
+
+    def showLines(self, lines: np.ndarray) -> None:
+        """Replaces the view with the newest of the given lines."""
+        self.view.setPlainText("\n".join(lines[-self.lines:]))
+        scrollBar = self.view.verticalScrollBar()
+        scrollBar.setValue(scrollBar.maximum())
+
+    def setPaused(self, paused: bool) -> None:
+        """Freezes or resumes the view; resuming shows the latest history.
+
+        Args:
+            paused(bool): True to freeze
+        """
+        self.paused = paused
+        self.pauseButton.setText(RESUME if paused else PAUSE)
+        if not paused:
+            self.pending.clear()
+            self.showLines(self.history.view())
+
+    def togglePause(self) -> None:
+        """Pauses or resumes, clearing any search when resuming."""
+        if self.paused and self.search.text():
+            self.search.clear()  # resumes through filter
+            return
+        self.setPaused(not self.paused)
+
+    def filter(self, text: str) -> None:
+        """Shows the history lines containing text (case-insensitive), paused.
+
+        Args:
+            text(str): the search text, empty to resume
+        """
+        if not text:
+            self.setPaused(False)
+            return
+        self.setPaused(True)
+        query = text.lower()
+        self.showLines([line for line in self.history.view() if query in line.lower()])
@@ -0,0 +1,186 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Vectorized parser for pressure and valve-state telemetry frames.
+"""
+
+import re
+import warnings
+
+import numpy as np
+
+PRESSURE_FRAME = 0
+VALVE_FRAME = 1
+MISSING = np.iinfo(np.int32).min  # value for channels absent from a frame
+
+
+# CLASSES ------------------------------------------------------------------------|
+class FrameParser:
+    """Turns telemetry lines into (kind, int array) frames.
+
+    Channel names and channel numbers for every frame position are computed
+    once, so a frame is converted in one NumPy call whatever its width, and
+    a whole batch of frames of the same kind in one call as well.
+    """
+
+    def __init__(
+        self,
+        analogMap: list[int],
+        pinReadMap: dict[str, str],
+        ptTag: str = "PT",
+        svTag: str = "SV",
+        pressureSep: str = ", ",
+        valveTag: str = "PS",
+    ) -> None:
+        """Creates new frame parser.
+
+        Args:
+            analogMap(list[int]): PT number of each pressure frame position
+            pinReadMap(dict[str, str]): SV number of each valve frame position (1 based)
+            ptTag(str): PT name prefix
+            svTag(str): SV name prefix
+            pressureSep(str): separator between pressure readings
+            valveTag(str): tag marking a valve-state frame
+        """
+        self.pressureSep = pressureSep
+        self.sep = pressureSep.strip() or pressureSep
+        sep = re.escape(self.sep)
+        self.emptyField = re.compile(rf"(?:^|{sep})\s*(?:{sep}|$)")  # e.g. a trailing ","
+        self.valveTag = valveTag
+
+        svNumbers = [int(pinReadMap[str(i + 1)]) for i in range(len(pinReadMap))]
+        self.valveWidth = len(svNumbers)
+
+        # frame position -> label name / 0 based channel number
+        self.names = {
+            PRESSURE_FRAME: [f"{ptTag}{n}" for n in analogMap],
+            VALVE_FRAME: [f"{svTag}{n}" for n in svNumbers],
+        }
+        self.channels = {
+            PRESSURE_FRAME: np.array(analogMap, dtype=np.intp) - 1,
+            VALVE_FRAME: np.array(svNumbers, dtype=np.intp) - 1,
+        }
+
+    def parse(self, line: str) -> tuple[int, np.ndarray] | None:
+        """Parses a single line.
+
+        Args:
+            line(str): the incoming line
+
+        Returns:
+            tuple[int, np.ndarray] | None: frame kind and values, or None if not a frame
+        """
+        frames = self.parseBatch([line])
+        return frames[0] if frames else None
+
+    def parseBatch(self, lines: list[str]) -> list[tuple[int, np.ndarray]]:
+        """Parses a batch of lines, keeping frame order.
+
+        Pressure values that are not integers are returned as MISSING; lines
+        that are not frames are dropped.
+
+        Args:
+            lines(list[str]): the incoming lines
+
+        Returns:
+            list[tuple[int, np.ndarray]]: frame kind and values per frame
+        """
+        return [frame for _, frame in self.parseIndexed(lines)]
+
+    def parseIndexed(self, lines: list[str]) -> list[tuple[int, tuple[int, np.ndarray]]]:
+        """Like parseBatch, but also returns each frame's position in lines.
+
+        Args:
+            lines(list[str]): the incoming lines
+
+        Returns:
+            list[tuple[int, tuple]]: line position and (kind, values) per frame
+        """
+        pressure = []  # (position, line)
+        valves = []
+        for position, line in enumerate(lines):
+            if self.valveTag in line:
+                valves.append((position, line.strip().strip(self.valveTag)))
+            elif self.pressureSep in line:
+                pressure.append((position, line))
+
+        frames = []
+        if pressure:
+            frames += zip(
+                (p for p, _ in pressure),
+                ((PRESSURE_FRAME, values) for values in self.parsePressure([l for _, l in pressure])),
+            )
+        if valves:
+            frames += zip(
+                (p for p, _ in valves),
+                ((VALVE_FRAME, values) for values in self.parseValves([l for _, l in valves])),
+            )
+        if pressure and valves:
+            frames.sort(key=lambda frame: frame[0])
+        return frames
+
+    def parsePressure(self, lines: list[str]) -> list[np.ndarray]:
+        """Converts pressure lines to int arrays in one bulk conversion.
+
+        np.fromstring reads an empty field as 0, so batches with one (e.g.
+        a trailing separator) go through parsePressureLine instead.
+
+        Args:
+            lines(list[str]): pressure frame lines
+
+        Returns:
+            list[np.ndarray]: one array per line, at most len(analogMap) long
+        """
+        width = len(self.names[PRESSURE_FRAME])
+        counts = [line.count(self.sep) + 1 for line in lines]
+        text = self.sep.join(lines)
+        values = None
+        if not self.emptyField.search(text):
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error", DeprecationWarning)
+                    values = np.fromstring(text, dtype=np.int64, sep=self.sep)
+            except (ValueError, DeprecationWarning):
+                pass
+
+        if values is None or len(values) != sum(counts):
+            return [self.parsePressureLine(line)[:width] for line in lines]
+        if len(set(counts)) == 1:
+            return list(values.reshape(len(lines), counts[0])[:, :width])
+        return [row[:width] for row in np.split(values, np.cumsum(counts)[:-1])]
+
+    def parsePressureLine(self, line: str) -> np.ndarray:
+        """Slow path for a malformed pressure line: bad values become MISSING.
+
+        Args:
+            line(str): pressure frame line
+
+        Returns:
+            np.ndarray: the line's values
+        """
+        values = []
+        for value in line.split(self.sep):
+            try:
+                values.append(int(value))
+            except ValueError:
+                values.append(MISSING)
+        return np.array(values, dtype=np.int64)
+
+    def parseValves(self, states: list[str]) -> list[np.ndarray]:
+        """Converts valve-state digit strings to int arrays in one step.
+
+        Args:
+            states(list[str]): valve-state digits with the tag removed
+
+        Returns:
+            list[np.ndarray]: one array of valveWidth states per frame
+        """
+        width = self.valveWidth
+        states = [state[:width] for state in states]
+        if all(len(state) == width and state.isascii() and state.isdigit() for state in states):
+            digits = np.frombuffer("".join(states).encode("ascii"), dtype=np.uint8)
+            return list((digits.astype(np.int64) - ord("0")).reshape(len(states), width))
+        return [
+            np.array([int(c) if c.isdigit() else MISSING for c in state], dtype=np.int64)
+            for state in states
+        ]
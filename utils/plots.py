@@ -0,0 +1,152 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Configurable grid of pressure plots sharing one sample history.
+"""
+
+from typing import Callable
+
+import numpy as np
+from pyqtgraph import PlotWidget, mkPen
+
+from .parser import MISSING
+from .pyramid import MinMaxPyramid
+
+# views
+FOLLOW = "follow"  # latest `window` seconds (default, double click)
+FULL = "full"  # whole history (double click while following)
+MANUAL = "manual"  # wherever the user panned/zoomed with the mouse
+
+
+# CLASSES ------------------------------------------------------------------------|
+class Plot:
+    """One plot widget and the curves drawn on it."""
+
+    def __init__(self, widget: PlotWidget, channels: list[str], columns: list[int]) -> None:
+        """Creates new plot record.
+
+        Args:
+            widget(PlotWidget): the plot widget
+            channels(list[str]): channels overlaid on the plot
+            columns(list[int]): each channel's column in the shared history
+        """
+        self.widget = widget
+        self.channels = channels
+        self.columns = columns
+        self.curves = []
+        self.view = FOLLOW
+
+
+class PlotManager:
+    """Builds plots from a {title: [channels]} config and redraws them together.
+
+    Every plotted channel is a column of one MinMaxPyramid, so a frame is
+    one append with one timestamp however many channels are plotted, and
+    a redraw queries the history once per distinct visible range.
+    """
+
+    def __init__(
+        self,
+        config: dict[str, list[str]],
+        names: list[str],
+        pens: list,
+        background: str,
+        yRange: tuple[float, float],
+        window: float,
+        maxPoints: int,
+        request: Callable[[], None],
+    ) -> None:
+        """Creates new plot manager and its widgets.
+
+        Args:
+            config(dict): plot title to the channels drawn on it
+            names(list[str]): channel name of each pressure frame position
+            pens(list): curve colors, in overlay order
+            background(str): plot background color
+            yRange(tuple): initial PSI range
+            window(float): seconds shown while following
+            maxPoints(int): points drawn per curve per redraw
+            request(Callable): asks for a redraw on the next render tick
+        """
+        self.channels = list(dict.fromkeys(name for plotted in config.values() for name in plotted))
+        self.positions = np.array([names.index(name) for name in self.channels])
+        self.width = self.positions.max() + 1
+        self.samples = MinMaxPyramid(len(self.channels))
+        self.window = window
+        self.maxPoints = maxPoints
+        self.request = request
+
+        self.plots = {}
+        for title, channels in config.items():
+            widget = PlotWidget()
+            widget.setBackground(background)
+            widget.setYRange(*yRange)
+            widget.setMouseEnabled(x=True, y=False)
+            widget.hideButtons()
+            if len(channels) > 1:
+                widget.addLegend()
+            plot = Plot(widget, channels, [self.channels.index(name) for name in channels])
+            for index, name in enumerate(channels):
+                pen = mkPen(color=pens[index % len(pens)], width=3)
+                plot.curves.append(widget.plot([], [], pen=pen, name=name, connect="finite"))
+            widget.getViewBox().sigRangeChangedManually.connect(
+                lambda _, title=title: self.setView(title, MANUAL)
+            )
+            widget.scene().sigMouseClicked.connect(
+                lambda event, title=title: self.clicked(title, event)
+            )
+            self.plots[title] = plot
+
+    def add(self, seconds: float, values: np.ndarray) -> None:
+        """Adds the plotted channels of a pressure frame.
+
+        Args:
+            seconds(float): when the frame was read
+            values(np.ndarray): readings in frame position order
+        """
+        if len(values) < self.width:
+            values = np.pad(values, (0, self.width - len(values)), constant_values=MISSING)
+        row = values[self.positions].astype(np.float32)
+        row[values[self.positions] == MISSING] = np.nan
+        self.samples.append(seconds, row)
+        self.request()
+
+    def setView(self, title: str, view: str) -> None:
+        """Switches a plot between FOLLOW, FULL and MANUAL views.
+
+        Args:
+            title(str): the plot
+            view(str): the new view
+        """
+        self.plots[title].view = view
+        self.request()
+
+    def clicked(self, title: str, event) -> None:
+        """Double click toggles a plot between following and full history."""
+        if event.double():
+            self.setView(title, FULL if self.plots[title].view == FOLLOW else FOLLOW)
+
+    def visibleRange(self, plot: Plot) -> tuple[float, float]:
+        """Returns the time range a plot should show."""
+        first, last = self.samples.extent()
+        if plot.view == FOLLOW:
+            return max(first, last - self.window), last
+        if plot.view == FULL:
+            return first, last
+        low, high = plot.widget.viewRange()[0]
+        return low, high
+
+    def render(self) -> None:
+        """Redraws every plot, querying the history once per visible range."""
+        if not len(self.samples):
+            return
+        queries = {}
+        for plot in self.plots.values():
+            low, high = self.visibleRange(plot)
+            if (low, high) not in queries:
+                queries[low, high] = self.samples.query(low, high, self.maxPoints, None)
+            times, values = queries[low, high]
+            for curve, column in zip(plot.curves, plot.columns):
+                curve.setData(times, values[:, column])
+            if plot.view != MANUAL:
+                plot.widget.setXRange(low, high, padding=0)
@@ -0,0 +1,224 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Min/max decimation pyramid for drawing long time series at constant cost.
+"""
+
+import numpy as np
+
+FACTOR = 4  # level k bucket = FACTOR level k - 1 buckets
+INITIAL_SIZE = 1024
+MAX_BUCKETS = 1 << 22  # per level, ~14 min of raw samples at 5 kHz, ~16 h at level 3
+
+
+# CLASSES ------------------------------------------------------------------------|
+class _Level:
+    """Growable (time, min, max) arrays for one pyramid level.
+
+    Holds at most maxBuckets buckets: when full, the oldest half is dropped.
+    Buckets keep their absolute index (dropped + position in the arrays), so
+    the levels above stay aligned with the ones that lost history.
+    """
+
+    def __init__(self, channels: int, raw: bool, maxBuckets: int) -> None:
+        self.raw = raw  # level 0 keeps samples, min and max are the same array
+        self.maxBuckets = maxBuckets
+        self.count = 0  # buckets held
+        self.dropped = 0  # buckets dropped from the front
+        size = min(INITIAL_SIZE, maxBuckets)
+        self.time = np.empty(size)
+        self.low = np.empty((size, channels), dtype=np.float32)
+        self.high = self.low if raw else np.empty_like(self.low)
+
+    @property
+    def total(self) -> int:
+        """Buckets ever pushed, including dropped ones."""
+        return self.dropped + self.count
+
+    def push(self, time: float, low, high) -> None:
+        if self.count == len(self.time):
+            if self.count >= self.maxBuckets:
+                self.trim(self.maxBuckets // 2)
+            else:
+                size = min(2 * self.count, self.maxBuckets)
+                self.time = np.resize(self.time, size)
+                self.low = np.resize(self.low, (size, self.low.shape[1]))
+                self.high = self.low if self.raw else np.resize(self.high, self.low.shape)
+        self.time[self.count] = time
+        self.low[self.count] = low
+        if not self.raw:
+            self.high[self.count] = high
+        self.count += 1
+
+    def trim(self, keep: int) -> None:
+        """Drops all but the newest keep buckets."""
+        drop = self.count - keep
+        self.time[:keep] = self.time[drop:self.count]
+        self.low[:keep] = self.low[drop:self.count]
+        if not self.raw:
+            self.high[:keep] = self.high[drop:self.count]
+        self.dropped += drop
+        self.count = keep
+
+    def find(self, time: float, side: str) -> int:
+        """Returns the absolute index np.searchsorted would give for time."""
+        return self.dropped + int(np.searchsorted(self.time[:self.count], time, side))
+
+
+class MinMaxPyramid:
+    """Time series of one or more channels with incrementally built min/max levels.
+
+    Level 0 holds every sample. Each bucket of level k holds the start time,
+    minimum and maximum (ignoring NaN gaps) of FACTOR consecutive level k - 1
+    buckets, and is added as soon as those are complete, so appending is
+    amortised O(1).
+    Every level keeps at most maxBuckets buckets, dropping its oldest half
+    when full, so memory is bounded: old history stays drawable from the
+    coarser levels, at their resolution, long after its samples are gone.
+    A query picks the finest level that fits the visible range in the point
+    budget, and draws the range as whole buckets of that level plus finer
+    buckets at both ends, so its cost depends on the budget and not on
+    history, and the drawn envelope is exactly the samples' min and max.
+    """
+
+    def __init__(self, channels: int = 1, factor: int = FACTOR, maxBuckets: int = MAX_BUCKETS) -> None:
+        """Creates new empty pyramid.
+
+        Args:
+            channels(int): values per sample
+            factor(int): buckets merged into one at each level
+            maxBuckets(int): buckets kept per level, a multiple of 2 * factor
+        """
+        if maxBuckets % (2 * factor):
+            raise ValueError(f"maxBuckets must be a multiple of {2 * factor}")
+        self.channels = channels
+        self.factor = factor
+        self.maxBuckets = maxBuckets
+        self.levels = [_Level(channels, True, maxBuckets)]
+
+    def __len__(self) -> int:
+        return self.levels[0].total
+
+    def append(self, time: float, values) -> None:
+        """Adds a sample, completing coarser buckets where due.
+
+        Args:
+            time(float): sample time, not earlier than the previous one
+            values: the reading, or one per channel
+        """
+        self.levels[0].push(time, values, values)
+        factor = self.factor
+        level = 0
+        while self.levels[level].total % factor == 0:
+            finer = self.levels[level]
+            start = finer.count - factor
+            if level + 1 == len(self.levels):
+                self.levels.append(_Level(self.channels, False, self.maxBuckets))
+            self.levels[level + 1].push(
+                finer.time[start],
+                np.fmin.reduce(finer.low[start:finer.count], axis=0),
+                np.fmax.reduce(finer.high[start:finer.count], axis=0),
+            )
+            level += 1
+
+    def extent(self) -> tuple[float, float]:
+        """Returns the first and last sample times still held."""
+        raw = self.levels[0]
+        if not raw.count:
+            return 0.0, 0.0
+        first = min(float(level.time[0]) for level in self.levels if level.count)
+        return first, float(raw.time[raw.count - 1])
+
+    def clear(self) -> None:
+        """Drops all samples."""
+        self.levels = [_Level(self.channels, True, self.maxBuckets)]
+
+    def pickLevel(self, start: float, end: float, maxPoints: int) -> int:
+        """Returns the finest level drawing [start, end] in at most maxPoints points.
+
+        Levels that dropped part of the range are skipped unless none holds it all.
+        """
+        for index, level in enumerate(self.levels):
+            if level.dropped and level.count and level.time[0] > start:
+                continue
+            buckets = level.find(end, "right") - level.find(start, "left")
+            if buckets * (1 if level.raw else 2) <= maxPoints:
+                return index
+        return len(self.levels) - 1
+
+    def spans(self, start: float, end: float, top: int) -> list[tuple[int, int, int]]:
+        """Splits the samples in [start, end] into runs of whole buckets.
+
+        Goes up from level 0, keeping the partial buckets at both ends on the
+        finer level, until level top or until no whole bucket is left.
+
+        Returns:
+            list[tuple[int, int, int]]: (level, first, end) absolute bucket
+            ranges in time order
+        """
+        factor = self.factor
+        raw = self.levels[0]
+        first, last = raw.find(start, "left"), raw.find(end, "right")
+        left, right = [], []
+        level = 0
+        while level < top:
+            finer, coarser = self.levels[level], self.levels[level + 1]
+            up = -(-first // factor)
+            if first == finer.dropped and finer.dropped:
+                # the range starts before this level's history, use the coarser one's
+                up = min(up, coarser.find(start, "left"))
+            down = min(last // factor, coarser.total)
+            if up >= down:
+                break
+            left.append((level, first, max(first, up * factor)))
+            right.append((level, down * factor, last))
+            first, last = up, down
+            level += 1
+        return left + [(level, first, last)] + right[::-1]
+
+    def query(self, start: float, end: float, maxPoints: int, channel: int | None = 0):
+        """Returns plottable points covering [start, end].
+
+        Min/max buckets become two points at the bucket's start time (min,
+        then max), which draws the envelope of the samples they stand for.
+        The samples just outside the range are included so lines reach the
+        edges.
+
+        Args:
+            start(float): first time wanted
+            end(float): last time wanted
+            maxPoints(int): point budget for the coarse part of the range
+            channel(int | None): the channel to return, None for all
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: times and values (values are
+            (points, channels) when channel is None)
+        """
+        spans = self.spans(start, end, self.pickLevel(start, end, maxPoints))
+        raw = self.levels[0]
+        first, last = spans[0][1], spans[-1][2]
+        spans = [(0, first - 1, first)] + spans + [(0, last, last + 1)]
+
+        times, values = [], []
+        for index, first, last in spans:
+            level = self.levels[index]
+            lo = max(0, first - level.dropped)
+            hi = min(level.count, last - level.dropped)
+            if lo >= hi:
+                continue
+            stamps = level.time[lo:hi]
+            low = level.low[lo:hi] if channel is None else level.low[lo:hi, channel]
+            if level is raw:
+                times.append(stamps)
+                values.append(low)
+                continue
+            high = level.high[lo:hi] if channel is None else level.high[lo:hi, channel]
+            times.append(np.repeat(stamps, 2))
+            pairs = np.empty((2 * len(low),) + low.shape[1:], dtype=low.dtype)
+            pairs[0::2] = low
+            pairs[1::2] = high
+            values.append(pairs)
+        if not times:
+            shape = (0,) if channel is not None else (0, self.channels)
+            return np.empty(0), np.empty(shape, dtype=np.float32)
+        return np.concatenate(times), np.concatenate(values)
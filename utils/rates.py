@@ -0,0 +1,71 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Incremental least-squares rate of change over a sliding time window.
+"""
+
+from collections import deque
+
+NS_PER_MIN = 60_000_000_000
+
+
+# CLASSES ------------------------------------------------------------------------|
+class RateEstimator:
+    """Least-squares slope of (stamp, value) samples over the last `window` seconds.
+
+    Keeps running sums of t, y, t*t and t*y for the samples in the window,
+    so adding a sample (and dropping the ones that age out) is O(1). Stamps
+    and values are integers measured from the first sample, so the sums are
+    exact and never drift.
+    """
+
+    def __init__(self, window: float) -> None:
+        """Creates new empty estimator.
+
+        Args:
+            window(float): window length in seconds
+        """
+        self.window = int(window * 1e9)
+        self.samples = deque()
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def clear(self) -> None:
+        """Drops all samples."""
+        self.samples.clear()
+        self.origin = None
+        self.sumT = self.sumY = self.sumTT = self.sumTY = 0
+
+    def add(self, stamp: int, value: int) -> None:
+        """Adds a sample and drops samples older than the window.
+
+        Args:
+            stamp(int): monotonic ns
+            value(int): the reading
+        """
+        if self.origin is None:
+            self.origin = stamp
+        t = stamp - self.origin
+        self.samples.append((t, value))
+        self.sumT += t
+        self.sumY += value
+        self.sumTT += t * t
+        self.sumTY += t * value
+
+        oldest = t - self.window
+        while self.samples[0][0] < oldest:
+            t, value = self.samples.popleft()
+            self.sumT -= t
+            self.sumY -= value
+            self.sumTT -= t * t
+            self.sumTY -= t * value
+
+    def rate(self) -> float | None:
+        """Returns the slope in units per minute, or None without enough spread in time."""
+        n = len(self.samples)
+        spread = n * self.sumTT - self.sumT * self.sumT
+        if n < 2 or spread <= 0:
+            return None
+        return (n * self.sumTY - self.sumT * self.sumY) * NS_PER_MIN / spread
@@ -0,0 +1,45 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Fixed-rate repaint scheduler for use with PyQt6 applications.
+"""
+
+from typing import Callable
+
+from PyQt6.QtCore import QTimer
+
+
+class RenderScheduler:
+    """Collects repaint requests and services them on a fixed-rate QTimer.
+
+    Any number of requests between two ticks result in a single repaint, so
+    redraw cost follows the frame rate, not the data rate.
+    """
+
+    def __init__(self, render: Callable[[], None], rate: float) -> None:
+        """Creates new render scheduler and starts its timer.
+
+        Args:
+            render(Callable): repaints, called at most once per tick
+            rate(float): repaints per second
+        """
+        self.render = render
+        self.pending = False
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.renderPending)
+        self.timer.start(max(1, round(1000 / rate)))
+
+    def request(self) -> None:
+        """Asks for a repaint on the next tick."""
+        self.pending = True
+
+    def renderPending(self) -> None:
+        """Repaints if anything was requested since the last tick."""
+        if not self.pending:
+            return
+        self.pending = False
+        self.render()
+
+    def stop(self) -> None:
+        """Stops the repaint timer."""
+        self.timer.stop()
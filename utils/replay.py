@@ -0,0 +1,126 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Replays a recorded data log through the serial pipeline.
+"""
+
+import threading
+import time
+
+from .dedup import expandLines
+from .logfiles import SESSION_TAG, STAMP_LEN, openLog, parseStamp
+
+READ_TIMEOUT = 0.05  # same as SerialComm's port timeout
+MAX_BATCH = 512  # lines returned per read when running behind
+MAX_GAP = 5.0  # longer pauses in the recording are shortened to this (s)
+
+
+# CLASSES ------------------------------------------------------------------------|
+class ReplayComm:
+    """Stand-in for SerialComm that reads lines from a log/data file.
+
+    Lines are released on their recorded timestamps divided by a speed
+    factor, and stamped with the monotonic time they were due; speed 0
+    releases them as fast as they are read, stamped as they are taken.
+    Commands sent during a replay are kept in `sent` instead of being
+    written anywhere.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0) -> None:
+        """Creates new replay source.
+
+        Args:
+            path(str): the data log to replay, plain or .txt.gz
+            speed(float): playback speed factor, 0 for as fast as possible
+        """
+        self.port = path
+        self.speed = speed
+        self.logFile = openLog(path)
+        self.lines = expandLines(self.logFile)
+        self.wake = threading.Event()
+        self.sent = []
+        self.next = None  # (stamp ms, payload) read ahead
+        self.origin = None  # (stamp ms, monotonic s) the schedule is anchored to
+        self.lastStamp = 0  # monotonic ns of the last line returned
+        self.finished = False
+
+    def readLines(self) -> list[tuple[int, str]]:
+        """Returns the lines that are due, waiting up to READ_TIMEOUT for the next.
+
+        Returns:
+            list[tuple[int, str]]: (monotonic ns, line without its log stamp)
+            per due line, possibly empty
+        """
+        lines = []
+        while len(lines) < MAX_BATCH:
+            if self.next is None:
+                self.next = self.readNext()
+                if self.next is None:
+                    self.finished = True
+                    break
+            stamp, payload = self.next
+            if self.speed > 0:
+                due = self.due(stamp)
+                delay = due - time.monotonic()
+                if delay > 0:
+                    if not lines:
+                        self.wake.wait(min(delay, READ_TIMEOUT))
+                        self.wake.clear()
+                    break
+                released = int(due * 1e9)
+            else:
+                released = time.monotonic_ns()
+            self.lastStamp = max(self.lastStamp, released)
+            lines.append((self.lastStamp, payload))
+            self.next = None
+
+        if self.finished and not lines:
+            self.wake.wait(READ_TIMEOUT)  # idle like a quiet port
+            self.wake.clear()
+        return lines
+
+    def readNext(self) -> tuple[int, str] | None:
+        """Reads the next stamped line, restarting the schedule at each session.
+
+        Returns:
+            tuple[int, str] | None: stamp and payload, or None at end of file
+        """
+        for line in self.lines:
+            if line.startswith(SESSION_TAG):
+                self.origin = None
+                continue
+            stamp = parseStamp(line)
+            if stamp is None:
+                continue
+            return stamp, line[STAMP_LEN:].decode(errors="replace").rstrip("\r\n")
+        return None
+
+    def due(self, stamp: int) -> float:
+        """Returns the monotonic time a stamped line should be released.
+
+        Args:
+            stamp(int): the line's recorded stamp in ms
+        """
+        now = time.monotonic()
+        if self.origin is None:
+            self.origin = (stamp, now)
+        start, startTime = self.origin
+        due = startTime + (stamp - start) / 1000 / self.speed
+        if due - now > MAX_GAP / self.speed:
+            # skip long idle stretches by re-anchoring just ahead of now
+            self.origin = (stamp, now + MAX_GAP / self.speed)
+            due = now + MAX_GAP / self.speed
+        return due
+
+    def sendMessage(self, message: str) -> bool:
+        """Records a command sent during the replay."""
+        self.sent.append(message)
+        return True
+
+    def cancelRead(self) -> None:
+        """Wakes a read that is currently waiting."""
+        self.wake.set()
+
+    def close(self) -> None:
+        """Closes the replayed file."""
+        self.logFile.close()
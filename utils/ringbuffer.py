@@ -0,0 +1,65 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Fixed-capacity NumPy ring buffer with O(1) append and contiguous views.
+"""
+
+import numpy as np
+
+
+# CLASSES ------------------------------------------------------------------------|
+class RingBuffer:
+    """Preallocated ring buffer that always exposes its contents as one slice.
+
+    Every value is written twice, at i and i + capacity, so the newest
+    `capacity` values are always contiguous and can be viewed without copying.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64) -> None:
+        """Creates new ring buffer.
+
+        Args:
+            capacity(int): max number of values kept
+            dtype(np.dtype): element type of the buffer
+        """
+        self.capacity = capacity
+        self.buffer = np.zeros(2 * capacity, dtype=dtype)
+        self.head = 0  # next write position
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, value) -> None:
+        """Adds a value, dropping the oldest one when full.
+
+        Args:
+            value: the value to add
+        """
+        self.buffer[self.head] = value
+        self.buffer[self.head + self.capacity] = value
+        self.head += 1
+        if self.head == self.capacity:
+            self.head = 0
+        if self.count < self.capacity:
+            self.count += 1
+
+    def view(self, last: int | None = None) -> np.ndarray:
+        """Returns a read-only view of the buffered values, oldest first.
+
+        Args:
+            last(int | None): only the newest `last` values if given
+
+        Returns:
+            np.ndarray: a view into the buffer (valid until the next append)
+        """
+        count = self.count if last is None else min(last, self.count)
+        end = self.head + self.capacity
+        view = self.buffer[end - count:end]
+        view.flags.writeable = False
+        return view
+
+    def clear(self) -> None:
+        """Empties the buffer."""
+        self.head = 0
+        self.count = 0
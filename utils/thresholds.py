@@ -0,0 +1,67 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Per-channel pressure band classification.
+"""
+
+import numpy as np
+
+# bands, in order of the edges that separate them
+LOW_BAND = 0  # below the sensor's plausible range
+SAFE_BAND = 1
+MID_BAND = 2
+HIGH_BAND = 3
+
+
+# CLASSES ------------------------------------------------------------------------|
+class BandClassifier:
+    """Classifies whole frames of readings against per-channel limits at once.
+
+    Each channel has three ascending edges (low, mid, high). A reading's band
+    is the number of edges it is at or above, counted for every channel in
+    one broadcast comparison: np.digitize and np.searchsorted take a single
+    edge array, so per-channel edges would need a call per channel.
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        limits: dict[str, tuple[int, int, int]],
+        default: tuple[int, int, int],
+        styles: tuple[str, str, str, str],
+    ) -> None:
+        """Creates new band classifier.
+
+        Args:
+            names(list[str]): channel name of each frame position
+            limits(dict): channel name to (low, mid, high) edges
+            default(tuple): edges for channels without their own limits
+            styles(tuple): style sheet for each band, LOW_BAND first
+        """
+        self.names = names
+        self.edges = np.array([limits.get(name, default) for name in names], dtype=np.int64)
+        self.styleTable = styles
+
+    def classify(self, values: np.ndarray) -> np.ndarray:
+        """Returns the band of each reading in a frame.
+
+        Args:
+            values(np.ndarray): readings in frame position order
+
+        Returns:
+            np.ndarray: band index per reading
+        """
+        edges = self.edges[:len(values)]
+        return (values[:, np.newaxis] >= edges).sum(axis=1)
+
+    def styles(self, values: np.ndarray) -> list[str]:
+        """Returns the prebuilt style sheet of each reading in a frame.
+
+        Args:
+            values(np.ndarray): readings in frame position order
+
+        Returns:
+            list[str]: style sheet per reading
+        """
+        table = self.styleTable
+        return [table[band] for band in self.classify(values).tolist()]
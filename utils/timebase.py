@@ -0,0 +1,61 @@
+"""
+Author: LRP Avionics
+Date: 10/2026
+Description: Monotonic sample clock anchored to wall time once per session.
+
+Samples are stamped with time.monotonic_ns() where they are read, so the
+stamps are unaffected by queueing delay and by wall clock changes. Wall
+times (for log lines) are derived from the single anchor taken when the
+timebase is created.
+"""
+
+import time
+
+
+# CLASSES ------------------------------------------------------------------------|
+class Timebase:
+    """Maps monotonic sample stamps to wall time and elapsed seconds."""
+
+    def __init__(self) -> None:
+        """Creates new timebase, anchoring the monotonic clock to wall time now."""
+        self.mono = time.monotonic_ns()
+        self.wall = time.time_ns()
+        self.second = None  # last second formatted by logStamp, and its text
+        self.secondText = ""
+
+    @staticmethod
+    def now() -> int:
+        """Returns the current stamp in monotonic ns."""
+        return time.monotonic_ns()
+
+    def wallNs(self, stamp: int) -> int:
+        """Returns the wall time of a stamp in ns since the epoch.
+
+        Args:
+            stamp(int): monotonic ns
+        """
+        return self.wall + stamp - self.mono
+
+    def wallMs(self, stamp: int) -> int:
+        """Returns the wall time of a stamp in ms since the epoch.
+
+        Args:
+            stamp(int): monotonic ns
+        """
+        return self.wallNs(stamp) // 1_000_000
+
+    def logStamp(self, stamp: int) -> str:
+        """Returns a stamp as a local time DATE_TIME_FORMAT log prefix.
+
+        Args:
+            stamp(int): monotonic ns
+        """
+        second, millis = divmod(self.wallMs(stamp), 1000)
+        if second != self.second:
+            self.second = second
+            self.secondText = time.strftime("%m/%d/%Y | %H:%M:%S", time.localtime(second))
+        return f"{self.secondText}:{millis:03d} -> "
+
+    def anchor(self) -> str:
+        """Returns the anchor as text for the session log."""
+        return f"Clock anchor: monotonic {self.mono} ns = epoch {self.wall // 1_000_000} ms"